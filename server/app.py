@@ -1,12 +1,67 @@
-from quart import Quart, request, jsonify, send_from_directory, send_file
-from talking_bot import ScrumBot, JiraAPI, JIRA_EMAIL, JIRA_API_KEY, JIRA_BASE_URL, speak_text, recognize_speech
+from quart import Quart, request, jsonify, send_from_directory, send_file, make_response
+from talking_bot import ScrumBot, AsyncJiraAPI, JIRA_EMAIL, JIRA_API_KEY, JIRA_BASE_URL, speak_text, recognize_speech, stream_reply
 import os
 import io
+import json
+import base64
 import asyncio
+from session_store import SessionStore, new_session_id
+from conversation_state import backend_from_url
+from jira_mutations import MutationQueue
 
 app = Quart(__name__, static_folder='/app/static', static_url_path='')
-jira = JiraAPI(JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_KEY)
-scrum_bot = ScrumBot(jira)
+jira = AsyncJiraAPI(JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_KEY)
+
+# With JIRA_WRITE_BEHIND=1, Jira updates from the conversation run in the background instead of
+# being awaited inline; they are journaled to JIRA_MUTATION_JOURNAL_DIR so a restart doesn't lose them
+mutations = None
+if os.getenv("JIRA_WRITE_BEHIND", "0") == "1":
+    if not os.getenv("JIRA_MUTATION_JOURNAL_DIR"):
+        raise RuntimeError("JIRA_WRITE_BEHIND=1 requires JIRA_MUTATION_JOURNAL_DIR for the durable journal")
+    mutations = MutationQueue(
+        jira,
+        journal_dir=os.getenv("JIRA_MUTATION_JOURNAL_DIR"),
+        max_attempts=int(os.getenv("JIRA_MUTATION_MAX_ATTEMPTS", "5"))
+    )
+
+# One ScrumBot per browser session, all sharing the pooled Jira client
+SESSION_COOKIE = "scrum_session"
+sessions = SessionStore(
+    lambda: ScrumBot(jira, mutations),
+    max_sessions=int(os.getenv("SESSION_MAX_SESSIONS", "500")),
+    idle_timeout=float(os.getenv("SESSION_IDLE_TIMEOUT", "1800")),
+    max_bytes=int(os.getenv("SESSION_MAX_BYTES", str(64 * 1024 * 1024))),
+    # Shared across gunicorn workers when set, e.g. sqlite:////tmp/sessions.db or redis://localhost:6379/0
+    backend=backend_from_url(os.getenv("SESSION_BACKEND"))
+)
+
+def current_session_id():
+    """Session ID from the X-Session-ID header or the session cookie, or a new one"""
+    return request.headers.get("X-Session-ID") or request.cookies.get(SESSION_COOKIE) or new_session_id()
+
+def session_response(payload, session_id):
+    """jsonify payload and set the session cookie so the browser keeps its conversation"""
+    response = jsonify({**payload, "session_id": session_id})
+    response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="Lax")
+    return response
+
+@app.before_serving
+async def warm_jira_caches():
+    """Resolve the board, active sprint and issue types before the first request"""
+    if mutations is not None:
+        # Replay updates a crashed or restarted worker had not sent yet
+        await mutations.start()
+    project_key = os.getenv("JIRA_PROJECT_KEY")
+    if project_key:
+        await jira.warm_up(project_key)
+
+@app.after_serving
+async def close_jira():
+    """Send queued Jira updates, then release pooled connections and the session backend"""
+    if mutations is not None:
+        await mutations.close()
+    await jira.close()
+    await sessions.close()
 
 # Serve static files for routes not starting with /api
 @app.route('/', defaults={'path': ''})
@@ -22,14 +77,16 @@ async def serve(path):
 async def start_session():
     """Start a new chat session"""
     try:
-        # Get the initial greeting from ScrumBot
-        response = scrum_bot.start_conversation()
-        return jsonify({
+        # Get the initial greeting from this session's ScrumBot
+        session_id = current_session_id()
+        async with sessions.session(session_id) as scrum_bot:
+            response = await scrum_bot.start_conversation_async()
+        return session_response({
             "success": True,
             "message": response["message"],
             "speech_segments": response["speech_segments"],
             "stage": "greeting"
-        })
+        }, session_id)
     except Exception as e:
         return jsonify({
             "success": False,
@@ -44,20 +101,77 @@ async def chat():
         message = data.get('message', '')
         stage = data.get('stage', 'greeting')
         
-        # Process the message using ScrumBot
-        response = scrum_bot.process_response(message)
+        # Process the message using this session's ScrumBot
+        session_id = current_session_id()
+        async with sessions.session(session_id) as scrum_bot:
+            response = await scrum_bot.process_response_async(message)
         
+        return session_response({
+            "success": True,
+            "message": response,
+            "stage": stage
+        }, session_id)
+    except Exception as e:
         return jsonify({
+            "success": False,
+            "message": str(e)
+        }), 500
+
+@app.route('/api/standup', methods=['POST'])
+async def standup():
+    """Handle a whole standup in one message, asking only for what it left out"""
+    try:
+        data = await request.get_json()
+        message = data.get('message', '')
+        
+        session_id = current_session_id()
+        async with sessions.session(session_id) as scrum_bot:
+            response = await scrum_bot.process_standup_async(message, data.get('extractor'))
+            stage = scrum_bot.current_state
+        
+        return session_response({
             "success": True,
             "message": response,
             "stage": stage
-        })
+        }, session_id)
     except Exception as e:
         return jsonify({
             "success": False,
             "message": str(e)
         }), 500
 
+@app.route('/api/ask_stream', methods=['POST'])
+async def ask_stream():
+    """Stream an assistant reply as server-sent events
+
+    Emits token events as the reply is generated, sentence events as each
+    sentence completes, and, when "speak" is set, base64 WAV audio events
+    for each sentence in order, then a final done event.
+    """
+    data = await request.get_json()
+    message = data.get('message', '')
+    speak = bool(data.get('speak', False))
+
+    async def events():
+        try:
+            async for event in stream_reply(message, speak=speak):
+                name = event.pop("event")
+                if name == "audio":
+                    audio = event.pop("audio")
+                    event["audio"] = base64.b64encode(audio).decode("ascii") if audio else None
+                yield f"event: {name}\ndata: {json.dumps(event)}\n\n".encode("utf-8")
+        except Exception as e:
+            print(f"[ERROR] Error in ask_stream: {e}")
+            yield f"event: error\ndata: {json.dumps({'message': str(e)})}\n\n".encode("utf-8")
+
+    response = await make_response(events(), {
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+    response.timeout = None  # Long answers must not be cut off by the default response timeout
+    return response
+
 @app.route('/api/speak', methods=['POST'])
 async def text_to_speech():
     """Convert text to speech"""
@@ -95,12 +209,33 @@ async def text_to_speech():
             "message": str(e)
         }), 500
 
+@app.route('/api/mutations', methods=['GET'])
+async def list_mutations():
+    """Outcome of each Jira update queued by this session's conversation"""
+    session_id = current_session_id()
+    async with sessions.session(session_id) as scrum_bot:
+        mutation_ids = list(scrum_bot.mutation_ids)
+    outcomes = []
+    for mutation_id in mutation_ids:
+        outcome = mutations.outcome(mutation_id) if mutations is not None else None
+        # Queued by another worker, or long enough ago to have been forgotten
+        outcomes.append(outcome or {"id": mutation_id, "status": "unknown"})
+    return session_response({"success": True, "mutations": outcomes}, session_id)
+
+@app.route('/api/mutations/<mutation_id>', methods=['GET'])
+async def get_mutation(mutation_id):
+    """Outcome of one queued Jira update"""
+    outcome = mutations.outcome(mutation_id) if mutations is not None else None
+    if outcome is None:
+        return jsonify({"success": False, "message": f"Unknown mutation {mutation_id}"}), 404
+    return jsonify({"success": True, "mutation": outcome})
+
 @app.route('/api/get_todo_tasks', methods=['GET'])
 async def get_todo_tasks():
     """Get TODO tasks for the current user"""
     try:
         # Use the username instead of account ID
-        tasks = scrum_bot.get_todo_tasks("meghanathink41")
+        tasks = await jira.get_todo_tasks("meghanathink41")
         return jsonify({
             "success": True,
             "tasks": tasks
@@ -0,0 +1,63 @@
+"""Microbenchmark: single-pass key extraction vs the previous multi-pass version
+
+Run from the server directory:
+
+    python benchmarks/bench_extract_jira_key.py
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from jira_keys import key_number_candidates  # noqa: E402
+
+LEGACY_NUMBERS = {
+    'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
+    'six': '6', 'seven': '7', 'eight': '8', 'nine': '9', 'ten': '10',
+    'eleven': '11', 'twelve': '12', 'thirteen': '13', 'fourteen': '14',
+    'fifteen': '15', 'sixteen': '16', 'seventeen': '17', 'eighteen': '18',
+    'nineteen': '19', 'twenty': '20'
+}
+LEGACY_PATTERNS = [
+    r'(?i)scrum[-\s]?(\d+)',
+    r'(?i)think_41[-\s]?scrum[-\s]?(\d+)',
+    r'(?i)scrum\s+issue\s+(\d+)',
+    r'(?i)ticket\s+(\d+)',
+    r'(?i)issue\s+(\d+)'
+]
+
+
+def legacy_candidates(text):
+    """The extractor as it was: 20 re.sub passes, then 5 findall passes"""
+    text = text.lower()
+    for word, digit in LEGACY_NUMBERS.items():
+        text = re.sub(r'\b' + word + r'\b', digit, text)
+    candidates = []
+    for pattern in LEGACY_PATTERNS:
+        matches = re.findall(pattern, text)
+        if matches and matches[0] not in candidates:
+            candidates.append(matches[0])
+    return candidates
+
+
+def transcript(sentences):
+    filler = ("yesterday I paired with the design team on the onboarding flow and "
+              "reviewed two pull requests before lunch, then we talked about the release. ")
+    return filler * sentences + "I finished scrum seven and started on ticket twelve."
+
+
+def main():
+    for sentences in (1, 10, 100):
+        text = transcript(sentences)
+        assert legacy_candidates(text) == key_number_candidates(text)
+        runs = max(10, 2000 // sentences)
+        legacy = timeit.timeit(lambda: legacy_candidates(text), number=runs) / runs
+        single = timeit.timeit(lambda: key_number_candidates(text), number=runs) / runs
+        print(f"{len(text):>6} chars  legacy {legacy * 1e6:9.1f} us  single-pass {single * 1e6:9.1f} us  "
+              f"speedup {legacy / single:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+import asyncio
+import marshal
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+from urllib.parse import unquote, urlparse
+
+from standup_parser import empty_report
+
+# First byte of every serialized state; bump it when the slot layout changes
+STATE_FORMAT_VERSION = 2
+
+
+class ConversationState:
+    """Everything one user's standup conversation needs between turns.
+
+    Slots keep each record small, and to_bytes() packs the slot values in
+    declaration order with marshal, so a worker can hand the state to
+    another through any byte store. marshal's format is tied to the Python
+    version, which is the same for every worker of one deployment.
+    """
+
+    __slots__ = ("current_state", "new_issue_data", "scrum_data", "issue_creation_data",
+                 "issue_creation_state", "pending_blockers", "standup_report", "standup_field", "username",
+                 "mutation_ids")
+
+    def __init__(self, username: str = "meghanathink41"):
+        self.current_state = "greeting"
+        self.new_issue_data = {}  # Store new issue details
+        self.scrum_data = {
+            "yesterday": None,
+            "today": None,
+            "blockers": []
+        }
+        self.issue_creation_data = {
+            "summary": None,
+            "description": None,
+            "issue_type": None,
+            "priority": None,
+            "assignee": None
+        }
+        self.issue_creation_state = None  # Track which field we're collecting
+        self.pending_blockers = []  # (issue_key, description) created together when the blocker phase ends
+        self.standup_report = empty_report()  # Gathered so far in one-shot standup mode
+        self.standup_field = "yesterday"  # Question the next one-shot answer responds to
+        self.username = username  # Username for getting tasks
+        self.mutation_ids = []  # Jira updates queued for this conversation, oldest first
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_bytes(self) -> bytes:
+        return bytes((STATE_FORMAT_VERSION,)) + marshal.dumps(tuple(getattr(self, name) for name in self.__slots__))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ConversationState":
+        """Rebuild a state from to_bytes() output
+
+        Raises:
+            ValueError: If data was written by another format version or is corrupt
+        """
+        if not data or data[0] != STATE_FORMAT_VERSION:
+            raise ValueError("Unsupported conversation state format")
+        try:
+            values = marshal.loads(data[1:])
+        except (EOFError, TypeError, ValueError) as e:
+            raise ValueError(f"Corrupt conversation state: {str(e)}")
+        if not isinstance(values, tuple) or len(values) != len(cls.__slots__):
+            raise ValueError("Corrupt conversation state")
+        state = cls.__new__(cls)
+        for name, value in zip(cls.__slots__, values):
+            setattr(state, name, value)
+        return state
+
+
+class MemoryStateBackend:
+    """Serialized states in a dict; per process, for single-worker runs and tests"""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._data: Dict[str, tuple] = {}
+
+    async def get(self, session_id: str) -> Optional[bytes]:
+        entry = self._data.get(session_id)
+        if entry is None or entry[0] <= self.clock():
+            self._data.pop(session_id, None)
+            return None
+        return entry[1]
+
+    async def set(self, session_id: str, data: bytes, ttl: float) -> None:
+        self._data[session_id] = (self.clock() + ttl, data)
+
+    async def delete(self, session_id: str) -> None:
+        self._data.pop(session_id, None)
+
+    async def close(self) -> None:
+        self._data.clear()
+
+
+class SQLiteStateBackend:
+    """Serialized states in a SQLite file shared by every worker on one host
+
+    Queries run on a single worker thread so they never block the event
+    loop, and the connection is only ever used by one thread at a time.
+    """
+
+    def __init__(self, path: str, clock=time.time):
+        self.path = path
+        self.clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-state")
+        self._db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        # WAL lets one worker read while another writes
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions "
+            "(session_id TEXT PRIMARY KEY, state BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _get(self, session_id: str) -> Optional[bytes]:
+        row = self._db.execute(
+            "SELECT state FROM sessions WHERE session_id = ? AND expires_at > ?", (session_id, self.clock())
+        ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def _set(self, session_id: str, data: bytes, ttl: float) -> None:
+        now = self.clock()
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)", (session_id, data, now + ttl))
+            self._db.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+
+    def _delete(self, session_id: str) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    async def get(self, session_id: str) -> Optional[bytes]:
+        return await self._run(self._get, session_id)
+
+    async def set(self, session_id: str, data: bytes, ttl: float) -> None:
+        await self._run(self._set, session_id, data, ttl)
+
+    async def delete(self, session_id: str) -> None:
+        await self._run(self._delete, session_id)
+
+    async def close(self) -> None:
+        await self._run(self._db.close)
+        self._executor.shutdown(wait=False)
+
+
+class RedisError(Exception):
+    """A Redis-protocol server returned an error reply"""
+
+
+class RedisStateBackend:
+    """Serialized states in a Redis-protocol server (Redis, Valkey, KeyDB, ...)
+
+    Speaks the few RESP commands it needs (AUTH, SELECT, GET, SET EX, DEL)
+    over one asyncio connection, opened on first use and reopened after an
+    error.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                 prefix: str = "scrumbot:session:", timeout: float = 2,
+                 password: Optional[str] = None, username: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.prefix = prefix
+        self.timeout = timeout
+        self.password = password
+        self.username = username
+        self._reader = None
+        self._writer = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        if self.password:
+            await self._send("AUTH", *([self.username] if self.username else []), self.password)
+        if self.db:
+            await self._send("SELECT", str(self.db))
+
+    async def _send(self, *args):
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            arg = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        self._writer.write(b"".join(parts))
+        await self._writer.drain()
+        return await asyncio.wait_for(self._read_reply(), self.timeout)
+
+    async def _read_reply(self):
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Redis connection closed")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body
+        if kind == b"-":
+            raise RedisError(body.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            return (await self._reader.readexactly(length + 2))[:-2]
+        raise RedisError(f"Unsupported reply type {kind!r}")
+
+    async def _command(self, *args):
+        async with self._lock:
+            if self._writer is None:
+                try:
+                    await self._connect()
+                except BaseException:
+                    # Never keep a connection that missed AUTH or SELECT
+                    await self._disconnect()
+                    raise
+            try:
+                return await self._send(*args)
+            except (OSError, ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                await self._disconnect()
+                raise
+
+    async def _disconnect(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = self._writer = None
+
+    async def get(self, session_id: str) -> Optional[bytes]:
+        return await self._command("GET", self.prefix + session_id)
+
+    async def set(self, session_id: str, data: bytes, ttl: float) -> None:
+        await self._command("SET", self.prefix + session_id, data, "EX", str(max(1, int(ttl))))
+
+    async def delete(self, session_id: str) -> None:
+        await self._command("DEL", self.prefix + session_id)
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._disconnect()
+
+
+def backend_from_url(url: Optional[str]):
+    """Build a state backend from a URL, or None to keep states in each process
+
+    Accepts memory://, sqlite:///path/to/file.db and redis://[[user]:password@]host:port/db.
+    """
+    if not url:
+        return None
+    parsed = urlparse(url)
+    if parsed.scheme == "memory":
+        return MemoryStateBackend()
+    if parsed.scheme == "sqlite":
+        return SQLiteStateBackend(parsed.path)
+    if parsed.scheme == "redis":
+        return RedisStateBackend(parsed.hostname or "localhost", parsed.port or 6379,
+                                 int(parsed.path.lstrip("/") or 0),
+                                 password=unquote(parsed.password) if parsed.password else None,
+                                 username=unquote(parsed.username) if parsed.username else None)
+    raise ValueError(f"Unsupported session backend: {url}")
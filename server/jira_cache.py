@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Sentinel for get() defaults, so a cached None (a negative result) is distinguishable from a miss
+MISSING = object()
+
+
+class TTLCache:
+    """Bounded in-process cache with per-entry expiry and LRU eviction.
+
+    Entries expire ttl seconds after they are stored. When the cache is full
+    the least recently used entry is evicted. Hit/miss counters are kept so
+    callers can report how effective the cache is. All operations are
+    guarded by a lock, so one instance can be shared between threads.
+
+    invalidate() and clear() bump a generation counter, so a caller that
+    fetched a value before an invalidation can use set_if_generation() to
+    avoid writing the stale value back.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialize the cache
+
+        Args:
+            maxsize (int): Maximum number of entries kept
+            ttl (float): Default lifetime of an entry in seconds
+            clock (callable): Monotonic time source, injectable for tests
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._epoch = 0  # Bumped by clear()
+        self._generations: Dict[Hashable, int] = {}  # Bumped per key by invalidate()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss or expiry"""
+        with self._lock:
+            entry = self._data.get(key, MISSING)
+            if entry is MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self, key: Hashable) -> tuple:
+        """Token that changes whenever key is invalidated; capture it before fetching"""
+        with self._lock:
+            return self._epoch, self._generations.get(key, 0)
+
+    def set_if_generation(self, key: Hashable, value: Any, generation: tuple, ttl: Optional[float] = None) -> bool:
+        """Store value only if key has not been invalidated since generation was taken"""
+        with self._lock:
+            if (self._epoch, self._generations.get(key, 0)) != generation:
+                return False
+            self._store(key, value, ttl)
+            return True
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entry if full"""
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        expires_at = self.clock() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop key from the cache, e.g. after our own code changed it in Jira"""
+        with self._lock:
+            self._data.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._generations.clear()
+            self._epoch += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key, MISSING)
+            return entry is not MISSING and entry[0] > self.clock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
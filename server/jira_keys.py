@@ -0,0 +1,194 @@
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Spoken numbers as speech-to-text transcribes them
+UNITS = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+    'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14,
+    'fifteen': 15, 'sixteen': 16, 'seventeen': 17, 'eighteen': 18,
+    'nineteen': 19
+}
+TENS = {
+    'twenty': 20, 'thirty': 30, 'forty': 40, 'fifty': 50,
+    'sixty': 60, 'seventy': 70, 'eighty': 80, 'ninety': 90
+}
+
+# Letter runs and digit runs, so "scrum-7", "scrum7" and "scrum 7" all become scrum, 7
+TOKEN_PATTERN = re.compile(r'[a-z]+|\d+')
+
+# Words that introduce an issue number, in the order their matches are tried:
+# scrum 7, scrum issue 7, ticket 7, issue 7
+KEY_CUES = (('scrum',), ('scrum', 'issue'), ('ticket',), ('issue',))
+
+
+def spoken_tokens(text: str) -> List[str]:
+    """Tokenize text, folding spoken numbers like "twenty three" into "23"
+
+    Args:
+        text (str): Transcribed user text
+
+    Returns:
+        list: Lowercase word tokens and digit strings
+    """
+    tokens = []
+    tens_at = None  # Index of a token that came from a tens word and may take a unit
+    for match in TOKEN_PATTERN.finditer(text.lower()):
+        word = match.group()
+        if word in TENS:
+            tokens.append(str(TENS[word]))
+            tens_at = len(tokens) - 1
+            continue
+        if word in UNITS:
+            value = UNITS[word]
+            if tens_at == len(tokens) - 1 and 0 < value < 10:
+                tokens[-1] = str(int(tokens[-1]) + value)
+            else:
+                tokens.append(str(value))
+        else:
+            tokens.append(word)
+        tens_at = None
+    return tokens
+
+
+def key_number_candidates(text: str) -> List[str]:
+    """Issue numbers mentioned in text, in the order they should be verified
+
+    One pass over the tokens records the first number after each cue in
+    KEY_CUES; the result lists them in cue order without duplicates.
+
+    Args:
+        text (str): Transcribed user text
+
+    Returns:
+        list: Issue numbers as digit strings
+    """
+    tokens = spoken_tokens(text)
+    found = [None] * len(KEY_CUES)
+    for index, token in enumerate(tokens):
+        if not token.isdigit():
+            continue
+        for rank, cue in enumerate(KEY_CUES):
+            if found[rank] is None and index >= len(cue) and tuple(tokens[index - len(cue):index]) == cue:
+                found[rank] = token
+    candidates = []
+    for number in found:
+        if number is not None and number not in candidates:
+            candidates.append(number)
+    return candidates
+
+
+# Clause boundaries; each mention takes the status words of its own clause
+CLAUSE_PATTERN = re.compile(r'[,.;!?]+|\b(?:and|but|then|also|while)\b')
+
+
+def _cue_numbers(tokens: List[str]) -> List[str]:
+    """Every number in tokens that directly follows one of KEY_CUES"""
+    numbers = []
+    for index, token in enumerate(tokens):
+        if token.isdigit() and any(
+                index >= len(cue) and tuple(tokens[index - len(cue):index]) == cue for cue in KEY_CUES):
+            numbers.append(token)
+    return numbers
+
+
+def key_mentions(text: str) -> List[Tuple[str, str]]:
+    """Every issue number mentioned in text with the clause it was mentioned in
+
+    "I finished scrum 7 and started scrum nine" gives
+    [("7", "i finished scrum 7"), ("9", "started scrum nine")].
+
+    Args:
+        text (str): Transcribed user text
+
+    Returns:
+        list: (issue number, clause) pairs in order of first mention
+    """
+    mentions = []
+    seen = set()
+    for clause in CLAUSE_PATTERN.split(text.lower()):
+        for number in _cue_numbers(spoken_tokens(clause)):
+            if number not in seen:
+                seen.add(number)
+                mentions.append((number, clause.strip()))
+    return mentions
+
+
+def split_key(issue_key: str) -> Optional[Tuple[str, int]]:
+    """("SCRUM", 7) for "SCRUM-7", or None if issue_key is not a PROJECT-NUMBER key"""
+    project, _, number = issue_key.rpartition('-')
+    if not project or not number.isdigit():
+        return None
+    return project.upper(), int(number)
+
+
+class IssueKeyIndex:
+    """Per-project bitmap of issue numbers known to exist.
+
+    Bit n of a project's bitmap is set when PROJECT-n exists, so a membership
+    check is one byte lookup and a project with 10k issues costs ~1.2 KB.
+    A missing bit only means "not known": callers fall back to asking Jira
+    and add the key when it turns up. All operations are guarded by a lock.
+    """
+
+    def __init__(self):
+        self._bits: Dict[str, bytearray] = {}
+        self._loaded = set()
+        self._lock = threading.Lock()
+
+    def add(self, issue_key: str) -> None:
+        parsed = split_key(issue_key)
+        if parsed is None:
+            return
+        project, number = parsed
+        with self._lock:
+            bits = self._bits.setdefault(project, bytearray())
+            if len(bits) <= number >> 3:
+                bits.extend(bytes((number >> 3) + 1 - len(bits)))
+            bits[number >> 3] |= 1 << (number & 7)
+
+    def discard(self, issue_key: str) -> None:
+        parsed = split_key(issue_key)
+        if parsed is None:
+            return
+        project, number = parsed
+        with self._lock:
+            bits = self._bits.get(project)
+            if bits is not None and len(bits) > number >> 3:
+                bits[number >> 3] &= ~(1 << (number & 7)) & 0xFF
+
+    def load(self, project: str, issue_keys: Iterable[str]) -> int:
+        """Replace the project's bitmap with issue_keys and mark it loaded
+
+        Returns:
+            int: Number of keys indexed
+        """
+        project = project.upper()
+        with self._lock:
+            self._bits[project] = bytearray()
+            self._loaded.discard(project)
+        count = 0
+        for issue_key in issue_keys:
+            self.add(issue_key)
+            count += 1
+        with self._lock:
+            self._loaded.add(project)
+        return count
+
+    def is_loaded(self, project: str) -> bool:
+        with self._lock:
+            return project.upper() in self._loaded
+
+    def __contains__(self, issue_key: str) -> bool:
+        parsed = split_key(issue_key)
+        if parsed is None:
+            return False
+        project, number = parsed
+        with self._lock:
+            bits = self._bits.get(project)
+            return bits is not None and len(bits) > number >> 3 and bool(bits[number >> 3] & (1 << (number & 7)))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(bin(byte).count("1") for bits in self._bits.values() for byte in bits)
@@ -0,0 +1,307 @@
+import asyncio
+import fcntl
+import glob
+import json
+import os
+import random
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+
+# Jira client methods the queue runs in the background:
+# name -> (issue keys in args, safe to retry, args without the issues whose previous mutation failed)
+# Status updates are idempotent (an issue already in the target status succeeds), so
+# any failure is retried; a bulk blocker create is retried only if it raised, since
+# a reported failure may have created some of the issues already. A blocker is only
+# filed once its issue has actually moved to Blocked.
+MUTATIONS = {
+    "update_issue_status": (lambda args: [args[0]], True, None),
+    "update_issue_statuses": (lambda args: [key for key, _ in args[0]], True, None),
+    "create_blockers": (lambda args: [key for key, _ in args[0]], False,
+                        lambda args, failed: ([blocker for blocker in args[0] if blocker[0] not in failed],))
+}
+MAX_OUTCOMES = 1000
+COMPACT_AFTER = 100  # Finished mutations after which the journal is rewritten with only pending ones
+
+
+def _succeeded(result) -> bool:
+    """Whether a Jira client result reports success: (ok, message) or a list of them"""
+    if isinstance(result, list):
+        return all(_succeeded(item) for item in result)
+    if isinstance(result, tuple) and result:
+        return bool(result[0])
+    return bool(result)
+
+
+def queued_result(method: str, args: tuple, mutation_id: str):
+    """What the conversation sees in place of the real result while the mutation is queued
+
+    Each item is (None, "Queued as <id>"): neither success nor failure, since
+    Jira has not been asked yet.
+    """
+    item = (None, f"Queued as {mutation_id}")
+    return item if method == "update_issue_status" else [item] * len(args[0])
+
+
+def _failed_keys(method: str, args: tuple, outcome: Dict[str, Any]) -> Set[str]:
+    """Issue keys a finished mutation did not apply"""
+    if outcome.get("status") == "succeeded":
+        return set()
+    keys = MUTATIONS[method][0](args)
+    result = outcome.get("result")
+    if isinstance(result, list) and len(result) == len(keys):
+        return {key for key, item in zip(keys, result) if not _succeeded(item)}
+    return set(keys)
+
+
+class MutationQueue:
+    """Write-behind queue for Jira mutations.
+
+    submit() records a mutation and returns at once; a background task runs
+    it on the Jira client. Mutations touching the same issue run in the
+    order they were submitted, others run concurrently up to concurrency at
+    a time. Failures are retried with jittered exponential backoff. Blockers
+    are dropped from a create_blockers call when their issue's previous
+    mutation failed.
+
+    With journal_dir set, every mutation is appended to a per-process
+    journal (fsync'd) before submit() returns and marked done when it
+    finishes. start() replays journals left behind by processes that died,
+    so queued updates survive a crash or restart. Each journal is held
+    under an exclusive flock while its process is alive, and is emptied
+    when the queue goes idle or rewritten with only the pending mutations
+    every compact_after finished ones.
+    """
+
+    def __init__(self, jira, journal_dir: Optional[str] = None, concurrency: int = 4,
+                 max_attempts: int = 5, base_delay: float = 0.5, max_delay: float = 30,
+                 compact_after: int = COMPACT_AFTER, sleep=asyncio.sleep):
+        """Initialize the queue
+
+        Args:
+            jira (AsyncJiraAPI): Client the mutations are run on
+            journal_dir (str): Directory for durable journals; None keeps mutations in memory only
+            concurrency (int): Mutations run at the same time
+            max_attempts (int): Attempts before a mutation is reported failed
+            base_delay (float): Backoff before the first retry, doubled for each further one
+            max_delay (float): Cap on the backoff
+            compact_after (int): Finished mutations between journal rewrites while others are pending
+            sleep (callable): Async sleep, injectable for tests
+        """
+        self.jira = jira
+        self.journal_dir = journal_dir
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.compact_after = compact_after
+        self.sleep = sleep
+        self.outcomes: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tails: Dict[str, asyncio.Future] = {}  # issue key -> completion of its latest mutation
+        self._tasks = set()
+        self._semaphore = None
+        self._journal = None
+        self.journal_path = None
+        self._journaled: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # Pending submit entries
+        self._finished = 0  # Mutations marked done since the journal was last compacted
+
+    async def start(self) -> int:
+        """Open this process's journal and resubmit mutations orphaned by dead processes
+
+        Returns:
+            int: Number of mutations recovered
+        """
+        if not self.journal_dir or self._journal is not None:
+            return 0
+        os.makedirs(self.journal_dir, exist_ok=True)
+        name = f"mutations-{os.getpid()}-{uuid.uuid4().hex[:8]}.jsonl"
+        self.journal_path = os.path.join(self.journal_dir, name)
+        self._journal = self._locked_journal([])
+
+        recovered = 0
+        for path in sorted(glob.glob(os.path.join(self.journal_dir, "mutations-*.jsonl"))):
+            if path == self.journal_path:
+                continue
+            for entry in self._claim_orphan(path):
+                self.submit(entry["method"], tuple(entry["args"]), mutation_id=entry["id"])
+                recovered += 1
+        if recovered:
+            print(f"[DEBUG] Recovered {recovered} queued Jira mutation(s)")
+        return recovered
+
+    def _claim_orphan(self, path: str) -> List[Dict[str, Any]]:
+        """Pending entries of another process's journal, if that process is gone"""
+        try:
+            with open(path, "r+", encoding="utf-8") as journal:
+                try:
+                    fcntl.flock(journal, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return []  # Its process is alive and still owns it
+                pending = OrderedDict()
+                for line in journal:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # A torn final line from a crash mid-write
+                    if entry.get("op") == "submit":
+                        pending[entry["id"]] = entry
+                    elif entry.get("op") == "done":
+                        pending.pop(entry["id"], None)
+                os.remove(path)
+                return list(pending.values())
+        except OSError as e:
+            print(f"[ERROR] Could not recover Jira mutations from {path}: {str(e)}")
+            return []
+
+    def _locked_journal(self, entries: List[Dict[str, Any]]):
+        """Write entries to a new locked file and move it to journal_path
+
+        The file is built and locked under a name the orphan glob skips, so
+        another worker's start() can't claim it before the lock is held.
+        """
+        staging_path = os.path.join(self.journal_dir, f".{os.path.basename(self.journal_path)}.tmp")
+        journal = open(staging_path, "w", encoding="utf-8")
+        fcntl.flock(journal, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        for entry in entries:
+            journal.write(json.dumps(entry) + "\n")
+        journal.flush()
+        os.fsync(journal.fileno())
+        os.rename(staging_path, self.journal_path)
+        return journal
+
+    def _write_journal(self, entry: Dict[str, Any]) -> None:
+        if self._journal is None:
+            return
+        self._journal.write(json.dumps(entry) + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def _compact_journal(self) -> None:
+        """Drop finished mutations from the journal once idle or after compact_after of them"""
+        if self._journal is None or (self._journaled and self._finished < self.compact_after):
+            return
+        try:
+            if self._journaled:
+                journal = self._locked_journal(list(self._journaled.values()))
+                self._journal.close()
+                self._journal = journal
+            else:
+                self._journal.seek(0)
+                self._journal.truncate()
+                os.fsync(self._journal.fileno())
+            self._finished = 0
+        except OSError as e:
+            print(f"[ERROR] Could not compact the Jira mutation journal: {str(e)}")
+
+    def submit(self, method: str, args: tuple, mutation_id: Optional[str] = None) -> str:
+        """Queue a Jira client call and return its mutation ID without waiting for it
+
+        Must be called from the event loop the queue runs on.
+        """
+        if method not in MUTATIONS:
+            raise ValueError(f"Not a queueable Jira mutation: {method}")
+        keys = list(dict.fromkeys(MUTATIONS[method][0](args)))
+        mutation_id = mutation_id or uuid.uuid4().hex[:12]
+        entry = {"op": "submit", "id": mutation_id, "method": method, "args": list(args)}
+        self._write_journal(entry)
+        if self._journal is not None:
+            self._journaled[mutation_id] = entry
+        self._record(mutation_id, {
+            "id": mutation_id, "method": method, "issue_keys": keys, "status": "queued",
+            "attempts": 0, "submitted_at": time.time(), "result": None, "error": None
+        })
+
+        loop = asyncio.get_running_loop()
+        previous = {key: self._tails[key] for key in keys if key in self._tails}
+        done = loop.create_future()
+        for key in keys:
+            self._tails[key] = done
+        task = asyncio.ensure_future(self._run(mutation_id, method, args, previous, done))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return mutation_id
+
+    async def _run(self, mutation_id: str, method: str, args: tuple, previous: Dict[str, asyncio.Future],
+                   done: asyncio.Future) -> None:
+        outcome = self.outcomes.get(mutation_id) or {}
+        skipped = set()
+        try:
+            # Earlier mutations of the same issues go first, whatever their outcome
+            if previous:
+                await asyncio.gather(*set(previous.values()), return_exceptions=True)
+            skip_failed = MUTATIONS[method][2]
+            if skip_failed is not None:
+                skipped = {key for key, tail in previous.items() if key in tail.result()}
+                if skipped:
+                    args = skip_failed(args, skipped)
+                    outcome["skipped_issue_keys"] = sorted(skipped)
+                    print(f"[DEBUG] Jira mutation {mutation_id} ({method}) skips {', '.join(sorted(skipped))}: "
+                          f"their earlier update failed")
+                if not args[0]:
+                    outcome["status"] = "skipped"
+                    return
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.concurrency)
+            async with self._semaphore:
+                await self._attempt(mutation_id, method, args, outcome)
+        finally:
+            self._write_journal({"op": "done", "id": mutation_id, "status": outcome.get("status")})
+            if self._journaled.pop(mutation_id, None) is not None:
+                self._finished += 1
+                self._compact_journal()
+            done.set_result(_failed_keys(method, args, outcome) | skipped)
+            for key, tail in list(self._tails.items()):
+                if tail is done:
+                    del self._tails[key]
+
+    async def _attempt(self, mutation_id: str, method: str, args: tuple, outcome: Dict[str, Any]) -> None:
+        retry_any_failure = MUTATIONS[method][1]
+        outcome["status"] = "running"
+        for attempt in range(1, self.max_attempts + 1):
+            outcome["attempts"] = attempt
+            try:
+                result = await getattr(self.jira, method)(*args)
+                outcome["result"], outcome["error"] = result, None
+                if _succeeded(result) or not retry_any_failure:
+                    outcome["status"] = "succeeded" if _succeeded(result) else "failed"
+                    break
+            except Exception as e:
+                outcome["result"], outcome["error"] = None, str(e)
+            if attempt < self.max_attempts:
+                delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+                await self.sleep(delay * random.uniform(0.5, 1))
+        else:
+            outcome["status"] = "failed"
+        outcome["finished_at"] = time.time()
+        if outcome["status"] == "failed":
+            print(f"[ERROR] Jira mutation {mutation_id} ({method}) failed after {outcome['attempts']} "
+                  f"attempt(s): {outcome['error'] or outcome['result']}")
+        else:
+            print(f"[DEBUG] Jira mutation {mutation_id} ({method}) succeeded")
+
+    def _record(self, mutation_id: str, outcome: Dict[str, Any]) -> None:
+        self.outcomes[mutation_id] = outcome
+        while len(self.outcomes) > MAX_OUTCOMES:
+            self.outcomes.popitem(last=False)
+
+    def outcome(self, mutation_id: str) -> Optional[Dict[str, Any]]:
+        """Status, attempts and result of a mutation, or None if it is unknown here"""
+        outcome = self.outcomes.get(mutation_id)
+        return dict(outcome) if outcome else None
+
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    async def drain(self) -> None:
+        """Wait until every queued mutation has finished"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Finish queued mutations, then remove this process's journal"""
+        await self.drain()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+            os.remove(self.journal_path)
@@ -0,0 +1,257 @@
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+# Starting request rate and burst per Jira host, overridable from the environment
+DEFAULT_RATE = float(os.getenv("JIRA_RATE_LIMIT", "20"))
+DEFAULT_BURST = float(os.getenv("JIRA_RATE_BURST", "40"))
+DEFAULT_MAX_RETRIES = int(os.getenv("JIRA_MAX_RETRIES", "3"))
+DEFAULT_MAX_WAIT = float(os.getenv("JIRA_MAX_WAIT", "10"))  # Longest a blocking caller sleeps for a slot
+DEFAULT_THROTTLE_DELAY = 1.0  # Back-off when a 429 carries no Retry-After
+CONCURRENCY_POLL = 0.05  # Seconds between checks while every concurrency slot is taken
+
+
+def _seconds_until(value: str, now: float) -> Optional[float]:
+    """Seconds until an HTTP-date or ISO 8601 timestamp, measured on the wall clock"""
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, moment.timestamp() - now)
+
+
+def retry_after(headers: Mapping[str, str], now: Optional[float] = None) -> Optional[float]:
+    """How long Jira asked us to wait, from Retry-After or X-RateLimit-Reset
+
+    Args:
+        headers (dict): Response headers with lowercase names
+        now (float): Current wall-clock time, injectable for tests
+    """
+    now = time.time() if now is None else now
+    value = headers.get("retry-after")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            delay = _seconds_until(value, now)
+            if delay is not None:
+                return delay
+    reset = headers.get("x-ratelimit-reset")
+    return _seconds_until(reset, now) if reset else None
+
+
+class RateLimited(Exception):
+    """A blocking caller would have had to wait longer than it may for the rate limiter"""
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+class RateLimiter:
+    """Token bucket with adaptive concurrency for one Jira host.
+
+    Requests take a token (refilled at rate per second, up to burst) and a
+    concurrency slot. Both limits adapt AIMD-style: each success raises the
+    concurrency limit by 1/limit and the rate by a twentieth of its ceiling,
+    while a 429 halves both and pauses the host until Retry-After (or
+    X-RateLimit-Reset) has passed. Other 5xx responses halve concurrency
+    only. Atlassian's X-RateLimit-FillRate / X-RateLimit-Interval-Seconds
+    headers cap the rate ceiling at what Jira says it will refill.
+
+    One limiter is shared by every thread and event loop talking to the
+    host; waits happen outside the lock, so async callers only sleep their
+    own task.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: float = DEFAULT_BURST, max_concurrency: int = 10,
+                 min_rate: float = 0.5, min_concurrency: int = 1, clock=time.monotonic):
+        """Initialize the limiter
+
+        Args:
+            rate (float): Starting and maximum requests per second
+            burst (float): Bucket capacity
+            max_concurrency (int): Starting and maximum requests in flight
+            min_rate (float): Floor for the rate after repeated throttling
+            min_concurrency (int): Floor for the concurrency limit
+            clock (callable): Monotonic time source, injectable for tests
+        """
+        self.max_rate = rate
+        self.ceiling = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.tokens = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.concurrency = float(max_concurrency)
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.clock = clock
+        self.requests = 0
+        self.throttled = 0
+        self.server_errors = 0
+        self.retries = 0
+        self.remaining = None  # Last X-RateLimit-Remaining Jira reported
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token and a concurrency slot, or return how long to wait before trying again"""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            if self.in_flight >= int(self.concurrency):
+                return CONCURRENCY_POLL
+            if self.tokens < 1:
+                return (1 - self.tokens) / self.rate
+            self.tokens -= 1
+            self.in_flight += 1
+            self.requests += 1
+            return 0.0
+
+    def acquire(self, max_wait: float = DEFAULT_MAX_WAIT) -> None:
+        """Block the calling thread until a request may be sent
+
+        Args:
+            max_wait (float): Longest to sleep in total; a thread running an event loop never sleeps
+
+        Raises:
+            RateLimited: If the request can't be sent within max_wait
+        """
+        if _on_event_loop():
+            # Sleeping here would stall every task on the loop; async callers use acquire_async
+            max_wait = 0
+        waited = 0.0
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            if waited + wait > max_wait:
+                raise RateLimited(f"Jira rate limit would delay this request by {wait:.1f}s")
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent"""
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def release(self, status: Optional[int] = None, headers: Optional[Mapping[str, str]] = None) -> Optional[float]:
+        """Return the slot and adapt the limits to the response
+
+        Args:
+            status (int): Response status, or None if the request raised
+            headers (dict): Response headers
+
+        Returns:
+            float: Seconds to wait before retrying a throttled request, else None
+        """
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        with self._lock:
+            self.in_flight -= 1
+            if status is None:
+                return None
+            self._apply_rate_headers(headers)
+            if status == 429 or (status == 503 and "retry-after" in headers):
+                self.throttled += 1
+                self.concurrency = max(self.min_concurrency, self.concurrency / 2)
+                self.rate = max(self.min_rate, self.rate / 2)
+                self.tokens = min(self.tokens, 0.0)
+                delay = retry_after(headers)
+                delay = DEFAULT_THROTTLE_DELAY if delay is None else delay
+                self.blocked_until = max(self.blocked_until, self.clock() + delay)
+                return delay
+            if status >= 500:
+                self.server_errors += 1
+                self.concurrency = max(self.min_concurrency, self.concurrency / 2)
+                return None
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+            self.rate = min(self.ceiling, self.rate + self.ceiling / 20)
+            return None
+
+    def allow_concurrency(self, max_concurrency: int) -> None:
+        """Raise the concurrency ceiling for a client with a bigger connection pool"""
+        with self._lock:
+            if max_concurrency > self.max_concurrency:
+                self.concurrency += max_concurrency - self.max_concurrency
+                self.max_concurrency = max_concurrency
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def _apply_rate_headers(self, headers: Dict[str, str]) -> None:
+        try:
+            if "x-ratelimit-remaining" in headers:
+                self.remaining = int(headers["x-ratelimit-remaining"])
+            if "x-ratelimit-fillrate" in headers:
+                interval = float(headers.get("x-ratelimit-interval-seconds", "1")) or 1
+                self.ceiling = max(self.min_rate, min(self.max_rate, float(headers["x-ratelimit-fillrate"]) / interval))
+                self.rate = min(self.rate, self.ceiling)
+        except ValueError:
+            pass
+        if headers.get("x-ratelimit-nearlimit", "").lower() == "true":
+            # Jira says we are close to the limit; ease off before it starts rejecting
+            self.rate = max(self.min_rate, self.rate * 0.8)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limits and counters"""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            return {
+                "rate": self.rate,
+                "rate_ceiling": self.ceiling,
+                "tokens": self.tokens,
+                "concurrency_limit": int(self.concurrency),
+                "in_flight": self.in_flight,
+                "blocked_for": max(0.0, self.blocked_until - now),
+                "remaining": self.remaining,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "server_errors": self.server_errors,
+                "retries": self.retries
+            }
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(url: str, max_concurrency: int = 10) -> RateLimiter:
+    """The process-wide limiter for url's host, shared by sync and async transports
+
+    Its concurrency ceiling is the largest max_concurrency any client of the host asked for.
+    """
+    host = urlparse(url).netloc or url
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = RateLimiter(max_concurrency=max_concurrency)
+        else:
+            limiter.allow_concurrency(max_concurrency)
+        return limiter
@@ -0,0 +1,122 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+SEARCH_PATH = "/rest/api/3/search"
+DEFAULT_PAGE_SIZE = 100  # Jira caps search pages at 100 issues
+
+
+class JiraSearchError(Exception):
+    """A search page request was rejected by Jira"""
+
+
+def search_body(jql: str, fields: Optional[List[str]] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                validate_query: Optional[str] = None) -> Dict[str, Any]:
+    """Request body for the first page of a search; only the listed fields are returned"""
+    body = {"jql": jql, "startAt": 0, "maxResults": page_size}
+    if fields:
+        body["fields"] = list(fields)
+    if validate_query:
+        body["validateQuery"] = validate_query
+    return body
+
+
+def next_page_body(body: Dict[str, Any], page: Dict[str, Any], fetched: int) -> Optional[Dict[str, Any]]:
+    """Request body for the page after page, or None once the search is exhausted
+
+    Follows nextPageToken when Jira sends one and startAt/total otherwise.
+
+    Args:
+        body (dict): Request body that produced page
+        page (dict): Decoded search response
+        fetched (int): Issues received so far, including this page
+    """
+    if page.get("nextPageToken"):
+        next_body = {key: value for key, value in body.items() if key != "startAt"}
+        next_body["nextPageToken"] = page["nextPageToken"]
+        return next_body
+    if not page.get("issues") or page.get("isLast") or fetched >= page.get("total", 0):
+        return None
+    return {**body, "startAt": fetched}
+
+
+def _page_json(response) -> Dict[str, Any]:
+    if response.status_code != 200:
+        raise JiraSearchError(f"Jira search failed with {response.status_code}: {response.text}")
+    return response.json()
+
+
+def iter_search(transport, jql: str, fields: Optional[List[str]] = None,
+                page_size: int = DEFAULT_PAGE_SIZE, read_ahead: bool = False,
+                validate_query: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield every issue matching jql, one page at a time
+
+    At most one page is held in memory, plus the next one when read_ahead
+    fetches it on a worker thread while the caller consumes the current page.
+
+    Args:
+        transport (JiraTransport): Transport to send the searches over
+        jql (str): JQL query
+        fields (list): Issue fields to return; all fields when None
+        page_size (int): Issues per page request
+        read_ahead (bool): Prefetch the next page in the background
+        validate_query (str): Jira's validateQuery mode; "warn" tolerates
+            references to issues that do not exist
+
+    Raises:
+        JiraSearchError: If Jira rejects a page request
+    """
+    def fetch(body):
+        return _page_json(transport.post(SEARCH_PATH, json=body))
+
+    body = search_body(jql, fields, page_size, validate_query)
+    fetched = 0
+    executor = ThreadPoolExecutor(max_workers=1) if read_ahead else None
+    pending = None
+    try:
+        page = fetch(body)
+        while True:
+            issues = page.get("issues", [])
+            fetched += len(issues)
+            body = next_page_body(body, page, fetched)
+            pending = executor.submit(fetch, body) if executor and body else None
+            yield from issues
+            if body is None:
+                return
+            page = pending.result() if pending else fetch(body)
+            pending = None
+    finally:
+        if executor is not None:
+            # The caller may have stopped early; don't wait for a prefetch nobody will read
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+
+async def aiter_search(transport, jql: str, fields: Optional[List[str]] = None,
+                       page_size: int = DEFAULT_PAGE_SIZE, read_ahead: bool = False,
+                       validate_query: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+    """asyncio counterpart of iter_search; read_ahead fetches the next page as a task"""
+    async def fetch(body):
+        return _page_json(await transport.post(SEARCH_PATH, json=body))
+
+    body = search_body(jql, fields, page_size, validate_query)
+    fetched = 0
+    pending = None
+    page = await fetch(body)
+    try:
+        while True:
+            issues = page.get("issues", [])
+            fetched += len(issues)
+            body = next_page_body(body, page, fetched)
+            pending = asyncio.ensure_future(fetch(body)) if read_ahead and body else None
+            for issue in issues:
+                yield issue
+            if body is None:
+                return
+            page = await pending if pending else await fetch(body)
+            pending = None
+    finally:
+        # The caller stopped early; don't leave the prefetch running
+        if pending is not None and not pending.done():
+            pending.cancel()
@@ -0,0 +1,302 @@
+import os
+import json
+import asyncio
+import threading
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Hashable, Optional, Tuple
+
+from jira_search import SEARCH_PATH
+from jira_rate_limit import RateLimiter, limiter_for, DEFAULT_MAX_RETRIES, DEFAULT_MAX_WAIT
+
+# Connection pool and timeout defaults, overridable from the environment
+DEFAULT_POOL_SIZE = int(os.getenv("JIRA_POOL_SIZE", "10"))
+DEFAULT_CONNECT_TIMEOUT = float(os.getenv("JIRA_CONNECT_TIMEOUT", "3.05"))
+DEFAULT_READ_TIMEOUT = float(os.getenv("JIRA_READ_TIMEOUT", "15"))
+# POSTs that only read, so identical concurrent ones can share a response like GETs do
+READ_ONLY_POST_PATHS = (SEARCH_PATH,)
+
+
+def flight_key(method: str, url: str, kwargs: Dict, tag: Hashable = None) -> Optional[tuple]:
+    """Identity of a request for single-flight sharing, or None if it must not be shared
+
+    GETs and read-only POSTs are shared when their URL, query parameters,
+    JSON body and tag match exactly; anything that changes Jira always goes
+    out. Callers pass a cache generation as tag so a read started after an
+    invalidation never joins one started before it.
+    """
+    if method == "POST":
+        if not url.endswith(READ_ONLY_POST_PATHS) or "data" in kwargs or "files" in kwargs:
+            return None
+    elif method != "GET":
+        return None
+    try:
+        params = json.dumps(kwargs.get("params"), sort_keys=True, default=str)
+        body = json.dumps(kwargs.get("json"), sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return method, url, params, body, tag
+
+
+class _Flight:
+    """One in-flight request that concurrent identical callers wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class JiraTransport:
+    """Pooled, keep-alive HTTP transport for the Jira REST API.
+
+    Every Jira call goes through one requests.Session, so TCP and TLS
+    connections to the Jira host are reused instead of being re-established
+    on each round trip. Identical GETs and searches issued concurrently from
+    several threads are sent once and all callers get the same response.
+    Requests pass through the host's RateLimiter, and ones Jira throttles
+    (429) are retried after the delay it asks for. A request never sleeps
+    longer than max_wait for the limiter: a throttled one then returns its
+    429 and an unthrottled one raises RateLimited.
+    """
+
+    def __init__(self, server_url: str, auth: Tuple[str, str], headers: Dict[str, str],
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 limiter: Optional[RateLimiter] = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 max_wait: float = DEFAULT_MAX_WAIT):
+        """Initialize the transport
+
+        Args:
+            server_url (str): Jira server URL, used to resolve relative paths
+            auth (tuple): (email, api_key) basic auth pair
+            headers (dict): Headers sent with every request
+            pool_size (int): Maximum number of pooled connections per host
+            connect_timeout (float): Seconds to wait for a connection
+            read_timeout (float): Seconds to wait for response data
+            limiter (RateLimiter): Limiter to use; defaults to the process-wide one for the host
+            max_retries (int): Retries of a throttled request before its 429 is returned
+            max_wait (float): Longest a request sleeps for the rate limiter
+        """
+        self.server_url = server_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.limiter = limiter or limiter_for(self.server_url, pool_size)
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.session.headers.update(headers)
+
+        # pool_block keeps the pool bounded: extra callers wait for a free
+        # connection instead of opening throwaway ones
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._flights: Dict[tuple, _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self.coalesced = 0  # Requests answered by another caller's in-flight request
+
+    def url(self, path: str) -> str:
+        """Resolve a path like /rest/api/3/issue against the server URL"""
+        if path.startswith('/'):
+            return f"{self.server_url}{path}"
+        return path
+
+    def request(self, method: str, path: str, flight_tag: Hashable = None, **kwargs) -> requests.Response:
+        """Send a request over the pooled session, sharing identical in-flight reads
+
+        Only reads with equal flight_tag values are shared.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        url = self.url(path)
+        key = flight_key(method, url, kwargs, flight_tag)
+        if key is None:
+            return self._send(method, url, **kwargs)
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        try:
+            flight.response = self._send(method, url, **kwargs)
+            return flight.response
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send once the rate limiter allows it, retrying while Jira throttles"""
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(self.max_wait)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except Exception:
+                self.limiter.release()
+                raise
+            delay = self.limiter.release(response.status_code, response.headers)
+            if delay is None or attempt == self.max_retries or delay > self.max_wait:
+                return response
+            self.limiter.record_retry()
+            # The next acquire() waits out the delay Jira asked for
+            print(f"[DEBUG] Jira throttled {method} {url}; retrying in {delay:.1f}s")
+        return response
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session.close()
+
+
+class AsyncJiraResponse:
+    """Fully read aiohttp response exposing the parts of requests.Response the Jira clients use"""
+
+    def __init__(self, status_code: int, text: str, headers: Dict[str, str]):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncJiraTransport:
+    """asyncio counterpart of JiraTransport built on a pooled aiohttp.ClientSession.
+
+    The session is created lazily on first use, so the transport can be
+    constructed at import time before an event loop is running. Identical
+    GETs and searches awaited concurrently share one request task. Rate
+    limiting and 429 retries wait with asyncio.sleep, so a throttled
+    request never blocks other sessions on the loop.
+    """
+
+    def __init__(self, server_url: str, auth: Tuple[str, str], headers: Dict[str, str],
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 limiter: Optional[RateLimiter] = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES):
+        self.server_url = server_url.rstrip('/')
+        # Credentials may be missing at import time (e.g. in tests); requests then go unauthenticated
+        self.auth = aiohttp.BasicAuth(auth[0], auth[1] or "") if auth and auth[0] else None
+        self.headers = dict(headers)
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self._session = None
+        self.limiter = limiter or limiter_for(self.server_url, pool_size)
+        self.max_retries = max_retries
+        self._flights: Dict[tuple, asyncio.Future] = {}
+        self.coalesced = 0  # Requests answered by another caller's in-flight request
+
+    def url(self, path: str) -> str:
+        """Resolve a path like /rest/api/3/issue against the server URL"""
+        if path.startswith('/'):
+            return f"{self.server_url}{path}"
+        return path
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # The connector queues requests beyond pool_size instead of opening more sockets
+            connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_size)
+            self._session = aiohttp.ClientSession(
+                auth=self.auth,
+                headers=self.headers,
+                timeout=self.timeout,
+                connector=connector
+            )
+        return self._session
+
+    @staticmethod
+    def _encode_params(params):
+        # aiohttp only accepts scalar query values; Jira takes list fields comma-separated
+        return {
+            key: ",".join(str(v) for v in value) if isinstance(value, (list, tuple)) else str(value)
+            for key, value in params.items()
+        }
+
+    async def request(self, method: str, path: str, flight_tag: Hashable = None, **kwargs) -> AsyncJiraResponse:
+        """Send a request over the pooled session and read the whole body
+
+        An identical GET or search with the same flight_tag already in flight
+        is awaited instead of sent again. It runs as its own task, so one
+        caller being cancelled does not cancel it for the others.
+        """
+        if kwargs.get("params"):
+            kwargs["params"] = self._encode_params(kwargs["params"])
+        url = self.url(path)
+        key = flight_key(method, url, kwargs, flight_tag)
+        if key is None:
+            return await self._send(method, url, **kwargs)
+
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = asyncio.ensure_future(self._send(method, url, **kwargs))
+            flight.add_done_callback(lambda _: self._flights.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(flight)
+
+    async def _send(self, method: str, url: str, **kwargs) -> AsyncJiraResponse:
+        """Send once the rate limiter allows it, retrying while Jira throttles"""
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire_async()
+            try:
+                async with self.session.request(method, url, **kwargs) as response:
+                    text = await response.text()
+                    result = AsyncJiraResponse(response.status, text, dict(response.headers))
+            except BaseException:
+                self.limiter.release()
+                raise
+            delay = self.limiter.release(result.status_code, result.headers)
+            if delay is None or attempt == self.max_retries:
+                return result
+            self.limiter.record_retry()
+            print(f"[DEBUG] Jira throttled {method} {url}; retrying in {delay:.1f}s")
+        return result
+
+    async def get(self, path: str, **kwargs) -> AsyncJiraResponse:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> AsyncJiraResponse:
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> AsyncJiraResponse:
+        return await self.request("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> AsyncJiraResponse:
+        return await self.request("DELETE", path, **kwargs)
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,197 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from jira_cache import TTLCache, MISSING
+from jira_keys import spoken_tokens
+
+
+def normalize_prompt(text: str) -> str:
+    """Reduce text to the words that matter for an LLM answer
+
+    Case, punctuation and spacing are dropped and spoken numbers are folded,
+    so "No blockers!", "no  blockers" and "Working on SCRUM-7" /
+    "working on scrum seven" share a key.
+    """
+    return " ".join(spoken_tokens(text))
+
+
+def response_key(model: str, system_prompt: str, text: str, temperature: float) -> str:
+    """Stable cache key for one chat completion request"""
+    payload = json.dumps([model, system_prompt, temperature, normalize_prompt(text)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier cache of LLM replies: an in-process LRU and an optional SQLite file.
+
+    The memory tier is a TTLCache. When path is set, replies are also written
+    to a SQLite table so they survive restarts and are shared by workers on
+    one host; a disk hit is promoted into memory. The disk tier keeps at
+    most disk_maxsize rows, dropping expired and then the oldest ones every
+    trim_every writes.
+
+    Every disk query runs on one worker thread, so get_async()/set_async()
+    never block the event loop and the connection is never shared between
+    threads.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 86400, path: Optional[str] = None,
+                 disk_maxsize: int = 10000, trim_every: Optional[int] = None, clock=time.time):
+        """Initialize the cache
+
+        Args:
+            maxsize (int): Maximum replies kept in memory
+            ttl (float): Lifetime of a reply in seconds
+            path (str): SQLite file for the disk tier; None keeps replies in memory only
+            disk_maxsize (int): Maximum replies kept on disk
+            trim_every (int): Disk writes between trims; defaults to a tenth of disk_maxsize
+            clock (callable): Wall-clock time source for disk expiry, injectable for tests
+        """
+        self.ttl = ttl
+        self.clock = clock
+        self.memory = TTLCache(maxsize, ttl)
+        self.path = path
+        self.disk_maxsize = disk_maxsize
+        self.trim_every = trim_every or max(1, disk_maxsize // 10)
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = None
+        self._executor = None
+        self._writes = 0  # Disk writes since the last trim; only touched on the executor thread
+        if path:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-cache")
+            self._executor.submit(self._open).result()
+
+    def _open(self) -> None:
+        try:
+            self._db = sqlite3.connect(self.path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, reply TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            print(f"[ERROR] Could not open LLM cache at {self.path}: {str(e)}")
+            self._db = None
+
+    def _on_disk(self, func, *args):
+        """Run func on the disk thread and wait for it"""
+        return self._executor.submit(func, *args).result()
+
+    async def _on_disk_async(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _memory_get(self, key: str) -> Any:
+        reply = self.memory.get(key, MISSING)
+        if reply is MISSING and self._db is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        return reply
+
+    def _promote(self, key: str, reply: Optional[str]) -> Optional[str]:
+        with self._lock:
+            if reply is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self.memory.set(key, reply)
+        return reply
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached reply for key, or None on a miss"""
+        reply = self._memory_get(key)
+        if reply is not MISSING:
+            return reply
+        return self._promote(key, self._on_disk(self._disk_get, key))
+
+    async def get_async(self, key: str) -> Optional[str]:
+        """get() for the event loop; a disk lookup runs on the disk thread"""
+        reply = self._memory_get(key)
+        if reply is not MISSING:
+            return reply
+        return self._promote(key, await self._on_disk_async(self._disk_get, key))
+
+    def set(self, key: str, reply: str) -> None:
+        self.memory.set(key, reply)
+        if self._db is not None:
+            self._on_disk(self._disk_set, key, reply)
+
+    async def set_async(self, key: str, reply: str) -> None:
+        """set() for the event loop; the disk write runs on the disk thread"""
+        self.memory.set(key, reply)
+        if self._db is not None:
+            await self._on_disk_async(self._disk_set, key, reply)
+
+    def _disk_set(self, key: str, reply: str) -> None:
+        if self._db is None:
+            return
+        now = self.clock()
+        try:
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, reply, now + self.ttl))
+            self._writes += 1
+            if self._writes >= self.trim_every:
+                self._writes = 0
+                self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+                self._db.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY expires_at DESC LIMIT ?)",
+                    (self.disk_maxsize,)
+                )
+            self._db.commit()
+        except sqlite3.Error as e:
+            print(f"[ERROR] Could not write LLM cache entry: {str(e)}")
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT reply FROM responses WHERE key = ? AND expires_at > ?", (key, self.clock())
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[ERROR] Could not read LLM cache entry: {str(e)}")
+            return None
+        return row[0] if row else None
+
+    def _disk_clear(self) -> None:
+        if self._db is not None:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def _disk_close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self._executor is not None:
+            self._on_disk(self._disk_clear)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._on_disk(self._disk_close)
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return memory and disk hit counters and the overall hit rate"""
+        memory = self.memory.stats()
+        with self._lock:
+            hits = memory["hits"] + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory": memory,
+                "disk_hits": self.disk_hits,
+                "hits": hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,164 @@
+import asyncio
+import secrets
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional
+
+
+def new_session_id() -> str:
+    return secrets.token_urlsafe(16)
+
+
+def state_size(bot) -> int:
+    """Approximate bytes held by a bot's conversation state"""
+    return len(bot.export_state())
+
+
+class SessionStore:
+    """Per-session conversation objects with idle expiry, LRU eviction and a memory cap.
+
+    Each session gets its own object from factory (a ScrumBot sharing one
+    Jira client), created on first use. Sessions idle for idle_timeout
+    seconds are dropped; when there are more than max_sessions, or their
+    estimated state exceeds max_bytes, the least recently used ones are
+    evicted. Requests for the same session are serialized by a per-session
+    lock. Meant to be used from one event loop.
+
+    With a backend (see conversation_state), each request loads the latest
+    serialized state before it runs and saves it afterwards, so a session
+    can move between worker processes. Two workers serving the same session
+    at the same instant are not serialized; the last save wins.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_sessions: int = 500, idle_timeout: float = 1800,
+                 max_bytes: int = 64 * 1024 * 1024, size_of: Callable[[Any], int] = state_size,
+                 backend=None, clock: Callable[[], float] = time.monotonic):
+        """Initialize the store
+
+        Args:
+            factory (callable): Builds the state object for a new session
+            max_sessions (int): Maximum sessions kept
+            idle_timeout (float): Seconds after the last request before a session expires
+            max_bytes (int): Cap on the summed size_of all sessions
+            size_of (callable): Estimates one session's state in bytes
+            backend: Shared store of serialized states; None keeps them in this process
+            clock (callable): Monotonic time source, injectable for tests
+        """
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        self.backend = backend
+        self.clock = clock
+        # session_id -> [last_used, state, size, lock], least recently used first
+        self._sessions: "OrderedDict[str, list]" = OrderedDict()
+        self.total_bytes = 0
+        self.created = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    @asynccontextmanager
+    async def session(self, session_id: str):
+        """Hold a session's state for one request, creating it if needed
+
+        The state is re-measured on exit and the caps are enforced then, so a
+        session is never evicted while a request is using it.
+        """
+        entry = self._checkout(session_id)
+        async with entry[3]:
+            if self.backend is not None:
+                await self._load(session_id, entry[1])
+            try:
+                yield entry[1]
+            finally:
+                if self.backend is not None:
+                    await self._save(session_id, entry[1])
+                entry[0] = self.clock()
+                if self._sessions.get(session_id) is entry:
+                    size = self.size_of(entry[1])
+                    self.total_bytes += size - entry[2]
+                    entry[2] = size
+                self._enforce_limits(keep=session_id)
+
+    async def _load(self, session_id: str, state) -> None:
+        """Replace state with the backend's copy, which another worker may have advanced"""
+        try:
+            data = await self.backend.get(session_id)
+            if data:
+                state.import_state(data)
+        except Exception as e:
+            # Keep serving from this worker's copy rather than failing the request
+            print(f"[ERROR] Could not load session {session_id[:8]}: {str(e)}")
+
+    async def _save(self, session_id: str, state) -> None:
+        try:
+            await self.backend.set(session_id, state.export_state(), self.idle_timeout)
+        except Exception as e:
+            print(f"[ERROR] Could not save session {session_id[:8]}: {str(e)}")
+
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
+
+    def get(self, session_id: str) -> Optional[Any]:
+        """The session's state, or None if it does not exist or has expired"""
+        self._expire_idle()
+        entry = self._sessions.get(session_id)
+        return entry[1] if entry else None
+
+    def discard(self, session_id: str) -> None:
+        entry = self._sessions.pop(session_id, None)
+        if entry:
+            self.total_bytes -= entry[2]
+
+    def _checkout(self, session_id: str) -> list:
+        self._expire_idle()
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            state = self.factory()
+            entry = [self.clock(), state, self.size_of(state), asyncio.Lock()]
+            self._sessions[session_id] = entry
+            self.total_bytes += entry[2]
+            self.created += 1
+        else:
+            entry[0] = self.clock()
+        self._sessions.move_to_end(session_id)
+        return entry
+
+    def _expire_idle(self) -> None:
+        cutoff = self.clock() - self.idle_timeout
+        while self._sessions:
+            session_id, entry = next(iter(self._sessions.items()))
+            if entry[0] > cutoff or entry[3].locked():
+                break
+            self.discard(session_id)
+            self.expirations += 1
+
+    def _enforce_limits(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used idle sessions until both caps hold"""
+        for session_id in list(self._sessions):
+            if len(self._sessions) <= self.max_sessions and self.total_bytes <= self.max_bytes:
+                return
+            if session_id == keep or self._sessions[session_id][3].locked():
+                continue
+            self.discard(session_id)
+            self.evictions += 1
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "created": self.created,
+            "expirations": self.expirations,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,141 @@
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from jira_keys import CLAUSE_PATTERN
+
+# The three standup questions, in the order a follow-up asks for missing ones
+STANDUP_FIELDS = ("yesterday", "today", "blockers")
+STANDUP_QUESTIONS = {
+    "yesterday": "What did you work on yesterday?",
+    "today": "What will you be working on today?",
+    "blockers": "Do you have any blockers? If so, which task are they blocking?"
+}
+
+# System prompt for extracting a whole standup with one LLM call
+STANDUP_EXTRACTION_PROMPT = (
+    "You extract daily standup updates. Reply with a single JSON object and nothing else, "
+    'shaped like {"yesterday": string or null, "today": string or null, '
+    '"blockers": [string], "no_blockers": boolean}. Copy the speaker\'s own words, '
+    "including task references such as SCRUM-7, into the matching field. Use null for a "
+    "question the speaker did not answer, one blockers entry per distinct blocker, and set "
+    "no_blockers to true only if the speaker said they have none."
+)
+
+# Section cues, checked in this order so "no blockers" is not read as a blocker
+SECTION_CUES = (
+    ("no_blockers", re.compile(r"\b(?:no|zero) (?:blockers?|impediments?)\b|\bnothing (?:is )?blocking\b|\bnot blocked\b")),
+    ("blockers", re.compile(r"\bblock(?:ed|er|ers|ing)?\b|\bstuck\b|\bwaiting (?:on|for)\b|\bimpediments?\b")),
+    ("today", re.compile(r"\btoday\b|\bthis morning\b|\bnext up\b")),
+    ("yesterday", re.compile(r"\byesterday\b|\blast (?:standup|time)\b"))
+)
+NEGATIVE_ANSWERS = {"no", "nope", "none", "nothing", "no blockers"}
+
+
+def empty_report() -> Dict[str, Any]:
+    return {"yesterday": None, "today": None, "blockers": [], "no_blockers": False}
+
+
+def _section_of(clause: str) -> Optional[str]:
+    for section, pattern in SECTION_CUES:
+        if pattern.search(clause):
+            return section
+    return None
+
+
+def parse_standup(text: str, default_field: str = "yesterday") -> Dict[str, Any]:
+    """Split a free-form standup answer into its sections with rules alone
+
+    The answer is cut into clauses; a clause with a cue ("yesterday",
+    "today", "blocked") starts that section and clauses without one continue
+    the previous section. Clauses before the first cue belong to
+    default_field, the question that was asked.
+
+    Args:
+        text (str): Transcribed user text
+        default_field (str): One of STANDUP_FIELDS
+
+    Returns:
+        dict: {"yesterday": str|None, "today": str|None, "blockers": [str], "no_blockers": bool}
+    """
+    report = empty_report()
+    if default_field == "blockers" and text.lower().strip(" .!") in NEGATIVE_ANSWERS:
+        report["no_blockers"] = True
+        return report
+
+    parts = {"yesterday": [], "today": []}
+    section = default_field
+    for clause in CLAUSE_PATTERN.split(text.lower()):
+        clause = clause.strip()
+        if not clause:
+            continue
+        cue = _section_of(clause)
+        if cue == "no_blockers":
+            report["no_blockers"] = True
+            section = None
+            continue
+        if cue == "blockers":
+            report["blockers"].append(clause)
+        elif cue is None and section == "blockers" and report["blockers"]:
+            report["blockers"][-1] += f", {clause}"
+        elif cue is None and section == "blockers":
+            report["blockers"].append(clause)
+        elif (cue or section) in parts:
+            parts[cue or section].append(clause)
+        section = cue or section
+
+    for field, clauses in parts.items():
+        report[field] = ", ".join(clauses) or None
+    return report
+
+
+def parse_llm_reply(reply: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Read the JSON object an LLM returned for STANDUP_EXTRACTION_PROMPT
+
+    Returns:
+        dict: A report shaped like parse_standup's, or None if reply holds no usable JSON
+    """
+    if not reply:
+        return None
+    start, end = reply.find("{"), reply.rfind("}")
+    if start < 0 or end < start:
+        return None
+    try:
+        data = json.loads(reply[start:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    report = empty_report()
+    for field in ("yesterday", "today"):
+        value = data.get(field)
+        report[field] = value.strip() or None if isinstance(value, str) else None
+    blockers = data.get("blockers") or []
+    if isinstance(blockers, str):
+        blockers = [blockers]
+    for blocker in blockers if isinstance(blockers, list) else []:
+        if isinstance(blocker, dict):
+            blocker = blocker.get("description")
+        if isinstance(blocker, str) and blocker.strip():
+            report["blockers"].append(blocker.strip())
+    report["no_blockers"] = bool(data.get("no_blockers")) and not report["blockers"]
+    return report
+
+
+def merge_reports(base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine a follow-up answer into the report gathered so far"""
+    merged = dict(base)
+    for field in ("yesterday", "today"):
+        merged[field] = update[field] or base[field]
+    merged["blockers"] = base["blockers"] + update["blockers"]
+    merged["no_blockers"] = (base["no_blockers"] or update["no_blockers"]) and not merged["blockers"]
+    return merged
+
+
+def missing_fields(report: Dict[str, Any]) -> List[str]:
+    """STANDUP_FIELDS the report has no answer for yet"""
+    missing = [field for field in ("yesterday", "today") if not report[field]]
+    if not report["blockers"] and not report["no_blockers"]:
+        missing.append("blockers")
+    return missing
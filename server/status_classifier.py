@@ -0,0 +1,92 @@
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Phrases that signal each status, in priority order: when a transcript
+# signals several statuses the first one listed wins
+DEFAULT_STATUS_VOCABULARY = {
+    "Done": ["completed", "finished", "done", "complete"],
+    "In Progress": ["working", "started", "progress", "continuing", "doing"],
+    "Blocked": ["blocked", "blocking", "blocker"]
+}
+DEFAULT_STATUS = "To Do"
+
+# JSON file of per-project additions, e.g.
+# {"SCRUM": {"In Review": ["in review", "code review"], "Done": ["shipped"]}}
+STATUS_VOCABULARY_FILE = os.getenv("STATUS_VOCABULARY_FILE")
+
+
+class StatusClassifier:
+    """Maps a transcript to a workflow status in one regex pass.
+
+    All phrases are compiled into a single word-bounded alternation, so
+    "undone" does not count as "done". The winning status is the highest
+    priority one that matched; confidence is the share of matched phrases
+    that agree with it (0.0 when nothing matched and the default is used).
+    """
+
+    def __init__(self, vocabulary: Dict[str, List[str]], default_status: str = DEFAULT_STATUS):
+        """Compile the vocabulary
+
+        Args:
+            vocabulary (dict): {status: [phrases]} in priority order
+            default_status (str): Status returned when no phrase matches
+        """
+        self.default_status = default_status
+        self.priority = {status: rank for rank, status in enumerate(vocabulary)}
+        self.phrase_status = {}
+        for status, phrases in vocabulary.items():
+            for phrase in phrases:
+                # A phrase listed under two statuses belongs to the higher priority one
+                self.phrase_status.setdefault(phrase.lower(), status)
+        # Longest phrases first so "in progress" wins over "progress"
+        alternation = "|".join(
+            re.escape(phrase).replace(r"\ ", r"\s+")
+            for phrase in sorted(self.phrase_status, key=len, reverse=True)
+        )
+        self.pattern = re.compile(rf"\b(?:{alternation})\b" if alternation else r"(?!)", re.IGNORECASE)
+
+    def classify(self, text: str) -> Tuple[str, float]:
+        """Return (status, confidence) for text"""
+        counts = {}
+        for match in self.pattern.finditer(text):
+            status = self.phrase_status[re.sub(r"\s+", " ", match.group().lower())]
+            counts[status] = counts.get(status, 0) + 1
+        if not counts:
+            return self.default_status, 0.0
+        status = min(counts, key=self.priority.__getitem__)
+        return status, counts[status] / sum(counts.values())
+
+
+def merge_vocabularies(base: Dict[str, List[str]], extra: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Add extra's phrases to base; statuses new to base go after the existing ones"""
+    merged = {status: list(phrases) for status, phrases in base.items()}
+    for status, phrases in extra.items():
+        merged.setdefault(status, []).extend(phrase for phrase in phrases if phrase not in merged[status])
+    return merged
+
+
+def load_project_vocabularies(path: Optional[str] = STATUS_VOCABULARY_FILE) -> Dict[str, Dict[str, List[str]]]:
+    """Read per-project vocabulary additions from a JSON file, or {} if there is none"""
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Could not load status vocabulary from {path}: {str(e)}")
+        return {}
+
+
+_classifiers: Dict[Optional[str], StatusClassifier] = {}
+
+
+def classifier_for(project_key: Optional[str] = None) -> StatusClassifier:
+    """Compiled classifier for a project, built once from the defaults plus its additions"""
+    classifier = _classifiers.get(project_key)
+    if classifier is None:
+        additions = load_project_vocabularies().get(project_key, {}) if project_key else {}
+        classifier = StatusClassifier(merge_vocabularies(DEFAULT_STATUS_VOCABULARY, additions))
+        _classifiers[project_key] = classifier
+    return classifier
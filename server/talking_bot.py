@@ -3,20 +3,23 @@ from dotenv import load_dotenv
 import json
 import asyncio
 import aiohttp
-import requests
-import nltk
-from playsound import playsound
 import tempfile
 import traceback
-import re
-import sounddevice as sd
-import numpy as np
-from nltk.tokenize import word_tokenize
+import time
+from concurrent.futures import ThreadPoolExecutor
+from text_tokenizer import SentenceSplitter
 import wave
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from jira import JIRA
-import groq
+from jira_cache import TTLCache, MISSING
+from jira_keys import key_number_candidates, key_mentions, IssueKeyIndex
+from status_classifier import classifier_for
+from llm_cache import LLMResponseCache, response_key
+from conversation_state import ConversationState
+from jira_mutations import MUTATIONS, queued_result
+from standup_parser import (STANDUP_QUESTIONS, STANDUP_EXTRACTION_PROMPT, empty_report, parse_standup,
+                            parse_llm_reply, merge_reports, missing_fields)
+from jira_search import iter_search, aiter_search, DEFAULT_PAGE_SIZE
+from jira_transport import JiraTransport, AsyncJiraTransport, DEFAULT_POOL_SIZE, DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
 
 # Load environment variables
 load_dotenv()
@@ -26,14 +29,49 @@ JIRA_EMAIL = os.getenv("JIRA_EMAIL")
 JIRA_API_KEY = os.getenv("JIRA_API_KEY")
 JIRA_BASE_URL = "https://think41-team21.atlassian.net"
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+ISSUE_CACHE_SIZE = int(os.getenv("JIRA_ISSUE_CACHE_SIZE", "256"))
+ISSUE_CACHE_TTL = float(os.getenv("JIRA_ISSUE_CACHE_TTL", "60"))
+TRANSITION_CACHE_TTL = float(os.getenv("JIRA_TRANSITION_CACHE_TTL", "86400"))
+# 0 loads each project's issue types once per process
+ISSUE_TYPE_REFRESH_INTERVAL = float(os.getenv("JIRA_ISSUE_TYPE_REFRESH_INTERVAL", "3600")) or float("inf")
+BOARD_CACHE_TTL = float(os.getenv("JIRA_BOARD_CACHE_TTL", "86400"))
+# Used when the active sprint has no endDate, and for re-checking a board with no active sprint
+SPRINT_CACHE_FALLBACK_TTL = float(os.getenv("JIRA_SPRINT_CACHE_FALLBACK_TTL", "300"))
+USER_CACHE_TTL = float(os.getenv("JIRA_USER_CACHE_TTL", "86400"))
+USER_NEGATIVE_CACHE_TTL = float(os.getenv("JIRA_USER_NEGATIVE_CACHE_TTL", "300"))
+USER_PAGE_SIZE = 1000
+# Epics per story search; keeps the "parent in (...)" JQL well under URL length limits
+SUMMARY_EPIC_BATCH_SIZE = 50
+SUMMARY_EPIC_FIELDS = ["summary", "status", "assignee"]
+SUMMARY_STORY_FIELDS = ["summary", "status", "assignee", "priority", "updated", "parent", "customfield_10014"]
+BULK_CREATE_LIMIT = 50  # Jira accepts at most 50 issues per /issue/bulk request
+SESSION_MUTATION_HISTORY = 50  # Queued mutation IDs remembered per conversation
+GROQ_MODEL = "mixtral-8x7b-32768"
+GROQ_SYSTEM_PROMPT = "You are a helpful Scrum assistant. Help extract key information about tasks, status updates, and blockers from the user's input."
+GROQ_TEMPERATURE = 0.7
+GROQ_CACHE_SIZE = int(os.getenv("GROQ_CACHE_SIZE", "512"))
+GROQ_CACHE_TTL = float(os.getenv("GROQ_CACHE_TTL", "86400"))
+# SQLite file that keeps Groq replies across restarts; empty keeps them in memory only
+GROQ_CACHE_PATH = os.getenv("GROQ_CACHE_PATH") or None
+# "llm" parses one-shot standups with a single Groq call; "rules" uses the offline extractors
+STANDUP_EXTRACTOR = os.getenv("STANDUP_EXTRACTOR", "rules")
 
-# Initialize Groq client
-groq_client = groq.AsyncGroq(
-    api_key=GROQ_API_KEY
-)
+# Groq client, created on first use so importing this module doesn't load the SDK
+groq_client = None
 
-# Download NLTK data
-nltk.download('punkt')
+
+def get_groq_client():
+    """Return the shared Groq client, creating it on first use"""
+    global groq_client
+    if groq_client is None:
+        import groq
+        groq_client = groq.AsyncGroq(
+            api_key=GROQ_API_KEY
+        )
+    return groq_client
+
+# Replies to repeated standup phrases ("no blockers", "same as yesterday")
+groq_cache = LLMResponseCache(GROQ_CACHE_SIZE, GROQ_CACHE_TTL, GROQ_CACHE_PATH)
 
 class ScrumStatus:
     TODO = "To Do"
@@ -42,13 +80,22 @@ class ScrumStatus:
     BLOCKED = "Blocked"
 
 class JiraAPI:
-    def __init__(self, server_url, email, api_key):
+    transport_class = JiraTransport
+
+    def __init__(self, server_url, email, api_key, pool_size=DEFAULT_POOL_SIZE,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT,
+                 issue_cache_size=ISSUE_CACHE_SIZE, issue_cache_ttl=ISSUE_CACHE_TTL):
         """Initialize the Jira API client
         
         Args:
             server_url (str): Jira server URL (e.g. https://your-domain.atlassian.net)
             email (str): Jira account email
             api_key (str): Jira API key
+            pool_size (int): Maximum keep-alive connections kept open to the Jira host
+            connect_timeout (float): Seconds to wait when opening a connection
+            read_timeout (float): Seconds to wait for a response
+            issue_cache_size (int): Maximum number of issues kept in the issue cache
+            issue_cache_ttl (float): Seconds a cached issue stays fresh
         """
         # Ensure server_url doesn't end with a slash
         self.server_url = server_url.rstrip('/')
@@ -59,61 +106,136 @@ class JiraAPI:
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        # All requests share one pooled session so connections are reused
+        self.transport = self.transport_class(
+            self.server_url,
+            self.auth,
+            self.headers,
+            pool_size=pool_size,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout
+        )
+        # Issue JSON by key, shared by get_issue_details, issue_exists and get_issue_assignee
+        self.issue_cache = TTLCache(maxsize=issue_cache_size, ttl=issue_cache_ttl)
+        # {transition name: id} per (project, issue type, from-status); workflows rarely change
+        self.transition_cache = TTLCache(maxsize=256, ttl=TRANSITION_CACHE_TTL)
+        # {lowercase issue type name: id} per project, shared by create_issue and create_blocker
+        self.issue_type_cache = TTLCache(maxsize=64, ttl=ISSUE_TYPE_REFRESH_INTERVAL)
+        # Board ID per project key (None = first board) and active sprint ID per board.
+        # Sprint entries expire at the sprint's endDate, so a sprint rollover is picked up on its own
+        self.board_cache = TTLCache(maxsize=64, ttl=BOARD_CACHE_TTL)
+        self.sprint_cache = TTLCache(maxsize=64, ttl=SPRINT_CACHE_FALLBACK_TTL)
+        # accountId by lowercase username, email or display name; unknown users are cached as None
+        self.user_cache = TTLCache(maxsize=1024, ttl=USER_CACHE_TTL)
+        # Issue keys known to exist, so issue_exists can answer without a round trip
+        self.key_index = IssueKeyIndex()
         print(f"[DEBUG] Initialized Jira API with server URL: {server_url}")
 
-    def get_account_id(self, email):
-        """Get the account ID for a user by email"""
-        print(f"[DEBUG] Getting account ID for email: {email}")
-        try:
-            url = f"{self.server_url}/rest/api/3/user/search?query={email}"
-            print(f"[DEBUG] URL: {url}")
-            print(f"[DEBUG] Headers: {self.headers}")
-            print(f"[DEBUG] Auth: {self.auth}")
-            
-            response = requests.get(url, headers=self.headers, auth=self.auth)
-            print(f"[DEBUG] Response status: {response.status_code}")
-            print(f"[DEBUG] Response content: {response.text}")
-            
-            if response.status_code == 200:
-                users = response.json()
-                if users:
-                    for user in users:
-                        if user.get('emailAddress') == email:
-                            account_id = user['accountId']
-                            print(f"[DEBUG] Found account ID: {account_id}")
-                            return account_id
-            print("[DEBUG] No account ID found")
-            return None
-        except Exception as e:
-            print(f"[ERROR] Error getting account ID: {str(e)}")
-            traceback.print_exc()
-            return None
+    def close(self):
+        """Close the pooled Jira connections"""
+        self.transport.close()
+
+    def cache_stats(self):
+        """Hit/miss counters of the client-side caches"""
+        return {
+            "issues": self.issue_cache.stats(),
+            "transitions": self.transition_cache.stats(),
+            "issue_types": self.issue_type_cache.stats(),
+            "boards": self.board_cache.stats(),
+            "sprints": self.sprint_cache.stats(),
+            "users": self.user_cache.stats(),
+            "known_issue_keys": len(self.key_index),
+            "coalesced_requests": self.transport.coalesced,
+            "rate_limit": self.transport.limiter.stats()
+        }
+
+    def warm_up(self, project_key):
+        """Preload slow-changing project metadata so the first standup skips discovery calls"""
+        print(f"[DEBUG] Warming Jira caches for project {project_key}")
+        self.get_current_sprint_id(project_key)
+        self.get_issue_type_id(project_key, "Task")
+        self.load_assignable_users(project_key)
+        self.load_issue_keys(project_key)
 
     def get_account_id(self, username):
-        """Get the account ID for a username"""
+        """Get the account ID for a username or email, served from the user directory when known"""
         print(f"[DEBUG] Getting account ID for username: {username}")
+        account_id = self.user_cache.get(self._user_key(username), MISSING)
+        if account_id is not MISSING:
+            print(f"[DEBUG] Account ID from user directory: {account_id}")
+            return account_id
         try:
-            url = f"{self.server_url}/rest/api/3/user/search?query={username}"
-            print(f"[DEBUG] URL: {url}")
-            print(f"[DEBUG] Headers: {self.headers}")
-            print(f"[DEBUG] Auth: {self.auth}")
-            
-            response = requests.get(url, headers=self.headers, auth=self.auth)
+            url = f"{self.server_url}/rest/api/3/user/search"
+            response = self.transport.get(url, params={"query": username})
             print(f"[DEBUG] Response status: {response.status_code}")
-            print(f"[DEBUG] Response content: {response.text}")
-            
+
             if response.status_code == 200:
-                users = response.json()
-                if users:
-                    account_id = users[0]['accountId']
-                    print(f"[DEBUG] Found account ID: {account_id}")
-                    return account_id
+                return self._remember_account_id(username, response.json())
             print("[DEBUG] No account ID found")
             return None
         except Exception as e:
             print(f"[ERROR] Error getting account ID: {str(e)}")
             traceback.print_exc()
             return None
+
+    def load_assignable_users(self, project_key):
+        """Bulk-load the project's assignable users into the user directory
+
+        Returns:
+            int: Number of users loaded
+        """
+        url = f"{self.server_url}/rest/api/3/user/assignable/search"
+        users = []
+        try:
+            while True:
+                params = {"project": project_key, "startAt": len(users), "maxResults": USER_PAGE_SIZE}
+                response = self.transport.get(url, params=params)
+                if response.status_code != 200:
+                    print(f"[ERROR] Failed to load assignable users: {response.text}")
+                    break
+                page = response.json()
+                users.extend(page)
+                if len(page) < USER_PAGE_SIZE:
+                    break
+        except Exception as e:
+            print(f"[ERROR] Error loading assignable users: {str(e)}")
+        self._index_users(users)
+        return len(users)
+
+    @staticmethod
+    def _user_key(username):
+        return username.strip().lower()
+
+    def _index_users(self, users):
+        """Store each user under its email, email local part and display name"""
+        entries = {}
+        for user in users:
+            account_id = user.get("accountId")
+            if not account_id:
+                continue
+            email = (user.get("emailAddress") or "").lower()
+            for key in (email, email.split("@")[0], (user.get("displayName") or "").lower()):
+                if key:
+                    # The first user wins when two users share a display name or local part
+                    entries.setdefault(key, account_id)
+        for key, account_id in entries.items():
+            self.user_cache.set(key, account_id)
+        print(f"[DEBUG] User directory loaded {len(users)} users")
+
+    def _remember_account_id(self, username, users):
+        """Pick the account for a user search result and cache it, including a miss"""
+        key = self._user_key(username)
+        # Prefer an exact email match; otherwise Jira's best match comes first
+        exact = [user for user in users if (user.get("emailAddress") or "").lower() == key]
+        matches = exact or users
+        account_id = matches[0]["accountId"] if matches else None
+        if account_id:
+            print(f"[DEBUG] Found account ID: {account_id}")
+            self.user_cache.set(key, account_id)
+        else:
+            print("[DEBUG] No account ID found")
+            self.user_cache.set(key, None, ttl=USER_NEGATIVE_CACHE_TTL)
+        return account_id
         
     def get_todo_tasks(self, assignee):
         """Get TODO tasks for the given assignee"""
@@ -121,8 +243,6 @@ class JiraAPI:
         print(f"[DEBUG] Server URL: {self.server_url}")
         print(f"[DEBUG] Headers: {self.headers}")
         
-        url = f"{self.server_url}/rest/api/3/search"
-        
         # First get the account ID
         account_id = self.get_account_id(assignee)
         if not account_id:
@@ -132,189 +252,31 @@ class JiraAPI:
         print(f"[DEBUG] Found account ID: {account_id}")
         
         try:
-            payload = {
-                "jql": f'project = {os.getenv("JIRA_PROJECT_KEY")} AND status = "To Do" AND assignee = "{account_id}"',
-                "fields": ["summary", "status", "assignee"]
-            }
+            payload = self._todo_tasks_payload(account_id)
             print(f"[DEBUG] Request payload: {json.dumps(payload, indent=2)}")
-            
-            response = requests.post(
-                url,
-                headers=self.headers,
-                auth=self.auth,
-                json=payload
-            )
-            print(f"[DEBUG] Response status: {response.status_code}")
-            print(f"[DEBUG] Response content: {response.text}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                tasks = []
-                for issue in data.get('issues', []):
-                    task = {
-                        'key': issue['key'],
-                        'summary': issue['fields']['summary'],
-                        'status': issue['fields']['status']['name']
-                    }
-                    tasks.append(task)
-                print(f"[DEBUG] Found {len(tasks)} TODO tasks")
-                return tasks
-            else:
-                print(f"[ERROR] Failed to fetch TODO tasks: {response.status_code}")
-                return []
+
+            tasks = self._parse_tasks(self.iter_search(**payload))
+            print(f"[DEBUG] Found {len(tasks)} TODO tasks")
+            return tasks
         except Exception as e:
             print(f"[ERROR] Error fetching TODO tasks: {str(e)}")
             traceback.print_exc()
             return []
         
-    def create_issue(self, project, summary, description, issue_type):
-        """Create a new issue in Jira
-        
-        Args:
-            project (str): Project key (e.g., 'SCRUM')
-            summary (str): Issue title/summary
-            description (str): Detailed description of the issue
-            issue_type (str): Type of issue (e.g., 'Task', 'Bug', 'Story')
-            
-        Returns:
-            tuple: (success, message) where success is a boolean and message contains
-                   either the created issue key or error message
-        """
-        print(f"\n[DEBUG] Creating issue with parameters:")
-        print(f"Project: {project}")
-        print(f"Summary: {summary}")
-        print(f"Description: {description}")
-        print(f"Issue Type: {issue_type}")
-        try:
-            # First, get the issue type ID
-            issuetypes_url = f"{self.server_url}/rest/api/3/issuetype"
-            print(f"\n[DEBUG] Fetching issue types from: {issuetypes_url}")
-            issuetypes_response = requests.get(
-                issuetypes_url,
-                headers=self.headers,
-                auth=self.auth
-            )
-            
-            print(f"[DEBUG] Issue types response status: {issuetypes_response.status_code}")
-            print(f"[DEBUG] Issue types response: {issuetypes_response.text}")
-            
-            if issuetypes_response.status_code != 200:
-                return False, f"Failed to get issue types: {issuetypes_response.text}"
-                
-            issuetypes = issuetypes_response.json()
-            print(f"\n[DEBUG] Available issue types:")
-            for t in issuetypes:
-                print(f"  - {t['name']} (ID: {t['id']})")
-                
-            print(f"\n[DEBUG] Looking for issue type: {issue_type}")
-            issuetype_id = next((t["id"] for t in issuetypes if t["name"].lower() == issue_type.lower()), None)
-            print(f"[DEBUG] Found issue type ID: {issuetype_id}")
-            
-            if not issuetype_id:
-                return False, f"Issue type '{issue_type}' not found. Available types: {', '.join(t['name'] for t in issuetypes)}"
-            
-            create_url = f"{self.server_url}/rest/api/3/issue"
-            
-            # Format description in Atlassian Document Format
-            description_adf = {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": description
-                            }
-                        ]
-                    }
-                ]
-            }
-            
-            # Prepare the request payload
-            payload = {
-                "fields": {
-                    "project": {
-                        "key": project
-                    },
-                    "summary": summary,
-                    "description": description_adf,
-                    "issuetype": {
-                        "id": issuetype_id
-                    }
-                }
-            }
-            
-            print(f"\n[DEBUG] Creating issue with payload: {payload}")
-            print(f"[DEBUG] Using URL: {create_url}")
-            print(f"[DEBUG] Headers: {self.headers}")
-            
-            response = requests.post(
-                create_url,
-                headers=self.headers,
-                auth=self.auth,
-                json=payload
-            )
-            
-            print(f"[DEBUG] Create issue response status: {response.status_code}")
-            print(f"[DEBUG] Create issue response: {response.text}")
-            
-            if response.status_code == 201:
-                data = response.json()
-                return True, f"Created issue {data['key']}"
-            else:
-                return False, f"Failed to create issue: {response.text}"
-                
-        except Exception as e:
-            print(f"[ERROR] Failed to create issue: {e}")
-            traceback.print_exc()
-            return False, str(e)
-        
     def create_issue(self, project, summary, description, issue_type, assignee=None, epic_key=None):
         """Create a new issue in Jira"""
         try:
-            create_url = f"{self.server_url}/rest/api/3/issue"
-            
-            issue_data = {
-                "fields": {
-                    "project": {"key": project},
-                    "summary": summary,
-                    "description": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": description
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    "issuetype": {"name": issue_type}
-                }
-            }
-            
-            if assignee:
-                issue_data["fields"]["assignee"] = {"name": assignee}
-                
-            # If this is a story and epic is provided, link it to the epic
-            if issue_type.lower() == "story" and epic_key:
-                issue_data["fields"]["customfield_10014"] = epic_key  # Epic link field
-            
-            response = requests.post(
-                create_url,
-                headers=self.headers,
-                auth=self.auth,
-                json=issue_data
+            response = self._post_issue(
+                project,
+                issue_type,
+                lambda issuetype_id: self._issue_data(
+                    project, summary, description, issue_type, assignee, epic_key, issuetype_id
+                )
             )
             
             if response.status_code == 201:
                 issue_key = response.json()["key"]
+                self.key_index.add(issue_key)
                 print(f"[DEBUG] Created issue: {issue_key}")
                 return True, issue_key
             else:
@@ -325,29 +287,48 @@ class JiraAPI:
             print(f"[ERROR] Error creating issue: {str(e)}")
             return False, str(e)
 
+    def get_issue_type_id(self, project, issue_type):
+        """Resolve an issue type name to its ID through the per-project issue-type registry"""
+        issue_types = self.issue_type_cache.get(project)
+        if issue_types is None:
+            try:
+                print(f"[DEBUG] Loading issue types for project {project}")
+                response = self.transport.get(f"{self.server_url}/rest/api/3/project/{project}")
+                if response.status_code != 200:
+                    print(f"[ERROR] Failed to load issue types: {response.status_code}")
+                    return None
+                issue_types = self._issue_type_index(response.json())
+                self.issue_type_cache.set(project, issue_types)
+            except Exception as e:
+                print(f"[ERROR] Error loading issue types: {str(e)}")
+                return None
+        return issue_types.get(issue_type.lower())
+
+    def _post_issue(self, project, issue_type, build_issue_data):
+        """POST a new issue whose type ID comes from the issue-type registry.
+
+        build_issue_data(issuetype_id) returns the payload. If Jira rejects a
+        registry ID the project's types are reloaded and the request retried once.
+        """
+        create_url = f"{self.server_url}/rest/api/3/issue"
+        issuetype_id = self.get_issue_type_id(project, issue_type)
+        issue_data = build_issue_data(issuetype_id)
+        print(f"[DEBUG] Sending create request with data: {json.dumps(issue_data, indent=2)}")
+        response = self.transport.post(create_url, json=issue_data)
+        if issuetype_id and self._issue_type_rejected(response):
+            print(f"[DEBUG] Jira rejected issue type ID {issuetype_id}, reloading issue types for {project}")
+            self.issue_type_cache.invalidate(project)
+            issuetype_id = self.get_issue_type_id(project, issue_type)
+            response = self.transport.post(create_url, json=build_issue_data(issuetype_id))
+        return response
+
     def get_epics(self, project_key):
         """Get list of epics in the project"""
         try:
             # Search for epics using JQL
-            search_url = f"{self.server_url}/rest/api/3/search"
             jql = f'project = {project_key} AND issuetype = Epic ORDER BY created DESC'
-            
-            response = requests.post(
-                search_url,
-                headers=self.headers,
-                auth=self.auth,
-                json={
-                    "jql": jql,
-                    "fields": ["summary", "customfield_10014"]  # Epic Name field
-                }
-            )
-            
-            if response.status_code == 200:
-                epics = response.json()["issues"]
-                return True, epics
-            else:
-                print(f"[ERROR] Failed to get epics: {response.text}")
-                return False, []
+            epics = self.search_all(jql, ["summary", "customfield_10014"])  # Epic Name field
+            return True, epics
                 
         except Exception as e:
             print(f"[ERROR] Error getting epics: {str(e)}")
@@ -358,524 +339,1320 @@ class JiraAPI:
         try:
             # Get project details
             project_url = f"{self.server_url}/rest/api/2/project/{project_key}"
-            project_response = requests.get(project_url, headers=self.headers, auth=self.auth)
+            project_response = self.transport.get(project_url)
             project_data = project_response.json()
             
             # Get all epics
             epic_jql = f'project = {project_key} AND issuetype = Epic ORDER BY created DESC'
-            epics_url = f"{self.server_url}/rest/api/2/search"
-            epics_response = requests.get(
-                epics_url,
-                headers=self.headers,
-                auth=self.auth,
-                params={"jql": epic_jql, "maxResults": 100}
+            epics = self.search_all(epic_jql, SUMMARY_EPIC_FIELDS)
+            print(f"\n[DEBUG] Found {len(epics)} epics")
+
+            # Get the stories of all epics in a few batched searches instead of one per epic
+            stories = []
+            for epic_keys in self._batches([epic["key"] for epic in epics], SUMMARY_EPIC_BATCH_SIZE):
+                stories.extend(self.search_all(self._stories_jql(project_key, epic_keys), SUMMARY_STORY_FIELDS))
+            print(f"[DEBUG] Found {len(stories)} stories")
+
+            return self._project_summary(project_key, project_data, epics, stories)
+        except Exception as e:
+            print(f"[ERROR] Error getting project summary: {str(e)}")
+            traceback.print_exc()
+            return None
+
+    def iter_search(self, jql, fields=None, page_size=DEFAULT_PAGE_SIZE, read_ahead=False, validate_query=None):
+        """Stream the issues matching a JQL query page by page
+
+        Args:
+            jql (str): JQL query
+            fields (list): Issue fields to return; all fields when None
+            page_size (int): Issues per page request
+            read_ahead (bool): Fetch the next page while the current one is consumed
+            validate_query (str): "warn" to skip keys that do not exist instead of failing
+
+        Raises:
+            JiraSearchError: If Jira rejects a page request
+        """
+        return iter_search(self.transport, jql, fields, page_size, read_ahead, validate_query)
+
+    def search_all(self, jql, fields=None, validate_query=None):
+        """Run a JQL search and collect every matching issue"""
+        return list(self.iter_search(jql, fields, read_ahead=True, validate_query=validate_query))
+
+    @staticmethod
+    def _batches(items, size):
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    @staticmethod
+    def _stories_jql(project_key, epic_keys):
+        # Epic Link catches stories on company-managed projects that have not moved to parent
+        keys = ", ".join(epic_keys)
+        return f'project = {project_key} AND issuetype = Story AND (parent in ({keys}) OR "Epic Link" in ({keys}))'
+
+    @staticmethod
+    def _story_epic_key(story):
+        """Epic of a story: the parent on current Jira, the Epic Link field on older company-managed projects"""
+        fields = story.get("fields", {})
+        parent = fields.get("parent") or {}
+        return parent.get("key") or fields.get("customfield_10014")
+
+    def _project_summary(self, project_key, project_data, epics, stories):
+        """Group the fetched stories under their epics"""
+        stories_by_epic = {}
+        for story in stories:
+            stories_by_epic.setdefault(self._story_epic_key(story), []).append(self._story_summary(story))
+
+        summary = {
+            "projectName": project_data.get("name"),
+            "projectKey": project_key,
+            "lastUpdated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "epics": [self._epic_summary(epic, stories_by_epic.get(epic.get("key"), [])) for epic in epics]
+        }
+        print("\n[DEBUG] Final summary:", summary)
+        return summary
+
+    def issue_exists(self, issue_key):
+        """Check if an issue exists, asking Jira only for keys missing from the key index"""
+        print(f"[DEBUG] Checking if issue exists: {issue_key}")
+        if issue_key in self.key_index:
+            print(f"[DEBUG] Issue {issue_key} found in key index")
+            return True
+        exists = self.get_issue_details(issue_key) is not None
+        if exists:
+            self.key_index.add(issue_key)
+        print(f"[DEBUG] Issue {issue_key} {'exists' if exists else 'does not exist'}")
+        return exists
+
+    def existing_issue_keys(self, issue_keys):
+        """The subset of issue_keys that exist, checking the key index first and Jira in one search"""
+        unknown = [key for key in issue_keys if key not in self.key_index]
+        found = {key for key in issue_keys if key not in unknown}
+        if unknown:
+            try:
+                for issue in self.iter_search(self._keys_jql(unknown), ["key"], validate_query="warn"):
+                    self.key_index.add(issue["key"])
+                    found.add(issue["key"])
+            except Exception as e:
+                print(f"[ERROR] Error checking issue keys: {str(e)}")
+        print(f"[DEBUG] Existing issue keys: {sorted(found)}")
+        return found
+
+    def update_issue_statuses(self, updates):
+        """Apply several status updates concurrently
+
+        Args:
+            updates (list): (issue_key, target_status) pairs
+
+        Returns:
+            list: (success, message) per update, in the same order
+        """
+        if not updates:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(updates), self.transport.pool_size)) as executor:
+            futures = [executor.submit(self.update_issue_status, key, status) for key, status in updates]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append((False, str(e)))
+        return results
+
+    def load_issue_keys(self, project_key):
+        """Seed the key index from a key-only search over the whole project
+
+        Returns:
+            int: Number of keys indexed
+        """
+        try:
+            issues = self.iter_search(f"project = {project_key}", ["key"], read_ahead=True)
+            count = self.key_index.load(project_key, (issue["key"] for issue in issues))
+            print(f"[DEBUG] Indexed {count} issue keys for {project_key}")
+            return count
+        except Exception as e:
+            print(f"[ERROR] Error loading issue keys: {str(e)}")
+            return 0
+
+    def get_issue_assignee(self, issue_key):
+        """Get the assignee of an issue"""
+        return self._assignee_of(self.get_issue_details(issue_key))
+
+    def get_current_sprint_id(self, project_key=None):
+        """Get the ID of the current active sprint
+
+        Args:
+            project_key (str): Project whose board to use; the first board when None
+        """
+        try:
+            board_id = self.board_cache.get(project_key, MISSING)
+            if board_id is MISSING:
+                board_url = f"{self.server_url}/rest/agile/1.0/board"
+                boards = self.transport.get(board_url, params=self._board_params(project_key)).json()["values"]
+                board_id = self._cache_board(project_key, boards)
+
+            if board_id is None:
+                return None
+
+            sprint_id = self.sprint_cache.get(board_id, MISSING)
+            if sprint_id is MISSING:
+                # Get active sprints for this board
+                sprints_url = f"{self.server_url}/rest/agile/1.0/board/{board_id}/sprint?state=active"
+                sprints = self.transport.get(sprints_url).json()["values"]
+                sprint_id = self._cache_sprint(board_id, sprints)
+            return sprint_id
+            
+        except Exception as e:
+            print(f"Error getting current sprint: {str(e)}")
+            return None
+
+    @staticmethod
+    def _board_params(project_key):
+        return {"projectKeyOrId": project_key} if project_key else None
+
+    def _cache_board(self, project_key, boards):
+        """Remember the first board of a board listing; a project without boards is re-checked sooner"""
+        if not boards:
+            self.board_cache.set(project_key, None, ttl=SPRINT_CACHE_FALLBACK_TTL)
+            return None
+        board_id = boards[0]["id"]  # Use the first board
+        self.board_cache.set(project_key, board_id)
+        return board_id
+
+    def _cache_sprint(self, board_id, sprints):
+        """Remember the board's first active sprint until its endDate"""
+        sprint_id = sprints[0]["id"] if sprints else None
+        ttl = self._sprint_ttl(sprints[0]) if sprints else SPRINT_CACHE_FALLBACK_TTL
+        print(f"[DEBUG] Caching active sprint {sprint_id} of board {board_id} for {ttl:.0f}s")
+        self.sprint_cache.set(board_id, sprint_id, ttl=ttl)
+        return sprint_id
+
+    @staticmethod
+    def _sprint_ttl(sprint, now=None):
+        """Seconds until the sprint's endDate, or the fallback TTL when it is missing or already past"""
+        end_date = sprint.get("endDate")
+        if not end_date:
+            return SPRINT_CACHE_FALLBACK_TTL
+        try:
+            # Jira sends e.g. 2024-03-19T10:00:00.000Z; fromisoformat wants an explicit offset
+            ends_at = datetime.fromisoformat(end_date.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return SPRINT_CACHE_FALLBACK_TTL
+        remaining = ends_at - (time.time() if now is None else now)
+        return remaining if remaining > 0 else SPRINT_CACHE_FALLBACK_TTL
+
+    def create_blocker(self, issue_key, description):
+        """Create a blocker relationship for the issue"""
+        return self._blocker_result(issue_key, self.create_blocker_report(issue_key, description))
+
+    def create_blocker_report(self, issue_key, description):
+        """Create a blocker issue, then link, comment and label concurrently
+
+        Returns:
+            dict: blocker_key, error (why no blocker was created, or None) and
+                steps, the outcome of each follow-up step keyed by name
+        """
+        report = {"blocker_key": None, "error": None, "steps": {}}
+        try:
+            print(f"\n[DEBUG] Starting blocker creation for issue: {issue_key}")
+            project_key = issue_key.split('-')[0]
+
+            # The issue and the current sprint are independent lookups
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                sprint_future = executor.submit(self.get_current_sprint_id, project_key)
+                issue = self.get_issue_details(issue_key)
+                sprint_id = sprint_future.result()
+
+            if not issue:
+                print(f"[ERROR] Could not find issue {issue_key}")
+                report["error"] = f"Could not find issue {issue_key}"
+                return report
+            if not sprint_id:
+                print("[WARNING] Could not determine current sprint ID")
+
+            # Create a new issue for the blocker
+            create_response = self._post_issue(
+                project_key,
+                "Task",
+                lambda issuetype_id: self._blocker_issue_data(issue_key, description, issue, sprint_id, issuetype_id)
             )
-            epics_data = epics_response.json()
-            print(f"\n[DEBUG] Found {len(epics_data.get('issues', []))} epics")
+            print(f"[DEBUG] Create response status: {create_response.status_code}")
             
-            # Prepare summary data
-            summary = {
-                "projectName": project_data.get("name"),
-                "projectKey": project_key,
-                "lastUpdated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "epics": []
-            }
+            if create_response.status_code != 201:
+                print(f"[ERROR] Failed to create blocker issue: {create_response.text}")
+                report["error"] = "Failed to create blocker issue"
+                return report
             
-            # Process each epic
-            for epic in epics_data.get("issues", []):
-                epic_key = epic.get("key")
-                epic_fields = epic.get("fields", {})
-                print(f"\n[DEBUG] Processing epic {epic_key}: {epic_fields.get('summary')}")
-                
-                # Get stories under this epic
-                stories_jql = f'project = {project_key} AND issuetype = Story AND "Epic Link" ~ "{epic_key}"'
-                print(f"[DEBUG] Stories JQL: {stories_jql}")
-                
-                stories_response = requests.get(
-                    f"{self.server_url}/rest/api/2/search",
-                    headers=self.headers,
-                    auth=self.auth,
-                    params={
-                        "jql": stories_jql,
-                        "maxResults": 100,
-                        "fields": ["summary", "status", "assignee", "priority", "updated", "customfield_10014", "issuetype"]
-                    }
-                )
-                
-                if stories_response.status_code != 200:
-                    print(f"[ERROR] Error getting stories: {stories_response.text}")
-                    continue
-                    
-                stories_data = stories_response.json()
-                print(f"[DEBUG] Found {len(stories_data.get('issues', []))} stories for epic {epic_key}")
-                
-                # Process stories
-                stories = []
-                for story in stories_data.get("issues", []):
-                    story_fields = story.get("fields", {})
-                    assignee = story_fields.get("assignee", {})
-                    
-                    stories.append({
-                        "key": story.get("key"),
-                        "summary": story_fields.get("summary"),
-                        "status": story_fields.get("status", {}).get("name"),
-                        "assignee": assignee.get("displayName") if assignee else "Unassigned",
-                        "priority": story_fields.get("priority", {}).get("name"),
-                        "updated": story_fields.get("updated")
-                    })
-                
-                # Add epic to summary
-                epic_assignee = epic_fields.get("assignee", {})
-                summary["epics"].append({
-                    "key": epic_key,
-                    "summary": epic_fields.get("summary"),
-                    "status": epic_fields.get("status", {}).get("name"),
-                    "assignee": epic_assignee.get("displayName") if epic_assignee else "Unassigned",
-                    "progress": {
-                        "total": len(stories),
-                        "completed": len([s for s in stories if s["status"] == "Done"])
-                    },
-                    "stories": stories
-                })
+            blocker_key = create_response.json()["key"]
+            report["blocker_key"] = blocker_key
+            self.key_index.add(blocker_key)
+
+            # Linking, commenting and labeling only need the blocker key, so they run side by side
+            followups = self._blocker_followups(issue_key, blocker_key, description)
+            with ThreadPoolExecutor(max_workers=len(followups)) as executor:
+                futures = [
+                    (name, expected, executor.submit(getattr(self.transport, method), url, json=data))
+                    for name, method, url, data, expected in followups
+                ]
+            for name, expected, future in futures:
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = e
+                report["steps"][name] = self._followup_outcome(name, outcome, expected)
+
+            # The blocked issue gained a comment, a link and a label
+            self.issue_cache.invalidate(issue_key)
+            return report
             
-            print("\n[DEBUG] Final summary:", summary)
-            return summary
         except Exception as e:
-            print(f"[ERROR] Error getting project summary: {str(e)}")
+            print(f"Error creating blocker: {str(e)}")
+            report["error"] = f"Error creating blocker: {str(e)}"
+            return report
+
+    def create_blockers(self, blockers):
+        """Create several blockers with one bulk create and one update per blocked issue
+
+        Each blocker is linked to its issue as part of the create itself, and
+        the comments and "blocked" label for an issue go out in a single edit.
+
+        Args:
+            blockers (list): (issue_key, description) pairs in the order they were reported
+
+        Returns:
+            list: (success, message) per blocker, in the same order
+        """
+        try:
+            print(f"\n[DEBUG] Creating {len(blockers)} blockers in bulk")
+            keys = sorted({issue_key for issue_key, _ in blockers})
+            issues = self._blocked_issues(keys)
+            projects = {key.split('-')[0] for key in issues}
+            sprint_ids = {project: self.get_current_sprint_id(project) for project in projects}
+            issuetype_ids = {project: self.get_issue_type_id(project, "Task") for project in projects}
+
+            results, payloads = self._bulk_blocker_payloads(blockers, issues, sprint_ids, issuetype_ids)
+            created = []
+            for batch in self._batches(payloads, BULK_CREATE_LIMIT):
+                response = self.transport.post(
+                    f"{self.server_url}/rest/api/3/issue/bulk",
+                    json={"issueUpdates": [issue_data for _, issue_data in batch]}
+                )
+                created.extend(self._bulk_created_keys(response, len(batch)))
+
+            updates = self._record_created_blockers(blockers, results, payloads, created)
+            with ThreadPoolExecutor(max_workers=min(len(updates), self.transport.pool_size) or 1) as executor:
+                futures = {
+                    issue_key: executor.submit(self.transport.put, f"{self.server_url}/rest/api/3/issue/{issue_key}",
+                                               json=self._blocked_issue_update(blockers, created_by_index))
+                    for issue_key, created_by_index in updates.items()
+                }
+            for issue_key, future in futures.items():
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = e
+                self._record_blocked_issue_update(issue_key, updates[issue_key], results,
+                                                  self._followup_outcome("comment+label", outcome, 204))
+                self.issue_cache.invalidate(issue_key)
+            return results
+        except Exception as e:
+            print(f"[ERROR] Error creating blockers: {str(e)}")
             traceback.print_exc()
-            return None
+            return [(False, f"Error creating blocker: {str(e)}") for _ in blockers]
 
-    def issue_exists(self, issue_key):
-        """Check if an issue exists"""
-        url = f"{self.server_url}/rest/api/3/issue/{issue_key}"
+    def _blocked_issues(self, keys):
+        """Fetch the blocked issues in one search, falling back to one lookup per issue"""
         try:
-            print(f"[DEBUG] Checking if issue exists: {issue_key}")
-            print(f"[DEBUG] URL: {url}")
-            response = requests.get(url, headers=self.headers, auth=self.auth)
-            print(f"[DEBUG] Response status: {response.status_code}")
+            return {issue["key"]: issue for issue in self.search_all(self._keys_jql(keys), ["assignee"], "warn")}
+        except Exception as e:
+            print(f"[WARNING] Batched issue lookup failed, fetching issues one by one: {str(e)}")
+            return {key: issue for key in keys if (issue := self.get_issue_details(key))}
+
+    def test_connection(self):
+        """Test the connection to Jira"""
+        try:
+            response = self.transport.get(f"{self.server_url}/rest/api/3/myself")
             if response.status_code == 200:
-                print(f"[DEBUG] Issue {issue_key} exists")
+                print("[DEBUG] Successfully connected to Jira")
+                print(f"[DEBUG] User info: {response.text}")
                 return True
             else:
-                print(f"[DEBUG] Issue {issue_key} does not exist")
+                print(f"[ERROR] Failed to connect to Jira. Status: {response.status_code}")
+                print(f"[ERROR] Response: {response.text}")
                 return False
         except Exception as e:
-            print(f"[ERROR] Error checking issue existence: {str(e)}")
-            traceback.print_exc()
+            print(f"[ERROR] Failed to connect to Jira: {e}")
             return False
 
-    def get_issue_assignee(self, issue_key):
-        """Get the assignee of an issue"""
+    def get_issue_details(self, issue_key):
+        """Get issue details including current status"""
+        print(f"\n[DEBUG] Getting details for {issue_key}...")
+        cached = self.issue_cache.get(issue_key)
+        if cached is not None:
+            print(f"[DEBUG] Issue cache hit for {issue_key}")
+            return cached
+
+        # An update that invalidates the issue while this GET is in flight must win, and a
+        # read started after the invalidation must not share the earlier GET's response
+        generation = self.issue_cache.generation(issue_key)
         url = f"{self.server_url}/rest/api/3/issue/{issue_key}"
-        response = requests.get(url, headers=self.headers, auth=self.auth)
+        try:
+            print(f"[DEBUG] Using URL: {url}")
+            response = self.transport.get(url, flight_tag=generation)
+            print(f"[DEBUG] Response status: {response.status_code}")
+            if response.status_code == 200:
+                data = response.json()
+                current_status = data['fields']['status']['name']
+                print(f"[DEBUG] Current status: {current_status}")
+                self.issue_cache.set_if_generation(issue_key, data, generation)
+                return data
+            else:
+                print(f"[ERROR] Failed to get issue: {response.status_code}")
+                if response.status_code == 404:
+                    # Deleted or moved; stop issue_exists() vouching for it
+                    self.key_index.discard(issue_key)
+                return None
+        except Exception as e:
+            print(f"[ERROR] Error getting issue details: {str(e)}")
+            return None
+
+    def update_issue_status(self, issue_key, target_status):
+        """Update issue status using transition ID"""
+        print(f"\n[DEBUG] Updating {issue_key} to {target_status}...")
+        
+        # Get current issue details
+        issue = self.get_issue_details(issue_key)
+        if not issue:
+            return False, "Could not get issue details"
+            
+        current_status = issue['fields']['status']['name']
+        if current_status == target_status:
+            print(f"[DEBUG] Issue already in {target_status} status")
+            return True, f"Issue already in {target_status} status"
+        
+        # Get transition ID, from the workflow cache when possible
+        transition_id, cached = self._get_transition_id(issue_key, issue, target_status)
+        if not transition_id:
+            print(f"[ERROR] Invalid target status: {target_status}")
+            return False, f"Invalid target status: {target_status}"
+        
+        # Execute the transition
+        url = f"{self.server_url}/rest/api/3/issue/{issue_key}/transitions"
         
-        if response.status_code == 200:
-            data = response.json()
-            assignee = data.get("fields", {}).get("assignee", {})
-            if assignee:
-                return {
-                    "accountId": assignee.get("accountId"),
-                    "displayName": assignee.get("displayName")
+        try:
+            response = self._post_transition(url, transition_id)
+            if response.status_code == 400 and cached:
+                # The workflow may have changed since the map was cached; refresh and retry once
+                print(f"[DEBUG] Cached transition {transition_id} rejected, refreshing transitions")
+                transition_id, _ = self._get_transition_id(issue_key, issue, target_status, refresh=True)
+                if not transition_id:
+                    return False, f"Invalid target status: {target_status}"
+                response = self._post_transition(url, transition_id)
+            if response.status_code == 204:
+                print(f"[DEBUG] Successfully moved {issue_key} to {target_status}")
+                self.issue_cache.invalidate(issue_key)
+                return True, f"Updated {issue_key} to {target_status}"
+            else:
+                print(f"[ERROR] Failed to update status: {response.status_code}")
+                if response.text:
+                    print(f"Response: {response.text}")
+                return False, f"Failed to update status: {response.status_code}"
+        except Exception as e:
+            print(f"[ERROR] Error updating status: {str(e)}")
+            return False, f"Error updating status: {str(e)}"
+
+    def _get_transition_id(self, issue_key, issue, target_status, refresh=False):
+        """Look up the transition to target_status, returning (transition_id, from_cache)"""
+        if refresh:
+            # The cached issue may be what went stale; key the fresh map by its current status
+            self.issue_cache.invalidate(issue_key)
+            issue = self.get_issue_details(issue_key) or issue
+        cache_key = self._transition_cache_key(issue)
+        transitions = None if refresh else self.transition_cache.get(cache_key)
+        if transitions is not None and target_status in transitions:
+            return transitions[target_status], True
+
+        response = self.transport.get(f"{self.server_url}/rest/api/3/issue/{issue_key}/transitions")
+        if response.status_code != 200:
+            return None, False
+        transitions = self._transition_map(response.json()["transitions"])
+        self.transition_cache.set(cache_key, transitions)
+        return transitions.get(target_status), False
+
+    def _post_transition(self, url, transition_id):
+        payload = {
+            "transition": {
+                "id": transition_id
+            }
+        }
+        print(f"[DEBUG] Sending transition request with data: {json.dumps(payload, indent=2)}")
+        response = self.transport.post(url, json=payload)
+        print(f"[DEBUG] Transition response status: {response.status_code}")
+        return response
+
+    # Request payloads and response parsing shared by JiraAPI and AsyncJiraAPI
+
+    @staticmethod
+    def _adf_document(text):
+        """Wrap plain text in a single-paragraph Atlassian Document Format doc"""
+        return {
+            "type": "doc",
+            "version": 1,
+            "content": [
+                {
+                    "type": "paragraph",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": text
+                        }
+                    ]
                 }
+            ]
+        }
+
+    @staticmethod
+    def _todo_tasks_payload(account_id):
+        return {
+            "jql": f'project = {os.getenv("JIRA_PROJECT_KEY")} AND status = "To Do" AND assignee = "{account_id}"',
+            "fields": ["summary", "status", "assignee"]
+        }
+
+    @staticmethod
+    def _parse_tasks(issues):
+        tasks = []
+        for issue in issues:
+            task = {
+                'key': issue['key'],
+                'summary': issue['fields']['summary'],
+                'status': issue['fields']['status']['name']
+            }
+            tasks.append(task)
+        return tasks
+
+    def _issue_data(self, project, summary, description, issue_type, assignee=None, epic_key=None,
+                    issuetype_id=None):
+        issue_data = {
+            "fields": {
+                "project": {"key": project},
+                "summary": summary,
+                "description": self._adf_document(description),
+                "issuetype": self._issuetype_field(issue_type, issuetype_id)
+            }
+        }
+
+        if assignee:
+            issue_data["fields"]["assignee"] = {"name": assignee}
+
+        # If this is a story and epic is provided, link it to the epic
+        if issue_type.lower() == "story" and epic_key:
+            issue_data["fields"]["customfield_10014"] = epic_key  # Epic link field
+
+        return issue_data
+
+    @staticmethod
+    def _issuetype_field(issue_type, issuetype_id):
+        # Fall back to the type name when the registry could not resolve an ID
+        return {"id": issuetype_id} if issuetype_id else {"name": issue_type}
+
+    @staticmethod
+    def _issue_type_index(project_data):
+        return {t["name"].lower(): t["id"] for t in project_data.get("issueTypes", [])}
+
+    @staticmethod
+    def _issue_type_rejected(response):
+        if response.status_code != 400:
+            return False
+        try:
+            return "issuetype" in response.json().get("errors", {})
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _story_summary(story):
+        story_fields = story.get("fields", {})
+        assignee = story_fields.get("assignee", {})
+        return {
+            "key": story.get("key"),
+            "summary": story_fields.get("summary"),
+            "status": story_fields.get("status", {}).get("name"),
+            "assignee": assignee.get("displayName") if assignee else "Unassigned",
+            "priority": story_fields.get("priority", {}).get("name"),
+            "updated": story_fields.get("updated")
+        }
+
+    @staticmethod
+    def _epic_summary(epic, stories):
+        epic_fields = epic.get("fields", {})
+        epic_assignee = epic_fields.get("assignee", {})
+        return {
+            "key": epic.get("key"),
+            "summary": epic_fields.get("summary"),
+            "status": epic_fields.get("status", {}).get("name"),
+            "assignee": epic_assignee.get("displayName") if epic_assignee else "Unassigned",
+            "progress": {
+                "total": len(stories),
+                "completed": len([s for s in stories if s["status"] == "Done"])
+            },
+            "stories": stories
+        }
+
+    def _blocker_issue_data(self, issue_key, description, issue, sprint_id, issuetype_id=None):
+        project_key = issue_key.split('-')[0]
+
+        # Get assignee info for better formatting
+        assignee_name = "Unassigned"
+        if issue["fields"].get("assignee"):
+            assignee_name = issue["fields"]["assignee"].get("displayName", "Unassigned")
+
+        # Format the description with markdown
+        formatted_description = f"""🚫 **Blocker Created for {issue_key}**  
+- **Issue:** {description}  
+- **Impact:** Blocking progress on {issue_key}  
+- **Assigned To:** {assignee_name}  
+- **Created On:** {datetime.now().strftime('%Y-%m-%d')}  
+
+Please update this ticket with:
+1. Root cause analysis
+2. Proposed solution
+3. Estimated time to resolution"""
+
+        issue_data = {
+            "fields": {
+                "project": {"key": project_key},
+                "summary": f"Blocker for {issue_key}: {description[:50]}{'...' if len(description) > 50 else ''}",
+                "description": self._adf_document(formatted_description),
+                "issuetype": self._issuetype_field("Task", issuetype_id),
+                "labels": ["blocked", "blocker"]
+            }
+        }
+
+        # Add sprint if available
+        if sprint_id:
+            issue_data["fields"]["customfield_10020"] = sprint_id
+
+        # Copy assignee if available
+        if issue["fields"].get("assignee"):
+            issue_data["fields"]["assignee"] = issue["fields"]["assignee"]
+
+        return issue_data
+
+    @staticmethod
+    def _blocker_link_data(issue_key, blocker_key):
+        return {
+            "type": {
+                "name": "Blocks"
+            },
+            "inwardIssue": {
+                "key": issue_key
+            },
+            "outwardIssue": {
+                "key": blocker_key
+            }
+        }
+
+    def _blocker_comment_data(self, blocker_key, description):
+        comment_text = f"""🚫 **Blocker Created:** [{blocker_key}]({self.server_url}/browse/{blocker_key})  
+- **Issue:** {description}  
+- **Created On:** {datetime.now().strftime('%Y-%m-%d')}  
+- **Status:** Blocked  
+
+This issue is blocked. Progress will resume once the blocker is resolved."""
+        return {"body": self._adf_document(comment_text)}
+
+    def _blocker_followups(self, issue_key, blocker_key, description):
+        """(name, method, url, body, expected status) of the steps that follow blocker creation"""
+        return [
+            ("link", "post", f"{self.server_url}/rest/api/3/issueLink",
+             self._blocker_link_data(issue_key, blocker_key), 201),
+            ("comment", "post", f"{self.server_url}/rest/api/3/issue/{issue_key}/comment",
+             self._blocker_comment_data(blocker_key, description), 201),
+            ("label", "put", f"{self.server_url}/rest/api/3/issue/{issue_key}",
+             {"fields": {"labels": ["blocked"]}}, 204)
+        ]
+
+    @staticmethod
+    def _followup_outcome(name, outcome, expected_status):
+        """Summarize a follow-up step's response, or the exception it raised"""
+        if isinstance(outcome, Exception):
+            print(f"[ERROR] Blocker step {name} failed: {str(outcome)}")
+            return {"ok": False, "status": None, "detail": str(outcome)}
+        ok = outcome.status_code == expected_status
+        if not ok:
+            print(f"[ERROR] Blocker step {name} failed: {outcome.text}")
+        return {"ok": ok, "status": outcome.status_code, "detail": None if ok else outcome.text}
+
+    @staticmethod
+    def _blocker_result(issue_key, report):
+        """Turn a blocker report into the (success, message) pair ScrumBot expects"""
+        if report["error"]:
+            return False, report["error"]
+        blocker_key = report["blocker_key"]
+        failed = [name for name, step in report["steps"].items() if not step["ok"]]
+        if failed:
+            # The blocker exists, so this still counts as created; say what is missing
+            return True, f"Created blocker {blocker_key} for {issue_key}, but could not complete: {', '.join(failed)}"
+        return True, f"Created blocker {blocker_key} and linked it to {issue_key}"
+
+    @staticmethod
+    def _keys_jql(keys):
+        return f'key in ({", ".join(keys)})'
+
+    def _bulk_blocker_payloads(self, blockers, issues, sprint_ids, issuetype_ids):
+        """Build the bulk create entries, failing blockers whose issue was not found up front
+
+        Returns:
+            tuple: results (per blocker, None until decided) and (blocker index, issue data) pairs
+        """
+        results = [None] * len(blockers)
+        payloads = []
+        for index, (issue_key, description) in enumerate(blockers):
+            issue = issues.get(issue_key)
+            if not issue:
+                print(f"[ERROR] Could not find issue {issue_key}")
+                results[index] = (False, f"Could not find issue {issue_key}")
+                continue
+            project_key = issue_key.split('-')[0]
+            issue_data = self._blocker_issue_data(issue_key, description, issue,
+                                                  sprint_ids.get(project_key), issuetype_ids.get(project_key))
+            # Link at creation time instead of with a separate issueLink request
+            issue_data["update"] = {"issuelinks": [{"add": {"type": {"name": "Blocks"}, "inwardIssue": {"key": issue_key}}}]}
+            payloads.append((index, issue_data))
+        return results, payloads
+
+    @staticmethod
+    def _bulk_created_keys(response, count):
+        """Created key per bulk entry, None for entries Jira rejected"""
+        if response.status_code not in (200, 201):
+            print(f"[ERROR] Bulk create failed: {response.text}")
+            return [None] * count
+        data = response.json()
+        failed = {error.get("failedElementNumber") for error in data.get("errors", [])}
+        for error in data.get("errors", []):
+            print(f"[ERROR] Bulk create rejected entry {error.get('failedElementNumber')}: {error.get('elementErrors')}")
+        # Jira lists the created issues in request order, skipping the failed entries
+        created = iter(issue["key"] for issue in data.get("issues", []))
+        return [None if number in failed else next(created, None) for number in range(count)]
+
+    def _record_created_blockers(self, blockers, results, payloads, created):
+        """Fill in failed creates and group the created blockers by the issue they block
+
+        Returns:
+            dict: issue key -> {blocker index: created blocker key}
+        """
+        updates = {}
+        for (index, _), blocker_key in zip(payloads, created):
+            if not blocker_key:
+                results[index] = (False, "Failed to create blocker issue")
+                continue
+            updates.setdefault(blockers[index][0], {})[index] = blocker_key
+            self.key_index.add(blocker_key)
+        return updates
+
+    def _blocked_issue_update(self, blockers, created_by_index):
+        """One edit adding the "blocked" label and a comment for each of the issue's new blockers"""
+        return {
+            "update": {
+                "labels": [{"add": "blocked"}],
+                "comment": [
+                    {"add": self._blocker_comment_data(blocker_key, blockers[index][1])}
+                    for index, blocker_key in created_by_index.items()
+                ]
+            }
+        }
+
+    @staticmethod
+    def _record_blocked_issue_update(issue_key, created_by_index, results, outcome):
+        """Report the issue's blockers as created, noting when its comment/label edit failed"""
+        for index, blocker_key in created_by_index.items():
+            if outcome["ok"]:
+                results[index] = (True, f"Created blocker {blocker_key} and linked it to {issue_key}")
+            else:
+                results[index] = (True, f"Created blocker {blocker_key} for {issue_key}, but could not complete: comment, label")
+
+    @staticmethod
+    def _assignee_of(issue):
+        assignee = issue.get("fields", {}).get("assignee", {}) if issue else None
+        if assignee:
+            return {
+                "accountId": assignee.get("accountId"),
+                "displayName": assignee.get("displayName")
+            }
         return None
 
-    def get_current_sprint_id(self):
-        """Get the ID of the current active sprint"""
+    @staticmethod
+    def _transition_map(transitions):
+        transition_map = {}
+        for t in transitions:
+            transition_map.setdefault(t['name'], t['id'])
+        return transition_map
+
+    @staticmethod
+    def _transition_cache_key(issue):
+        """Transitions depend on the workflow state: (project, issue type, from-status)"""
+        fields = issue.get("fields", {})
+        project = (fields.get("project") or {}).get("key") or issue.get("key", "").split('-')[0]
+        issue_type = (fields.get("issuetype") or {}).get("name")
+        return project, issue_type, fields["status"]["name"]
+
+class AsyncJiraAPI(JiraAPI):
+    """asyncio Jira client with the same surface as JiraAPI.
+
+    Every public method is a coroutine, so Quart handlers can await Jira round
+    trips instead of blocking the event loop. Payload building and response
+    parsing are shared with JiraAPI.
+    """
+    transport_class = AsyncJiraTransport
+
+    async def close(self):
+        """Close the pooled Jira connections"""
+        await self.transport.close()
+
+    async def warm_up(self, project_key):
+        """Preload slow-changing project metadata so the first standup skips discovery calls"""
+        print(f"[DEBUG] Warming Jira caches for project {project_key}")
+        await asyncio.gather(
+            self.get_current_sprint_id(project_key),
+            self.get_issue_type_id(project_key, "Task"),
+            self.load_assignable_users(project_key),
+            self.load_issue_keys(project_key)
+        )
+
+    async def get_account_id(self, username):
+        """Get the account ID for a username or email, served from the user directory when known"""
+        print(f"[DEBUG] Getting account ID for username: {username}")
+        account_id = self.user_cache.get(self._user_key(username), MISSING)
+        if account_id is not MISSING:
+            print(f"[DEBUG] Account ID from user directory: {account_id}")
+            return account_id
         try:
-            board_url = f"{self.server_url}/rest/agile/1.0/board"
-            boards = requests.get(
-                board_url,
-                headers=self.headers,
-                auth=self.auth
-            ).json()["values"]
-            
-            if not boards:
+            url = f"{self.server_url}/rest/api/3/user/search"
+            response = await self.transport.get(url, params={"query": username})
+            print(f"[DEBUG] Response status: {response.status_code}")
+
+            if response.status_code == 200:
+                return self._remember_account_id(username, response.json())
+            print("[DEBUG] No account ID found")
+            return None
+        except Exception as e:
+            print(f"[ERROR] Error getting account ID: {str(e)}")
+            traceback.print_exc()
+            return None
+
+    async def load_assignable_users(self, project_key):
+        """Bulk-load the project's assignable users into the user directory"""
+        url = f"{self.server_url}/rest/api/3/user/assignable/search"
+        users = []
+        try:
+            while True:
+                params = {"project": project_key, "startAt": len(users), "maxResults": USER_PAGE_SIZE}
+                response = await self.transport.get(url, params=params)
+                if response.status_code != 200:
+                    print(f"[ERROR] Failed to load assignable users: {response.text}")
+                    break
+                page = response.json()
+                users.extend(page)
+                if len(page) < USER_PAGE_SIZE:
+                    break
+        except Exception as e:
+            print(f"[ERROR] Error loading assignable users: {str(e)}")
+        self._index_users(users)
+        return len(users)
+
+    async def get_todo_tasks(self, assignee):
+        """Get TODO tasks for the given assignee"""
+        print("[DEBUG] Fetching TODO tasks...")
+        account_id = await self.get_account_id(assignee)
+        if not account_id:
+            print("[ERROR] Could not find account ID")
+            return []
+
+        try:
+            payload = self._todo_tasks_payload(account_id)
+            tasks = self._parse_tasks([issue async for issue in self.iter_search(**payload)])
+            print(f"[DEBUG] Found {len(tasks)} TODO tasks")
+            return tasks
+        except Exception as e:
+            print(f"[ERROR] Error fetching TODO tasks: {str(e)}")
+            traceback.print_exc()
+            return []
+
+    async def create_issue(self, project, summary, description, issue_type, assignee=None, epic_key=None):
+        """Create a new issue in Jira"""
+        try:
+            response = await self._post_issue(
+                project,
+                issue_type,
+                lambda issuetype_id: self._issue_data(
+                    project, summary, description, issue_type, assignee, epic_key, issuetype_id
+                )
+            )
+
+            if response.status_code == 201:
+                issue_key = response.json()["key"]
+                self.key_index.add(issue_key)
+                print(f"[DEBUG] Created issue: {issue_key}")
+                return True, issue_key
+            else:
+                print(f"[ERROR] Failed to create issue: {response.text}")
+                return False, f"API Error: {response.text}"
+
+        except Exception as e:
+            print(f"[ERROR] Error creating issue: {str(e)}")
+            return False, str(e)
+
+    async def get_issue_type_id(self, project, issue_type):
+        """Resolve an issue type name to its ID through the per-project issue-type registry"""
+        issue_types = self.issue_type_cache.get(project)
+        if issue_types is None:
+            try:
+                response = await self.transport.get(f"{self.server_url}/rest/api/3/project/{project}")
+                if response.status_code != 200:
+                    print(f"[ERROR] Failed to load issue types: {response.status_code}")
+                    return None
+                issue_types = self._issue_type_index(response.json())
+                self.issue_type_cache.set(project, issue_types)
+            except Exception as e:
+                print(f"[ERROR] Error loading issue types: {str(e)}")
                 return None
-                
-            board_id = boards[0]["id"]  # Use the first board
-            
-            # Get active sprints for this board
-            sprints_url = f"{self.server_url}/rest/agile/1.0/board/{board_id}/sprint?state=active"
-            sprints = requests.get(
-                sprints_url,
-                headers=self.headers,
-                auth=self.auth
-            ).json()["values"]
-            
-            if sprints:
-                return sprints[0]["id"]  # Return the ID of the first active sprint
+        return issue_types.get(issue_type.lower())
+
+    async def _post_issue(self, project, issue_type, build_issue_data):
+        """POST a new issue whose type ID comes from the issue-type registry"""
+        create_url = f"{self.server_url}/rest/api/3/issue"
+        issuetype_id = await self.get_issue_type_id(project, issue_type)
+        response = await self.transport.post(create_url, json=build_issue_data(issuetype_id))
+        if issuetype_id and self._issue_type_rejected(response):
+            print(f"[DEBUG] Jira rejected issue type ID {issuetype_id}, reloading issue types for {project}")
+            self.issue_type_cache.invalidate(project)
+            issuetype_id = await self.get_issue_type_id(project, issue_type)
+            response = await self.transport.post(create_url, json=build_issue_data(issuetype_id))
+        return response
+
+    async def get_epics(self, project_key):
+        """Get list of epics in the project"""
+        try:
+            jql = f'project = {project_key} AND issuetype = Epic ORDER BY created DESC'
+            return True, await self.search_all(jql, ["summary", "customfield_10014"])  # Epic Name field
+
+        except Exception as e:
+            print(f"[ERROR] Error getting epics: {str(e)}")
+            return False, []
+
+    async def get_project_summary(self, project_key="SCRUM"):
+        """Get a comprehensive project summary including epics, stories, and tasks."""
+        try:
+            project_response = await self.transport.get(f"{self.server_url}/rest/api/2/project/{project_key}")
+            project_data = project_response.json()
+
+            epic_jql = f'project = {project_key} AND issuetype = Epic ORDER BY created DESC'
+            epics = await self.search_all(epic_jql, SUMMARY_EPIC_FIELDS)
+            print(f"\n[DEBUG] Found {len(epics)} epics")
+
+            # Story batches are independent, so they are searched concurrently
+            batches = self._batches([epic["key"] for epic in epics], SUMMARY_EPIC_BATCH_SIZE)
+            results = await asyncio.gather(*(
+                self.search_all(self._stories_jql(project_key, epic_keys), SUMMARY_STORY_FIELDS)
+                for epic_keys in batches
+            ))
+            stories = [story for batch in results for story in batch]
+
+            return self._project_summary(project_key, project_data, epics, stories)
+        except Exception as e:
+            print(f"[ERROR] Error getting project summary: {str(e)}")
+            traceback.print_exc()
             return None
-            
+
+    def iter_search(self, jql, fields=None, page_size=DEFAULT_PAGE_SIZE, read_ahead=False, validate_query=None):
+        """Stream the issues matching a JQL query page by page, as an async iterator"""
+        return aiter_search(self.transport, jql, fields, page_size, read_ahead, validate_query)
+
+    async def search_all(self, jql, fields=None, validate_query=None):
+        """Run a JQL search and collect every matching issue"""
+        return [issue async for issue in self.iter_search(jql, fields, read_ahead=True, validate_query=validate_query)]
+
+    async def issue_exists(self, issue_key):
+        """Check if an issue exists, asking Jira only for keys missing from the key index"""
+        print(f"[DEBUG] Checking if issue exists: {issue_key}")
+        if issue_key in self.key_index:
+            return True
+        exists = await self.get_issue_details(issue_key) is not None
+        if exists:
+            self.key_index.add(issue_key)
+        return exists
+
+    async def existing_issue_keys(self, issue_keys):
+        """The subset of issue_keys that exist, checking the key index first and Jira in one search"""
+        unknown = [key for key in issue_keys if key not in self.key_index]
+        found = {key for key in issue_keys if key not in unknown}
+        if unknown:
+            try:
+                async for issue in self.iter_search(self._keys_jql(unknown), ["key"], validate_query="warn"):
+                    self.key_index.add(issue["key"])
+                    found.add(issue["key"])
+            except Exception as e:
+                print(f"[ERROR] Error checking issue keys: {str(e)}")
+        return found
+
+    async def update_issue_statuses(self, updates):
+        """Apply several status updates concurrently"""
+        outcomes = await asyncio.gather(
+            *(self.update_issue_status(key, status) for key, status in updates),
+            return_exceptions=True
+        )
+        return [(False, str(outcome)) if isinstance(outcome, Exception) else outcome for outcome in outcomes]
+
+    async def load_issue_keys(self, project_key):
+        """Seed the key index from a key-only search over the whole project"""
+        try:
+            keys = [issue["key"] async for issue in self.iter_search(f"project = {project_key}", ["key"], read_ahead=True)]
+            count = self.key_index.load(project_key, keys)
+            print(f"[DEBUG] Indexed {count} issue keys for {project_key}")
+            return count
+        except Exception as e:
+            print(f"[ERROR] Error loading issue keys: {str(e)}")
+            return 0
+
+    async def get_issue_assignee(self, issue_key):
+        """Get the assignee of an issue"""
+        return self._assignee_of(await self.get_issue_details(issue_key))
+
+    async def get_current_sprint_id(self, project_key=None):
+        """Get the ID of the current active sprint"""
+        try:
+            board_id = self.board_cache.get(project_key, MISSING)
+            if board_id is MISSING:
+                board_url = f"{self.server_url}/rest/agile/1.0/board"
+                boards = (await self.transport.get(board_url, params=self._board_params(project_key))).json()["values"]
+                board_id = self._cache_board(project_key, boards)
+
+            if board_id is None:
+                return None
+
+            sprint_id = self.sprint_cache.get(board_id, MISSING)
+            if sprint_id is MISSING:
+                sprints_url = f"{self.server_url}/rest/agile/1.0/board/{board_id}/sprint?state=active"
+                sprints = (await self.transport.get(sprints_url)).json()["values"]
+                sprint_id = self._cache_sprint(board_id, sprints)
+            return sprint_id
+
         except Exception as e:
             print(f"Error getting current sprint: {str(e)}")
             return None
 
-    def create_blocker(self, issue_key, description):
+    async def create_blocker(self, issue_key, description):
         """Create a blocker relationship for the issue"""
+        return self._blocker_result(issue_key, await self.create_blocker_report(issue_key, description))
+
+    async def create_blocker_report(self, issue_key, description):
+        """Create a blocker issue, then link, comment and label concurrently"""
+        report = {"blocker_key": None, "error": None, "steps": {}}
         try:
             print(f"\n[DEBUG] Starting blocker creation for issue: {issue_key}")
-            
-            # First get the issue details to ensure it exists
-            issue = self.get_issue_details(issue_key)
+            project_key = issue_key.split('-')[0]
+
+            issue, sprint_id = await asyncio.gather(
+                self.get_issue_details(issue_key),
+                self.get_current_sprint_id(project_key)
+            )
             if not issue:
                 print(f"[ERROR] Could not find issue {issue_key}")
-                return False, f"Could not find issue {issue_key}"
-
-            print(f"[DEBUG] Found issue {issue_key}: {json.dumps(issue, indent=2)}")
-
-            # Get the current sprint ID
-            sprint_id = self.get_current_sprint_id()
+                report["error"] = f"Could not find issue {issue_key}"
+                return report
             if not sprint_id:
                 print("[WARNING] Could not determine current sprint ID")
 
-            # Create a new issue for the blocker
-            create_url = f"{self.server_url}/rest/api/3/issue"
-            project_key = issue_key.split('-')[0]
-            
-            # Get assignee info for better formatting
-            assignee_name = "Unassigned"
-            if issue["fields"].get("assignee"):
-                assignee_name = issue["fields"]["assignee"].get("displayName", "Unassigned")
-            
-            # Format the description with markdown
-            formatted_description = f"""🚫 **Blocker Created for {issue_key}**  
-- **Issue:** {description}  
-- **Impact:** Blocking progress on {issue_key}  
-- **Assigned To:** {assignee_name}  
-- **Created On:** {datetime.now().strftime('%Y-%m-%d')}  
-
-Please update this ticket with:
-1. Root cause analysis
-2. Proposed solution
-3. Estimated time to resolution"""
-
-            issue_data = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": f"Blocker for {issue_key}: {description[:50]}{'...' if len(description) > 50 else ''}",
-                    "description": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": formatted_description
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    "issuetype": {"name": "Task"},
-                    "labels": ["blocked", "blocker"]
-                }
-            }
-            
-            # Add sprint if available
-            if sprint_id:
-                issue_data["fields"]["customfield_10020"] = sprint_id
-            
-            # Copy assignee if available
-            if issue["fields"].get("assignee"):
-                issue_data["fields"]["assignee"] = issue["fields"]["assignee"]
-            
-            print(f"[DEBUG] Sending create request with data: {json.dumps(issue_data, indent=2)}")
-            
-            create_response = requests.post(
-                create_url,
-                headers=self.headers,
-                auth=self.auth,
-                json=issue_data
+            create_response = await self._post_issue(
+                project_key,
+                "Task",
+                lambda issuetype_id: self._blocker_issue_data(issue_key, description, issue, sprint_id, issuetype_id)
             )
-            
             print(f"[DEBUG] Create response status: {create_response.status_code}")
-            print(f"[DEBUG] Create response body: {create_response.text}")
-            
+
             if create_response.status_code != 201:
                 print(f"[ERROR] Failed to create blocker issue: {create_response.text}")
-                return False, "Failed to create blocker issue"
-            
+                report["error"] = "Failed to create blocker issue"
+                return report
+
             blocker_key = create_response.json()["key"]
-            
-            # Create the "is blocked by" relationship
-            link_url = f"{self.server_url}/rest/api/3/issueLink"
-            link_data = {
-                "type": {
-                    "name": "Blocks"
-                },
-                "inwardIssue": {
-                    "key": issue_key
-                },
-                "outwardIssue": {
-                    "key": blocker_key
-                }
-            }
-            
-            print(f"[DEBUG] Sending link request with data: {json.dumps(link_data, indent=2)}")
-            
-            link_response = requests.post(
-                link_url,
-                headers=self.headers,
-                auth=self.auth,
-                json=link_data
+            report["blocker_key"] = blocker_key
+            self.key_index.add(blocker_key)
+
+            followups = self._blocker_followups(issue_key, blocker_key, description)
+            outcomes = await asyncio.gather(
+                *(getattr(self.transport, method)(url, json=data) for _, method, url, data, _ in followups),
+                return_exceptions=True
             )
-            
-            print(f"[DEBUG] Link response status: {link_response.status_code}")
-            print(f"[DEBUG] Link response body: {link_response.text}")
-            
-            if link_response.status_code != 201:
-                print(f"[ERROR] Failed to create issue link: {link_response.text}")
-            
-            # Create a structured comment on the blocked issue
-            comment_url = f"{self.server_url}/rest/api/3/issue/{issue_key}/comment"
-            comment_text = f"""🚫 **Blocker Created:** [{blocker_key}]({self.server_url}/browse/{blocker_key})  
-- **Issue:** {description}  
-- **Created On:** {datetime.now().strftime('%Y-%m-%d')}  
-- **Status:** Blocked  
+            for (name, _, _, _, expected), outcome in zip(followups, outcomes):
+                report["steps"][name] = self._followup_outcome(name, outcome, expected)
 
-This issue is blocked. Progress will resume once the blocker is resolved."""
+            # The blocked issue gained a comment, a link and a label
+            self.issue_cache.invalidate(issue_key)
+            return report
 
-            comment_data = {
-                "body": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": comment_text
-                                }
-                            ]
-                        }
-                    ]
-                }
-            }
-            
-            print(f"[DEBUG] Sending comment request with data: {json.dumps(comment_data, indent=2)}")
-            
-            comment_response = requests.post(
-                comment_url,
-                headers=self.headers,
-                auth=self.auth,
-                json=comment_data
-            )
-            
-            print(f"[DEBUG] Comment response status: {comment_response.status_code}")
-            print(f"[DEBUG] Comment response body: {comment_response.text}")
-            
-            if comment_response.status_code != 201:
-                print(f"[ERROR] Failed to add blocker comment: {comment_response.text}")
-            
-            # Update the blocked issue with the blocked label
-            update_url = f"{self.server_url}/rest/api/3/issue/{issue_key}"
-            update_data = {
-                "fields": {
-                    "labels": ["blocked"]
-                }
-            }
-            
-            update_response = requests.put(
-                update_url,
-                headers=self.headers,
-                auth=self.auth,
-                json=update_data
-            )
-            
-            if update_response.status_code != 204:
-                print(f"Failed to update issue with blocked label: {update_response.text}")
-            
-            return True, f"Created blocker {blocker_key} and linked it to {issue_key}"
-            
         except Exception as e:
             print(f"Error creating blocker: {str(e)}")
-            return False, f"Error creating blocker: {str(e)}"
+            report["error"] = f"Error creating blocker: {str(e)}"
+            return report
 
-    def test_connection(self):
-        """Test the connection to Jira"""
+    async def create_blockers(self, blockers):
+        """Create several blockers with one bulk create and one update per blocked issue"""
         try:
-            response = requests.get(
-                f"{self.server_url}/rest/api/3/myself",
-                headers=self.headers,
-                auth=self.auth
+            print(f"\n[DEBUG] Creating {len(blockers)} blockers in bulk")
+            keys = sorted({issue_key for issue_key, _ in blockers})
+            issues = await self._blocked_issues(keys)
+            projects = sorted({key.split('-')[0] for key in issues})
+            sprints, issuetypes = await asyncio.gather(
+                asyncio.gather(*(self.get_current_sprint_id(project) for project in projects)),
+                asyncio.gather(*(self.get_issue_type_id(project, "Task") for project in projects))
             )
+            sprint_ids, issuetype_ids = dict(zip(projects, sprints)), dict(zip(projects, issuetypes))
+
+            results, payloads = self._bulk_blocker_payloads(blockers, issues, sprint_ids, issuetype_ids)
+            batches = self._batches(payloads, BULK_CREATE_LIMIT)
+            bulk_responses = await asyncio.gather(*(
+                self.transport.post(
+                    f"{self.server_url}/rest/api/3/issue/bulk",
+                    json={"issueUpdates": [issue_data for _, issue_data in batch]}
+                )
+                for batch in batches
+            ))
+            created = []
+            for batch, response in zip(batches, bulk_responses):
+                created.extend(self._bulk_created_keys(response, len(batch)))
+
+            updates = self._record_created_blockers(blockers, results, payloads, created)
+            issue_keys = list(updates)
+            outcomes = await asyncio.gather(*(
+                self.transport.put(f"{self.server_url}/rest/api/3/issue/{issue_key}",
+                                   json=self._blocked_issue_update(blockers, updates[issue_key]))
+                for issue_key in issue_keys
+            ), return_exceptions=True)
+            for issue_key, outcome in zip(issue_keys, outcomes):
+                self._record_blocked_issue_update(issue_key, updates[issue_key], results,
+                                                  self._followup_outcome("comment+label", outcome, 204))
+                self.issue_cache.invalidate(issue_key)
+            return results
+        except Exception as e:
+            print(f"[ERROR] Error creating blockers: {str(e)}")
+            traceback.print_exc()
+            return [(False, f"Error creating blocker: {str(e)}") for _ in blockers]
+
+    async def _blocked_issues(self, keys):
+        """Fetch the blocked issues in one search, falling back to one lookup per issue"""
+        try:
+            return {issue["key"]: issue for issue in await self.search_all(self._keys_jql(keys), ["assignee"], "warn")}
+        except Exception as e:
+            print(f"[WARNING] Batched issue lookup failed, fetching issues one by one: {str(e)}")
+            found = await asyncio.gather(*(self.get_issue_details(key) for key in keys))
+            return {key: issue for key, issue in zip(keys, found) if issue}
+
+    async def test_connection(self):
+        """Test the connection to Jira"""
+        try:
+            response = await self.transport.get(f"{self.server_url}/rest/api/3/myself")
             if response.status_code == 200:
                 print("[DEBUG] Successfully connected to Jira")
-                print(f"[DEBUG] User info: {response.text}")
                 return True
             else:
                 print(f"[ERROR] Failed to connect to Jira. Status: {response.status_code}")
-                print(f"[ERROR] Response: {response.text}")
                 return False
         except Exception as e:
             print(f"[ERROR] Failed to connect to Jira: {e}")
             return False
 
-    def get_issue_details(self, issue_key):
+    async def get_issue_details(self, issue_key):
         """Get issue details including current status"""
         print(f"\n[DEBUG] Getting details for {issue_key}...")
-        url = f"{self.server_url}/rest/api/3/issue/{issue_key}"
+        cached = self.issue_cache.get(issue_key)
+        if cached is not None:
+            print(f"[DEBUG] Issue cache hit for {issue_key}")
+            return cached
+
+        # An update that invalidates the issue while this GET is in flight must win, and a
+        # read started after the invalidation must not share the earlier GET's response
+        generation = self.issue_cache.generation(issue_key)
         try:
-            print(f"[DEBUG] Using URL: {url}")
-            response = requests.get(url, headers=self.headers, auth=self.auth)
+            response = await self.transport.get(f"{self.server_url}/rest/api/3/issue/{issue_key}",
+                                                flight_tag=generation)
             print(f"[DEBUG] Response status: {response.status_code}")
             if response.status_code == 200:
                 data = response.json()
-                current_status = data['fields']['status']['name']
-                print(f"[DEBUG] Current status: {current_status}")
+                self.issue_cache.set_if_generation(issue_key, data, generation)
                 return data
             else:
                 print(f"[ERROR] Failed to get issue: {response.status_code}")
+                if response.status_code == 404:
+                    # Deleted or moved; stop issue_exists() vouching for it
+                    self.key_index.discard(issue_key)
                 return None
         except Exception as e:
             print(f"[ERROR] Error getting issue details: {str(e)}")
             return None
 
-    def update_issue_status(self, issue_key, target_status):
+    async def update_issue_status(self, issue_key, target_status):
         """Update issue status using transition ID"""
         print(f"\n[DEBUG] Updating {issue_key} to {target_status}...")
-        
-        # Get current issue details
-        issue = self.get_issue_details(issue_key)
+
+        issue = await self.get_issue_details(issue_key)
         if not issue:
             return False, "Could not get issue details"
-            
+
         current_status = issue['fields']['status']['name']
         if current_status == target_status:
             print(f"[DEBUG] Issue already in {target_status} status")
             return True, f"Issue already in {target_status} status"
-        
-        # Get transition ID
-        transition_id = None
-        response = requests.get(
-            f"{self.server_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=self.headers,
-            auth=self.auth
-        )
-        if response.status_code == 200:
-            transitions = response.json()["transitions"]
-            for t in transitions:
-                if t['name'] == target_status:
-                    transition_id = t['id']
-                    break
-        
+
+        transition_id, cached = await self._get_transition_id(issue_key, issue, target_status)
         if not transition_id:
             print(f"[ERROR] Invalid target status: {target_status}")
             return False, f"Invalid target status: {target_status}"
-        
-        # Execute the transition
+
         url = f"{self.server_url}/rest/api/3/issue/{issue_key}/transitions"
-        payload = {
-            "transition": {
-                "id": transition_id
-            }
-        }
-        
         try:
-            print(f"[DEBUG] Sending transition request with data: {json.dumps(payload, indent=2)}")
-            response = requests.post(url, headers=self.headers, auth=self.auth, json=payload)
+            response = await self.transport.post(url, json={"transition": {"id": transition_id}})
+            if response.status_code == 400 and cached:
+                # The workflow may have changed since the map was cached; refresh and retry once
+                transition_id, _ = await self._get_transition_id(issue_key, issue, target_status, refresh=True)
+                if not transition_id:
+                    return False, f"Invalid target status: {target_status}"
+                response = await self.transport.post(url, json={"transition": {"id": transition_id}})
             print(f"[DEBUG] Transition response status: {response.status_code}")
             if response.status_code == 204:
                 print(f"[DEBUG] Successfully moved {issue_key} to {target_status}")
+                self.issue_cache.invalidate(issue_key)
                 return True, f"Updated {issue_key} to {target_status}"
             else:
                 print(f"[ERROR] Failed to update status: {response.status_code}")
-                if response.text:
-                    print(f"Response: {response.text}")
                 return False, f"Failed to update status: {response.status_code}"
         except Exception as e:
             print(f"[ERROR] Error updating status: {str(e)}")
             return False, f"Error updating status: {str(e)}"
 
+    async def _get_transition_id(self, issue_key, issue, target_status, refresh=False):
+        """Look up the transition to target_status, returning (transition_id, from_cache)"""
+        if refresh:
+            # The cached issue may be what went stale; key the fresh map by its current status
+            self.issue_cache.invalidate(issue_key)
+            issue = await self.get_issue_details(issue_key) or issue
+        cache_key = self._transition_cache_key(issue)
+        transitions = None if refresh else self.transition_cache.get(cache_key)
+        if transitions is not None and target_status in transitions:
+            return transitions[target_status], True
+
+        response = await self.transport.get(f"{self.server_url}/rest/api/3/issue/{issue_key}/transitions")
+        if response.status_code != 200:
+            return None, False
+        transitions = self._transition_map(response.json()["transitions"])
+        self.transition_cache.set(cache_key, transitions)
+        return transitions.get(target_status), False
+
+def _state_field(name):
+    """Property that keeps a ScrumBot attribute in its ConversationState"""
+    return property(lambda self: getattr(self.state, name),
+                    lambda self, value: setattr(self.state, name, value))
+
 class ScrumBot:
-    def __init__(self, jira):
+    mutation_ids = _state_field("mutation_ids")
+    current_state = _state_field("current_state")
+    new_issue_data = _state_field("new_issue_data")
+    scrum_data = _state_field("scrum_data")
+    issue_creation_data = _state_field("issue_creation_data")
+    issue_creation_state = _state_field("issue_creation_state")
+    pending_blockers = _state_field("pending_blockers")
+    standup_report = _state_field("standup_report")
+    standup_field = _state_field("standup_field")
+    username = _state_field("username")
+
+    def __init__(self, jira, mutations=None):
         self.jira = jira
+        self.mutations = mutations  # Optional MutationQueue; Jira updates then run in the background
         self.server_url = JIRA_BASE_URL
         self.auth = (JIRA_EMAIL, JIRA_API_KEY)
         self.headers = {
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
-        self.current_state = "greeting"
-        self.new_issue_data = {}  # Store new issue details
-        self.scrum_data = {
-            "yesterday": None,
-            "today": None,
-            "blockers": []
-        }
-        self.issue_creation_data = {
-            "summary": None,
-            "description": None,
-            "issue_type": None,
-            "priority": None,
-            "assignee": None
-        }
-        self.issue_creation_state = None  # Track which field we're collecting
-        self.username = "meghanathink41"  # Default username for getting tasks
-        
+        # Per-user conversation; current_state, scrum_data etc. below read and write it
+        self.state = ConversationState()
+
+    def conversation_state(self):
+        """The per-user part of the bot, i.e. everything except the shared Jira client"""
+        return self.state.as_dict()
+
+    def export_state(self):
+        """Serialize the conversation so another worker can continue it"""
+        return self.state.to_bytes()
+
+    def import_state(self, data):
+        """Continue a conversation serialized by export_state"""
+        self.state = ConversationState.from_bytes(data)
+
+    def _run_jira_steps(self, steps):
+        """Drive a step generator, answering each Jira call it yields synchronously.
+
+        The conversation logic is written once as generators that yield
+        (method_name, args) tuples for the Jira client and receive the result
+        back, so the same code serves the blocking and the asyncio entry points.
+        """
+        result, error = None, None
+        while True:
+            try:
+                method, args = steps.throw(error) if error else steps.send(result)
+            except StopIteration as done:
+                return done.value
+            try:
+                result, error = getattr(self.jira, method)(*args), None
+            except Exception as e:
+                result, error = None, e
+
+    async def _run_jira_steps_async(self, steps):
+        """Drive a step generator, awaiting each Jira call on an AsyncJiraAPI
+
+        With a mutation queue, Jira updates are queued instead of awaited and
+        the step receives a (None, "Queued as <id>") placeholder at once,
+        which is neither a success nor a failure.
+        """
+        result, error = None, None
+        while True:
+            try:
+                method, args = steps.throw(error) if error else steps.send(result)
+            except StopIteration as done:
+                return done.value
+            if self.mutations is not None and method in MUTATIONS:
+                mutation_id = self.mutations.submit(method, args)
+                self.mutation_ids = (self.mutation_ids + [mutation_id])[-SESSION_MUTATION_HISTORY:]
+                result, error = queued_result(method, args, mutation_id), None
+                continue
+            try:
+                result, error = await getattr(self.jira, method)(*args), None
+            except Exception as e:
+                result, error = None, e
+
     def get_todo_tasks(self, assignee):
         """Get TODO tasks for the given assignee"""
-        print("[DEBUG] Fetching TODO tasks...")
-        print(f"[DEBUG] Server URL: {self.server_url}")
-        print(f"[DEBUG] Headers: {self.headers}")
-        
-        url = f"{self.server_url}/rest/api/3/search"
-        
-        # First get the account ID
-        account_id = self.jira.get_account_id(assignee)
-        if not account_id:
-            print("[ERROR] Could not find account ID")
-            return []
-            
-        print(f"[DEBUG] Found account ID: {account_id}")
-        
-        try:
-            payload = {
-                "jql": f'project = {os.getenv("JIRA_PROJECT_KEY")} AND status = "To Do" AND assignee = "{account_id}"',
-                "fields": ["summary", "status", "assignee"]
-            }
-            print(f"[DEBUG] Request payload: {json.dumps(payload, indent=2)}")
-            
-            response = requests.post(
-                url,
-                headers=self.headers,
-                auth=self.auth,
-                json=payload
-            )
-            print(f"[DEBUG] Response status: {response.status_code}")
-            print(f"[DEBUG] Response content: {response.text}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                tasks = []
-                for issue in data.get('issues', []):
-                    task = {
-                        'key': issue['key'],
-                        'summary': issue['fields']['summary'],
-                        'status': issue['fields']['status']['name']
-                    }
-                    tasks.append(task)
-                print(f"[DEBUG] Found {len(tasks)} TODO tasks")
-                return tasks
-            else:
-                print(f"[ERROR] Failed to fetch TODO tasks: {response.status_code}")
-                return []
-        except Exception as e:
-            print(f"[ERROR] Error fetching TODO tasks: {str(e)}")
-            traceback.print_exc()
-            return []
-        
+        # Go through the Jira client so the search reuses its pooled connections
+        return self.jira.get_todo_tasks(assignee)
+
+    async def get_todo_tasks_async(self, assignee):
+        """Get TODO tasks for the given assignee without blocking the event loop"""
+        return await self.jira.get_todo_tasks(assignee)
+
     def start_conversation(self):
         """Start a new conversation with the bot
         
         Returns:
             dict: Contains message and speech_segments
         """
+        return self._run_jira_steps(self._start_conversation_steps())
+
+    async def start_conversation_async(self):
+        """Async variant of start_conversation for use with AsyncJiraAPI"""
+        return await self._run_jira_steps_async(self._start_conversation_steps())
+
+    def _start_conversation_steps(self):
         self.current_state = "greeting"
-        tasks = self.get_todo_tasks(self.username)
+        self.standup_report = empty_report()
+        self.standup_field = "yesterday"
+        tasks = yield ("get_todo_tasks", (self.username,))
         
         if tasks:
             task_list = []
@@ -895,49 +1672,73 @@ class ScrumBot:
 
     def extract_jira_key(self, text):
         """Extract Jira issue key from text."""
+        return self._run_jira_steps(self._extract_jira_key_steps(text))
+
+    async def extract_jira_key_async(self, text):
+        """Async variant of extract_jira_key for use with AsyncJiraAPI"""
+        return await self._run_jira_steps_async(self._extract_jira_key_steps(text))
+
+    def extract_jira_keys(self, text):
+        """Extract every existing Jira key in text, each with the clause it was mentioned in"""
+        return self._run_jira_steps(self._extract_jira_keys_steps(text))
+
+    async def extract_jira_keys_async(self, text):
+        """Async variant of extract_jira_keys for use with AsyncJiraAPI"""
+        return await self._run_jira_steps_async(self._extract_jira_keys_steps(text))
+
+    def _extract_jira_keys_steps(self, text):
+        try:
+            mentions = [(f"{os.getenv('JIRA_PROJECT_KEY')}-{number}", phrase) for number, phrase in key_mentions(text)]
+            print(f"[DEBUG] Mentioned issue keys: {mentions}")
+            if not mentions:
+                return []
+            # All candidates are validated together instead of one issue_exists call each
+            existing = yield ("existing_issue_keys", ([key for key, _ in mentions],))
+            return [(key, phrase) for key, phrase in mentions if key in existing]
+        except Exception as e:
+            print(f"[ERROR] Error extracting Jira keys: {str(e)}")
+            traceback.print_exc()
+            return []
+
+    def _status_updates(self, mentions, text):
+        """Target status per mentioned key: its own clause first, then the whole answer"""
+        updates = []
+        for issue_key, phrase in mentions:
+            status = self.determine_status(phrase)
+            if status == ScrumStatus.TODO:
+                status = self.determine_status(text)
+            updates.append((issue_key, status))
+        return updates
+
+    def _apply_status_updates_steps(self, updates):
+        """Send the status updates in one concurrent batch and log each outcome"""
+        if not updates:
+            return
+        results = yield ("update_issue_statuses", (updates,))
+        for (issue_key, status), (success, message) in zip(updates, results):
+            if success is None:
+                print(f"[DEBUG] Update of {issue_key} to {status} {message.lower()}")
+            elif not success:
+                print(f"[ERROR] Failed to update status of {issue_key}: {message}")
+            else:
+                print(f"[DEBUG] Successfully updated {issue_key} to {status}")
+
+    def _extract_jira_key_steps(self, text):
         try:
             print(f"\n[DEBUG] Extracting Jira key from: {text}")
             
-            # Convert text to lowercase for processing
-            text = text.lower()
-            
-            # First try to find number words
-            number_mapping = {
-                'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
-                'six': '6', 'seven': '7', 'eight': '8', 'nine': '9', 'ten': '10',
-                'eleven': '11', 'twelve': '12', 'thirteen': '13', 'fourteen': '14',
-                'fifteen': '15', 'sixteen': '16', 'seventeen': '17', 'eighteen': '18',
-                'nineteen': '19', 'twenty': '20'
-            }
-            
-            # Replace number words with digits
-            for word, digit in number_mapping.items():
-                text = re.sub(r'\b' + word + r'\b', digit, text)
-            
-            print(f"[DEBUG] Text after number word replacement: {text}")
-            
-            # Now try to find exact matches like "scrum-7" or "scrum 7"
-            patterns = [
-                r'(?i)scrum[-\s]?(\d+)',  # Matches: scrum-7, scrum7, scrum 7
-                r'(?i)think_41[-\s]?scrum[-\s]?(\d+)',  # Matches: think_41-scrum-7
-                r'(?i)scrum\s+issue\s+(\d+)',  # Matches: scrum issue 7
-                r'(?i)ticket\s+(\d+)',  # Matches: ticket 7
-                r'(?i)issue\s+(\d+)'  # Matches: issue 7
-            ]
-            
-            for pattern in patterns:
-                print(f"[DEBUG] Trying pattern: {pattern}")
-                matches = re.findall(pattern, text)
-                print(f"[DEBUG] Pattern matches: {matches}")
-                if matches:
-                    key = f"{os.getenv('JIRA_PROJECT_KEY')}-{matches[0]}"
-                    print(f"[DEBUG] Found key using pattern: {key}")
-                    # Verify this issue exists in Jira
-                    if self.jira.issue_exists(key):
-                        print(f"[DEBUG] Verified issue exists in Jira: {key}")
-                        return key
-                    else:
-                        print(f"[DEBUG] Issue does not exist in Jira: {key}")
+            # One scan folds spoken numbers and collects "scrum 7" / "ticket 7" style mentions
+            candidates = key_number_candidates(text)
+            print(f"[DEBUG] Candidate issue numbers: {candidates}")
+
+            for number in candidates:
+                key = f"{os.getenv('JIRA_PROJECT_KEY')}-{number}"
+                # Verify this issue exists in Jira
+                if (yield ("issue_exists", (key,))):
+                    print(f"[DEBUG] Verified issue exists in Jira: {key}")
+                    return key
+                else:
+                    print(f"[DEBUG] Issue does not exist in Jira: {key}")
             
             print("[DEBUG] No Jira key found")
             return None
@@ -949,29 +1750,31 @@ class ScrumBot:
 
     def determine_status(self, text):
         """Determine task status based on user's response"""
-        text = text.lower()
+        return self.classify_status(text)[0]
+
+    def classify_status(self, text):
+        """Classify the status a response signals, with the classifier's confidence
+
+        Returns:
+            tuple: (status name, confidence between 0 and 1)
+        """
         print(f"\n[DEBUG] Analyzing status from text: {text}")
-        
-        # Check for completion words
-        if any(word in text for word in ['completed', 'finished', 'done', 'complete']):
-            print("[DEBUG] Detected status: Done")
-            return ScrumStatus.DONE
-            
-        # Check for in-progress words
-        elif any(word in text for word in ['working', 'started', 'progress', 'continuing', 'doing']):
-            print("[DEBUG] Detected status: In Progress")
-            return ScrumStatus.IN_PROGRESS
-            
-        # Check for blocked words
-        elif any(word in text for word in ['blocked', 'blocking', 'blocker']):
-            print("[DEBUG] Detected status: Blocked")
-            return ScrumStatus.BLOCKED
-            
-        print("[DEBUG] Default status: To Do")
-        return ScrumStatus.TODO
+        status, confidence = classifier_for(os.getenv("JIRA_PROJECT_KEY")).classify(text)
+        print(f"[DEBUG] Detected status: {status} (confidence {confidence:.2f})")
+        return status, confidence
 
     def process_response(self, text):
         """Process user response based on current state."""
+        return self._run_jira_steps(self._process_response_steps(text))
+
+    async def process_response_async(self, text):
+        """Process user response without blocking the event loop on Jira I/O.
+
+        Requires the bot to be constructed with an AsyncJiraAPI.
+        """
+        return await self._run_jira_steps_async(self._process_response_steps(text))
+
+    def _process_response_steps(self, text):
         try:
             print(f"\n[DEBUG] Processing response in state: {self.current_state}")
             print(f"[DEBUG] User text: {text}")
@@ -981,39 +1784,25 @@ class ScrumBot:
             
             # Only extract Jira keys in relevant states
             issue_key = None
-            if self.current_state in ["greeting", "today", "blocker_details"]:
-                issue_key = self.extract_jira_key(text)
+            mentions = []
+            if self.current_state in ["greeting", "today"]:
+                mentions = yield from self._extract_jira_keys_steps(text)
+                print(f"[DEBUG] Extracted issue keys: {mentions}")
+            elif self.current_state == "blocker_details":
+                issue_key = yield from self._extract_jira_key_steps(text)
                 print(f"[DEBUG] Extracted issue key: {issue_key}")
             
             if self.current_state == "greeting":
-                # Extract Jira key and update status for yesterday's work
-                if issue_key:
-                    print(f"[DEBUG] Found Jira issue for yesterday: {issue_key}")
-                    status = self.determine_status(text)
-                    print(f"[DEBUG] Determined status: {status}")
-                    success, message = self.jira.update_issue_status(issue_key, status)
-                    if not success:
-                        print(f"[ERROR] Failed to update status: {message}")
-                    else:
-                        print(f"[DEBUG] Successfully updated {issue_key} to {status}")
+                # Update the status of every issue mentioned for yesterday's work
+                yield from self._apply_status_updates_steps(self._status_updates(mentions, text))
                 
                 self.scrum_data["yesterday"] = text
                 self.current_state = "today"
                 return "What will you be working on today?"
             
             elif self.current_state == "today":
-                # Extract Jira key and update status for today's work
-                if issue_key:
-                    print(f"[DEBUG] Found Jira issue for today: {issue_key}")
-                    status = self.determine_status(text)
-                    if not status:
-                        status = ScrumStatus.IN_PROGRESS  # Default to in progress for today's tasks
-                    print(f"[DEBUG] Setting status to: {status}")
-                    success, message = self.jira.update_issue_status(issue_key, status)
-                    if not success:
-                        print(f"[ERROR] Failed to update status: {message}")
-                    else:
-                        print(f"[DEBUG] Successfully updated {issue_key} to {status}")
+                # Update the status of every issue mentioned for today's work
+                yield from self._apply_status_updates_steps(self._status_updates(mentions, text))
                 
                 self.scrum_data["today"] = text
                 self.current_state = "blockers"
@@ -1034,13 +1823,13 @@ class ScrumBot:
                 # Handle blocker details and create blocker issue if needed
                 if issue_key:
                     print(f"[DEBUG] Found blocked Jira issue: {issue_key}")
-                    success, message = self.jira.update_issue_status(issue_key, ScrumStatus.BLOCKED)
-                    if not success:
+                    success, message = yield ("update_issue_status", (issue_key, ScrumStatus.BLOCKED))
+                    if success is False:
                         print(f"[ERROR] Failed to update status to blocked: {message}")
                     else:
-                        success, message = self.jira.create_blocker(issue_key, text)
-                        if not success:
-                            print(f"[ERROR] Failed to create blocker: {message}")
+                        # Every blocker from this standup is created in one bulk request; if the
+                        # Blocked transition was only queued, the queue drops the blocker should it fail
+                        self.pending_blockers.append((issue_key, text))
                 
                 self.scrum_data["blockers"].append(text)
                 self.current_state = "more_blockers"
@@ -1048,6 +1837,7 @@ class ScrumBot:
             
             elif self.current_state == "more_blockers":
                 if text in ["no", "nope", "none"]:
+                    yield from self._flush_blockers_steps()
                     self.current_state = "ask_create_issue"
                     return "Would you like to create any new issues/tickets? (yes/no)"
                 elif text in ["yes", "yeah", "yep", "i do"]:
@@ -1071,7 +1861,7 @@ class ScrumBot:
                     return "Let's create a new issue. What should be the summary (title) of the issue?"
                 else:
                     # Show the TODO tasks again before ending
-                    tasks = self.get_todo_tasks(self.username)
+                    tasks = yield ("get_todo_tasks", (self.username,))
                     if tasks:
                         task_list = []
                         for task in tasks:
@@ -1089,11 +1879,143 @@ class ScrumBot:
             traceback.print_exc()
             return "Sorry, I encountered an error. Please try again."
 
+    def process_standup(self, text):
+        """Handle a whole standup in one free-form answer (one-shot mode)
+
+        Yesterday, today and blockers are extracted together, every Jira update
+        they imply is sent in one batch, and only questions the answer left
+        open are asked as follow-ups.
+
+        Returns:
+            str: What was recorded, then a follow-up question or the next step
+        """
+        return self._run_jira_steps(self._standup_steps(parse_standup(text, self.standup_field)))
+
+    async def process_standup_async(self, text, extractor=None):
+        """Async variant of process_standup; extractor "llm" parses with one Groq call"""
+        if (extractor or STANDUP_EXTRACTOR) == "llm":
+            report = await extract_standup(text, self.standup_field)
+        else:
+            report = parse_standup(text, self.standup_field)
+        return await self._run_jira_steps_async(self._standup_steps(report))
+
+    def _standup_steps(self, report):
+        try:
+            print(f"\n[DEBUG] One-shot standup: {report}")
+            applied, queued = yield from self._apply_standup_steps(report)
+
+            self.standup_report = merge_reports(self.standup_report, report)
+            for field in ("yesterday", "today"):
+                self.scrum_data[field] = self.standup_report[field]
+            self.scrum_data["blockers"].extend(report["blockers"])
+
+            recorded = "Got it."
+            if applied:
+                recorded += " Updated " + ", ".join(f"{key} to {status}" for key, status in applied) + "."
+            if queued:
+                # Not applied yet; /api/mutations reports how they turn out
+                recorded += " Queued Jira updates: " + ", ".join(f"{key} to {status}" for key, status in queued) + "."
+            missing = missing_fields(self.standup_report)
+            if missing:
+                self.standup_field = missing[0]
+                self.current_state = "standup"
+                return f"{recorded} {STANDUP_QUESTIONS[missing[0]]}"
+            self.current_state = "ask_create_issue"
+            return f"{recorded} Would you like to create any new issues/tickets? (yes/no)"
+
+        except Exception as e:
+            print(f"[ERROR] Error in process_standup: {str(e)}")
+            traceback.print_exc()
+            return "Sorry, I encountered an error. Please try again."
+
+    def _apply_standup_steps(self, report):
+        """Validate, update and block every issue a standup report mentions, in batches
+
+        One existing_issue_keys call checks all mentioned keys, one
+        update_issue_statuses call moves them (issues named in a blocker go to
+        Blocked), and one create_blockers call files the blockers.
+
+        Returns:
+            tuple: (applied, queued) lists of (issue_key, status) pairs, the ones
+                updated in Jira and the ones queued for a background update
+        """
+        project = os.getenv('JIRA_PROJECT_KEY')
+        work = []
+        for field in ("yesterday", "today"):
+            if report[field]:
+                mentions = [(f"{project}-{number}", phrase) for number, phrase in key_mentions(report[field])]
+                work.append((field, mentions, report[field]))
+        blocked = [(f"{project}-{number}", description)
+                   for description in report["blockers"] for number, _ in key_mentions(description)]
+
+        keys = list(dict.fromkeys([key for _, mentions, _ in work for key, _ in mentions] + [key for key, _ in blocked]))
+        if not keys:
+            return [], []
+        existing = yield ("existing_issue_keys", (keys,))
+
+        # Later sections win: today's status over yesterday's, Blocked over both
+        statuses = {}
+        for field, mentions, text in work:
+            for issue_key, status in self._status_updates([m for m in mentions if m[0] in existing], text):
+                # An issue planned for today with no status words is being started
+                if field == "today" and status == ScrumStatus.TODO:
+                    status = ScrumStatus.IN_PROGRESS
+                statuses[issue_key] = status
+        descriptions = {}
+        for issue_key, description in blocked:
+            if issue_key in existing:
+                statuses[issue_key] = ScrumStatus.BLOCKED
+                descriptions.setdefault(issue_key, description)
+        if not statuses:
+            return [], []
+
+        updates = list(statuses.items())
+        results = yield ("update_issue_statuses", (updates,))
+        applied, queued = [], []
+        for (issue_key, status), (success, message) in zip(updates, results):
+            if success is False:
+                print(f"[ERROR] Failed to update status of {issue_key}: {message}")
+                continue
+            if success is None:
+                print(f"[DEBUG] Update of {issue_key} to {status} {message.lower()}")
+                queued.append((issue_key, status))
+            else:
+                print(f"[DEBUG] Successfully updated {issue_key} to {status}")
+                applied.append((issue_key, status))
+            if issue_key in descriptions:
+                self.pending_blockers.append((issue_key, descriptions[issue_key]))
+        yield from self._flush_blockers_steps()
+        return applied, queued
+
+    def _flush_blockers_steps(self):
+        """Create the queued blockers in one create_blockers call"""
+        if not self.pending_blockers:
+            return
+        blockers, self.pending_blockers = self.pending_blockers, []
+        try:
+            results = yield ("create_blockers", (blockers,))
+        except Exception:
+            # Keep them queued so answering "no" again retries the flush
+            self.pending_blockers = blockers + self.pending_blockers
+            raise
+        for (issue_key, _), (success, message) in zip(blockers, results):
+            if success is False:
+                print(f"[ERROR] Failed to create blocker for {issue_key}: {message}")
+            else:
+                print(f"[DEBUG] {message}")
+
     def generate_summary(self):
         """Generate a natural, conversational standup summary that feels like a friendly chat."""
+        return self._run_jira_steps(self._generate_summary_steps())
+
+    async def generate_summary_async(self):
+        """Async variant of generate_summary for use with AsyncJiraAPI"""
+        return await self._run_jira_steps_async(self._generate_summary_steps())
+
+    def _generate_summary_steps(self):
         try:
             # Get todo tasks for the user
-            todo_tasks = self.get_todo_tasks(self.username)
+            todo_tasks = yield ("get_todo_tasks", (self.username,))
             
             # Prepare summary parts
             summary_parts = []
@@ -1149,7 +2071,11 @@ async def recognize_speech(audio_file_path=None):
                         print(f"[ERROR] Error in STT: {error_text}")
                         return "Sorry, I couldn't understand."
         
-        # If no audio file provided, use microphone input
+        # If no audio file provided, use microphone input. The audio stack is only
+        # loaded here, so the web server never imports it
+        import numpy as np
+        import sounddevice as sd
+
         print("\n[DEBUG] Checking audio setup...")
         
         # List and select audio device
@@ -1286,20 +2212,131 @@ async def recognize_speech(audio_file_path=None):
         print(f"[ERROR] Error in speech recognition: {e}")
         return f"Sorry, there was an error: {str(e)}"
 
-async def ask_groq(question):
-    """Send user input to Groq Llama or Mixtral and return the AI response."""
-    response = await groq_client.chat.completions.create(
-        model="mixtral-8x7b-32768",
+async def ask_groq(question, system_prompt=GROQ_SYSTEM_PROMPT, temperature=GROQ_TEMPERATURE):
+    """Send user input to Groq Llama or Mixtral and return the AI response.
+
+    Replies are cached by model, system prompt and normalized question, so a
+    repeated answer is served without calling Groq.
+    """
+    key = response_key(GROQ_MODEL, system_prompt, question, temperature)
+    reply = await groq_cache.get_async(key)
+    if reply is not None:
+        print(f"[DEBUG] Groq (cached): {reply}")
+        return reply
+    response = await get_groq_client().chat.completions.create(
+        model=GROQ_MODEL,
         messages=[
-            {"role": "system", "content": "You are a helpful Scrum assistant. Help extract key information about tasks, status updates, and blockers from the user's input."},
+            {"role": "system", "content": system_prompt},
             {"role": "user", "content": question}
         ],
-        temperature=0.7
+        temperature=temperature
     )
     reply = response.choices[0].message.content
     print(f"[DEBUG] Groq: {reply}")
+    if reply:
+        await groq_cache.set_async(key, reply)
     return reply
 
+async def ask_groq_stream(question, system_prompt=GROQ_SYSTEM_PROMPT, temperature=GROQ_TEMPERATURE):
+    """Streaming variant of ask_groq: yield the reply in pieces as Groq generates them
+
+    A cached reply is yielded whole; a fresh one is cached once the stream completes.
+    """
+    key = response_key(GROQ_MODEL, system_prompt, question, temperature)
+    reply = await groq_cache.get_async(key)
+    if reply is not None:
+        print(f"[DEBUG] Groq (cached): {reply}")
+        yield reply
+        return
+    stream = await get_groq_client().chat.completions.create(
+        model=GROQ_MODEL,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": question}
+        ],
+        temperature=temperature,
+        stream=True
+    )
+    parts = []
+    async for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            parts.append(delta)
+            yield delta
+    reply = "".join(parts)
+    print(f"[DEBUG] Groq: {reply}")
+    if reply:
+        await groq_cache.set_async(key, reply)
+
+async def stream_reply(question, speak=False):
+    """Stream a Groq reply as events, speaking each sentence as soon as it is complete
+
+    Yields dicts in order of availability:
+        {"event": "token", "text": str} for every streamed piece
+        {"event": "sentence", "index": int, "text": str} for every completed sentence
+        {"event": "audio", "index": int, "audio": bytes or None} per sentence when speak is set
+        {"event": "done", "reply": str} once the reply is complete
+
+    Speech for a sentence is requested while later tokens are still being
+    generated; audio events are emitted in sentence order.
+    """
+    splitter = SentenceSplitter()
+    speech = []  # (index, task) awaiting delivery, oldest first
+    parts = []
+    index = 0
+
+    def sentence_events(sentences):
+        nonlocal index
+        events = []
+        for sentence in sentences:
+            events.append({"event": "sentence", "index": index, "text": sentence})
+            if speak:
+                speech.append((index, asyncio.ensure_future(speak_text(sentence))))
+            index += 1
+        return events
+
+    def ready_audio():
+        events = []
+        while speech and speech[0][1].done():
+            done_index, task = speech.pop(0)
+            events.append({"event": "audio", "index": done_index, "audio": task.result()})
+        return events
+
+    try:
+        async for token in ask_groq_stream(question):
+            parts.append(token)
+            yield {"event": "token", "text": token}
+            for event in sentence_events(splitter.feed(token)) + ready_audio():
+                yield event
+        for event in sentence_events(splitter.flush()):
+            yield event
+        while speech:
+            done_index, task = speech.pop(0)
+            yield {"event": "audio", "index": done_index, "audio": await task}
+        yield {"event": "done", "reply": "".join(parts)}
+    finally:
+        # The client went away; don't keep synthesizing speech nobody will hear
+        for _, task in speech:
+            task.cancel()
+
+async def extract_standup(text, field="yesterday"):
+    """Parse a standup answer with one Groq call, falling back to the rule-based parser
+
+    Args:
+        text (str): Transcribed user text
+        field (str): The standup question the user was answering
+    """
+    try:
+        reply = await ask_groq(f"Question: {STANDUP_QUESTIONS[field]}\nAnswer: {text}",
+                               system_prompt=STANDUP_EXTRACTION_PROMPT, temperature=0)
+        report = parse_llm_reply(reply)
+        if report is not None:
+            return report
+        print("[ERROR] Groq did not return a standup JSON object, using rule-based extraction")
+    except Exception as e:
+        print(f"[ERROR] Error extracting standup with Groq: {str(e)}")
+    return parse_standup(text, field)
+
 async def speak_text(text):
     """Convert text to speech using Deepgram's TTS API."""
     try:
@@ -1351,6 +2388,7 @@ async def main():
         if not jira.test_connection():
             print("[ERROR] Failed to connect to Jira. Please check your credentials.")
             return
+        jira.warm_up(os.getenv("JIRA_PROJECT_KEY", "SCRUM"))
             
         # Test with SCRUM-11
         print("\n[DEBUG] Testing with SCRUM-11...")
@@ -1358,11 +2396,7 @@ async def main():
         if details:
             print(f"[DEBUG] Current status: {details['fields']['status']['name']}")
             print("[DEBUG] Available transitions:")
-            response = requests.get(
-                f"{jira.server_url}/rest/agile/1.0/board",
-                headers=jira.headers,
-                auth=jira.auth
-            )
+            response = jira.transport.get(f"{jira.server_url}/rest/agile/1.0/board")
             if response.status_code == 200:
                 boards = response.json()["values"]
                 if boards:
@@ -1370,20 +2404,12 @@ async def main():
                     
                     # Get active sprints for this board
                     sprints_url = f"{jira.server_url}/rest/agile/1.0/board/{board_id}/sprint?state=active"
-                    sprints = requests.get(
-                        sprints_url,
-                        headers=jira.headers,
-                        auth=jira.auth
-                    )
+                    sprints = jira.transport.get(sprints_url)
                     if sprints.status_code == 200:
                         sprints = sprints.json()["values"]
                         if sprints:
                             sprint_id = sprints[0]["id"]
-                            response = requests.get(
-                                f"{jira.server_url}/rest/agile/1.0/sprint/{sprint_id}/issue",
-                                headers=jira.headers,
-                                auth=jira.auth
-                            )
+                            response = jira.transport.get(f"{jira.server_url}/rest/agile/1.0/sprint/{sprint_id}/issue")
                             if response.status_code == 200:
                                 issues = response.json()["issues"]
                                 for issue in issues:
@@ -1,9 +1,13 @@
-import requests
 import json
 from typing import Dict, List, Tuple, Optional
+from jira_search import iter_search
+from jira_transport import JiraTransport, DEFAULT_POOL_SIZE, DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
 
 class JiraAPI:
-    def __init__(self, email: str, api_key: str, server_url: str):
+    def __init__(self, email: str, api_key: str, server_url: str,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT):
         self.email = email
         self.api_key = api_key
         self.server_url = server_url
@@ -12,12 +16,14 @@ class JiraAPI:
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        self.transport = JiraTransport(server_url, self.auth, self.headers, pool_size=pool_size,
+                                       connect_timeout=connect_timeout, read_timeout=read_timeout)
 
     def get_issue_details(self, issue_key: str) -> Optional[Dict]:
         """Get details of a JIRA issue."""
         url = f"{self.server_url}/rest/api/3/issue/{issue_key}"
         try:
-            response = requests.get(url, auth=self.auth, headers=self.headers)
+            response = self.transport.get(url)
             if response.status_code == 200:
                 return response.json()
             return None
@@ -36,7 +42,7 @@ class JiraAPI:
             }
         }
         try:
-            response = requests.post(url, json=data, auth=self.auth, headers=self.headers)
+            response = self.transport.post(url, json=data)
             if response.status_code == 201:
                 return response.json()["key"]
             return None
@@ -47,7 +53,7 @@ class JiraAPI:
         """Get available transitions for an issue."""
         url = f"{self.server_url}/rest/api/3/issue/{issue_key}/transitions"
         try:
-            response = requests.get(url, auth=self.auth, headers=self.headers)
+            response = self.transport.get(url)
             if response.status_code == 200:
                 return response.json()
             return None
@@ -82,7 +88,7 @@ class JiraAPI:
             "transition": {"id": transition_id}
         }
         try:
-            response = requests.post(url, json=data, auth=self.auth, headers=self.headers)
+            response = self.transport.post(url, json=data)
             return response.status_code == 204, "Status updated successfully"
         except Exception as e:
             return False, str(e)
@@ -109,7 +115,7 @@ class JiraAPI:
             "outwardIssue": {"key": issue_key}
         }
         try:
-            response = requests.post(url, json=data, auth=self.auth, headers=self.headers)
+            response = self.transport.post(url, json=data)
             if response.status_code == 201:
                 return True, blocker_key
             return False, "Failed to link blocker issue"
@@ -120,7 +126,7 @@ class JiraAPI:
         """Get the ID of the current active sprint."""
         url = f"{self.server_url}/rest/agile/1.0/sprint/active"
         try:
-            response = requests.get(url, auth=self.auth, headers=self.headers)
+            response = self.transport.get(url)
             if response.status_code == 200:
                 sprints = response.json()["values"]
                 if sprints:
@@ -132,29 +138,23 @@ class JiraAPI:
     def get_project_summary(self) -> Dict:
         """Get a summary of project issues."""
         try:
-            # Get all epics
-            epics_url = f"{self.server_url}/rest/api/3/search?jql=issuetype=Epic"
-            epics_response = requests.get(epics_url, auth=self.auth, headers=self.headers)
+            # Get all epics, following every page of results
             epics = []
-            if epics_response.status_code == 200:
-                for epic in epics_response.json()["issues"]:
-                    epics.append({
-                        "key": epic["key"],
-                        "summary": epic["fields"]["summary"],
-                        "status": epic["fields"]["status"]["name"]
-                    })
+            for epic in iter_search(self.transport, "issuetype=Epic", ["summary", "status"]):
+                epics.append({
+                    "key": epic["key"],
+                    "summary": epic["fields"]["summary"],
+                    "status": epic["fields"]["status"]["name"]
+                })
 
             # Get all stories
-            stories_url = f"{self.server_url}/rest/api/3/search?jql=issuetype=Story"
-            stories_response = requests.get(stories_url, auth=self.auth, headers=self.headers)
             stories = []
-            if stories_response.status_code == 200:
-                for story in stories_response.json()["issues"]:
-                    stories.append({
-                        "key": story["key"],
-                        "summary": story["fields"]["summary"],
-                        "status": story["fields"]["status"]["name"]
-                    })
+            for story in iter_search(self.transport, "issuetype=Story", ["summary", "status"], read_ahead=True):
+                stories.append({
+                    "key": story["key"],
+                    "summary": story["fields"]["summary"],
+                    "status": story["fields"]["status"]["name"]
+                })
 
             return {
                 "epics": epics,
@@ -1,6 +1,7 @@
 import re
 from typing import Dict, List, Optional
 from .jira_api import JiraAPI
+from status_classifier import StatusClassifier
 
 class ScrumBot:
     def __init__(self, jira_api: JiraAPI):
@@ -17,6 +18,11 @@ class ScrumBot:
             "to do": ["planning", "will start", "todo", "to do"],
             "blocked": ["blocked", "stuck", "waiting"]
         }
+        # Compiled once; the order of status_keywords is the match priority
+        self.status_classifier = StatusClassifier(
+            {status.title(): keywords for status, keywords in self.status_keywords.items()},
+            default_status="To Do"
+        )
 
     def extract_jira_key(self, text: str) -> Optional[str]:
         """Extract JIRA issue key from text."""
@@ -26,11 +32,7 @@ class ScrumBot:
 
     def determine_status(self, text: str) -> str:
         """Determine issue status from text."""
-        text = text.lower()
-        for status, keywords in self.status_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                return status.title()
-        return "To Do"  # Default status
+        return self.status_classifier.classify(text)[0]
 
     def process_response(self, response: str) -> str:
         """Process user response and update bot state."""
@@ -0,0 +1,245 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from jira_transport import DEFAULT_POOL_SIZE
+from talking_bot import AsyncJiraAPI, ScrumBot, ScrumStatus
+
+def make_jira_app(calls):
+    """Minimal fake Jira serving one issue and its transitions"""
+    issue = {"key": "SCRUM-7", "fields": {"status": {"name": "To Do"}, "assignee": None}}
+
+    async def get_issue(request):
+        calls.append(("GET", request.path))
+        if request.match_info["key"] != "SCRUM-7":
+            return web.json_response({"errorMessages": ["Issue does not exist"]}, status=404)
+        return web.json_response(issue)
+
+    async def get_transitions(request):
+        calls.append(("GET", request.path))
+        return web.json_response({"transitions": [{"id": "31", "name": "Done"}]})
+
+    async def post_transition(request):
+        calls.append(("POST", request.path, await request.json()))
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_get("/rest/api/3/issue/{key}", get_issue)
+    app.router.add_get("/rest/api/3/issue/{key}/transitions", get_transitions)
+    app.router.add_post("/rest/api/3/issue/{key}/transitions", post_transition)
+    return app
+
+def run_with_jira(scenario):
+    async def runner():
+        calls = []
+        server = TestServer(make_jira_app(calls))
+        await server.start_server()
+        jira = AsyncJiraAPI(str(server.make_url("")), 'test@email.com', 'test-api-key')
+        try:
+            return await scenario(jira), calls
+        finally:
+            await jira.close()
+            await server.close()
+    return asyncio.run(runner())
+
+def test_async_get_issue_details():
+    async def scenario(jira):
+        jira.key_index.add("SCRUM-404")
+        found, missing = await jira.get_issue_details("SCRUM-7"), await jira.get_issue_details("SCRUM-404")
+        return found, missing, "SCRUM-404" in jira.key_index
+
+    (found, missing, still_indexed), calls = run_with_jira(scenario)
+    assert found["key"] == "SCRUM-7"
+    assert missing is None
+    assert not still_indexed
+    assert len(calls) == 2
+
+def test_async_update_issue_status():
+    async def scenario(jira):
+        return await jira.update_issue_status("SCRUM-7", ScrumStatus.DONE)
+
+    (success, message), calls = run_with_jira(scenario)
+    assert success
+    assert message == "Updated SCRUM-7 to Done"
+    assert calls[-1] == ("POST", "/rest/api/3/issue/SCRUM-7/transitions", {"transition": {"id": "31"}})
+
+def test_async_requests_share_one_session():
+    async def scenario(jira):
+        session = jira.transport.session
+        await asyncio.gather(*(jira.issue_exists(f"SCRUM-{number}") for number in range(5)))
+        assert jira.transport.session is session
+        return session.connector.limit_per_host
+
+    limit_per_host, calls = run_with_jira(scenario)
+    assert len(calls) == 5
+    assert limit_per_host == DEFAULT_POOL_SIZE
+
+def test_async_identical_reads_share_one_request():
+    async def scenario(jira):
+        results = await asyncio.gather(*(jira.issue_exists("SCRUM-7") for _ in range(5)))
+        return results, jira.cache_stats()["coalesced_requests"]
+
+    (results, coalesced), calls = run_with_jira(scenario)
+    assert results == [True] * 5
+    assert len(calls) == 1
+    assert coalesced == 4
+
+def test_read_after_invalidation_does_not_join_an_older_request():
+    calls = []
+    issue = {"status": "To Do"}
+    release = None
+
+    async def get_issue(request):
+        # Answer with the status the issue had when the GET arrived
+        status = issue["status"]
+        calls.append(status)
+        if len(calls) == 1:
+            await release.wait()
+        return web.json_response({"key": "SCRUM-7", "fields": {"status": {"name": status}}})
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        app = web.Application()
+        app.router.add_get("/rest/api/3/issue/{key}", get_issue)
+        server = TestServer(app)
+        await server.start_server()
+        jira = AsyncJiraAPI(str(server.make_url("")), 'test@email.com', 'test-api-key')
+        try:
+            stale = asyncio.ensure_future(jira.get_issue_details("SCRUM-7"))
+            while not calls:
+                await asyncio.sleep(0.01)
+            # A transition lands while the first GET is still in flight
+            issue["status"] = "Done"
+            jira.issue_cache.invalidate("SCRUM-7")
+            fresh = asyncio.ensure_future(jira.get_issue_details("SCRUM-7"))
+            for _ in range(100):
+                if len(calls) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            release.set()
+            await stale
+            return (await fresh)["fields"]["status"]["name"], jira.issue_cache.get("SCRUM-7")
+        finally:
+            await jira.close()
+            await server.close()
+
+    status, cached = asyncio.run(run())
+    assert calls == ["To Do", "Done"]
+    assert status == "Done"
+    assert cached["fields"]["status"]["name"] == "Done"
+
+@pytest.fixture
+def async_jira(monkeypatch):
+    monkeypatch.setenv("JIRA_PROJECT_KEY", "SCRUM")
+    jira = AsyncMock()
+    jira.issue_exists.return_value = True
+    jira.update_issue_status.return_value = (True, "Updated")
+    jira.existing_issue_keys.side_effect = lambda keys: set(keys)
+    jira.update_issue_statuses.side_effect = lambda updates: [(True, "Updated")] * len(updates)
+    jira.create_blockers.return_value = [(True, "Created blocker")]
+    jira.get_todo_tasks.return_value = [{"key": "SCRUM-1", "summary": "Test Task", "status": "To Do"}]
+    return jira
+
+def test_process_response_async_awaits_jira(async_jira):
+    bot = ScrumBot(async_jira)
+
+    start = asyncio.run(bot.start_conversation_async())
+    assert "SCRUM-1: Test Task" in start["message"]
+
+    response = asyncio.run(bot.process_response_async("I finished scrum seven"))
+    assert "today" in response.lower()
+    assert bot.current_state == "today"
+    async_jira.update_issue_statuses.assert_awaited_once_with([("SCRUM-7", ScrumStatus.DONE)])
+
+    bot.current_state = "blocker_details"
+    response = asyncio.run(bot.process_response_async("scrum seven is blocked by the API"))
+    assert "other blockers" in response.lower()
+    async_jira.create_blockers.assert_not_awaited()
+
+    response = asyncio.run(bot.process_response_async("no"))
+    assert bot.current_state == "ask_create_issue"
+    async_jira.create_blockers.assert_awaited_once_with([("SCRUM-7", "scrum seven is blocked by the api")])
+
+def test_process_response_async_handles_jira_errors(async_jira):
+    async_jira.update_issue_statuses.side_effect = RuntimeError("Jira down")
+    bot = ScrumBot(async_jira)
+
+    response = asyncio.run(bot.process_response_async("completed scrum seven"))
+    assert response == "Sorry, I encountered an error. Please try again."
+
+def test_process_response_async_updates_every_mentioned_issue(async_jira):
+    bot = ScrumBot(async_jira)
+
+    asyncio.run(bot.process_response_async("I finished scrum seven and started working on scrum nine"))
+
+    async_jira.existing_issue_keys.assert_awaited_once_with(["SCRUM-7", "SCRUM-9"])
+    async_jira.update_issue_statuses.assert_awaited_once_with([
+        ("SCRUM-7", ScrumStatus.DONE),
+        ("SCRUM-9", ScrumStatus.IN_PROGRESS)
+    ])
+
+def test_async_update_issue_statuses_runs_concurrently():
+    async def scenario(jira):
+        return await jira.update_issue_statuses([("SCRUM-7", ScrumStatus.DONE), ("SCRUM-404", ScrumStatus.DONE)])
+
+    results, calls = run_with_jira(scenario)
+    assert results[0] == (True, "Updated SCRUM-7 to Done")
+    assert results[1][0] is False
+
+def test_generate_summary_async_awaits_the_todo_tasks(async_jira):
+    bot = ScrumBot(async_jira)
+
+    summary = asyncio.run(bot.generate_summary_async())
+
+    async_jira.get_todo_tasks.assert_awaited_once_with(bot.username)
+    assert "You have 1 TODO task(s):\nSCRUM-1: Test Task (To Do)" in summary
+
+def test_process_standup_async_applies_one_utterance(async_jira):
+    bot = ScrumBot(async_jira)
+
+    response = asyncio.run(bot.process_standup_async(
+        "Yesterday I finished scrum seven. Today I'm working on scrum nine, "
+        "but scrum ten is blocked because the API is down"
+    ))
+
+    async_jira.existing_issue_keys.assert_awaited_once_with(["SCRUM-7", "SCRUM-9", "SCRUM-10"])
+    async_jira.update_issue_statuses.assert_awaited_once_with([
+        ("SCRUM-7", ScrumStatus.DONE),
+        ("SCRUM-9", ScrumStatus.IN_PROGRESS),
+        ("SCRUM-10", ScrumStatus.BLOCKED)
+    ])
+    async_jira.create_blockers.assert_awaited_once_with(
+        [("SCRUM-10", "scrum ten is blocked because the api is down")]
+    )
+    assert response.endswith("Would you like to create any new issues/tickets? (yes/no)")
+    assert bot.current_state == "ask_create_issue"
+
+def test_process_standup_async_asks_only_for_missing_fields(async_jira):
+    bot = ScrumBot(async_jira)
+
+    response = asyncio.run(bot.process_standup_async("Yesterday I finished scrum seven, today more of the same"))
+    assert response.endswith("Do you have any blockers? If so, which task are they blocking?")
+    assert bot.current_state == "standup"
+
+    response = asyncio.run(bot.process_standup_async("no"))
+    assert response == "Got it. Would you like to create any new issues/tickets? (yes/no)"
+    assert bot.scrum_data["yesterday"] == "yesterday i finished scrum seven"
+    async_jira.create_blockers.assert_not_awaited()
+
+def test_process_standup_async_with_llm_extraction(async_jira, monkeypatch):
+    import talking_bot
+    ask = AsyncMock(return_value='{"yesterday": "Finished SCRUM-7", "today": "SCRUM-9", '
+                                 '"blockers": [], "no_blockers": true}')
+    monkeypatch.setattr(talking_bot, "ask_groq", ask)
+    bot = ScrumBot(async_jira)
+
+    asyncio.run(bot.process_standup_async("finished seven, starting nine, all clear", extractor="llm"))
+
+    assert ask.await_count == 1
+    async_jira.update_issue_statuses.assert_awaited_once_with([
+        ("SCRUM-7", ScrumStatus.DONE),
+        ("SCRUM-9", ScrumStatus.IN_PROGRESS)
+    ])
+    assert bot.current_state == "ask_create_issue"
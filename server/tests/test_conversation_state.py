@@ -0,0 +1,203 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock
+import pytest
+from conversation_state import (ConversationState, MemoryStateBackend, SQLiteStateBackend,
+                                RedisStateBackend, RedisError, backend_from_url)
+from session_store import SessionStore
+from talking_bot import ScrumBot
+
+class MiniRedis:
+    """Local stand-in for a Redis server: AUTH, GET, SET (with EX), DEL and SELECT over RESP"""
+
+    def __init__(self, password=None, max_db=15):
+        self.data = {}
+        self.commands = []
+        self.server = None
+        self.password = password
+        self.max_db = max_db
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        authenticated = self.password is None
+        try:
+            while True:
+                header = await reader.readline()
+                if not header:
+                    break
+                args = []
+                for _ in range(int(header[1:])):
+                    length = int((await reader.readline())[1:])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                self.commands.append(args[0].decode())
+                command = args[0].upper()
+                if command == b"AUTH":
+                    authenticated = args[-1].decode() == self.password
+                    writer.write(b"+OK\r\n" if authenticated else b"-WRONGPASS invalid password\r\n")
+                elif not authenticated:
+                    writer.write(b"-NOAUTH Authentication required.\r\n")
+                elif command == b"GET":
+                    value = self.data.get(args[1])
+                    writer.write(b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value))
+                elif command == b"SET":
+                    self.data[args[1]] = args[2]
+                    writer.write(b"+OK\r\n")
+                elif command == b"DEL":
+                    writer.write(b":%d\r\n" % int(self.data.pop(args[1], None) is not None))
+                elif command == b"SELECT":
+                    ok = int(args[1]) <= self.max_db
+                    writer.write(b"+OK\r\n" if ok else b"-ERR DB index is out of range\r\n")
+                else:
+                    writer.write(b"-ERR unknown command\r\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+def test_state_round_trips_through_bytes():
+    state = ConversationState()
+    state.current_state = "blocker_details"
+    state.scrum_data["yesterday"] = "finished scrum 7"
+    state.pending_blockers.append(("SCRUM-7", "waiting on the API"))
+
+    data = state.to_bytes()
+    restored = ConversationState.from_bytes(data)
+
+    assert restored.as_dict() == state.as_dict()
+    assert len(data) < 400
+    assert not hasattr(state, "__dict__")
+    with pytest.raises(ValueError):
+        ConversationState.from_bytes(b"\x00" + data[1:])
+    with pytest.raises(ValueError):
+        ConversationState.from_bytes(data[:10])
+
+def test_scrum_bot_attributes_live_in_its_state():
+    bot = ScrumBot(AsyncMock())
+    bot.current_state = "today"
+    bot.scrum_data["today"] = "scrum 9"
+
+    other = ScrumBot(AsyncMock())
+    other.import_state(bot.export_state())
+
+    assert other.current_state == "today"
+    assert other.scrum_data["today"] == "scrum 9"
+    assert ScrumBot(AsyncMock()).current_state == "greeting"
+
+def test_sqlite_backend_is_shared_by_connections(tmp_path):
+    path = str(tmp_path / "sessions.db")
+
+    async def run():
+        writer, reader = SQLiteStateBackend(path), SQLiteStateBackend(path)
+        await writer.set("abc", b"state", ttl=60)
+        found = await reader.get("abc")
+        await writer.delete("abc")
+        gone = await reader.get("abc")
+        await writer.close()
+        await reader.close()
+        return found, gone
+
+    assert asyncio.run(run()) == (b"state", None)
+
+def test_redis_backend_speaks_resp():
+    async def run():
+        server = MiniRedis()
+        port = await server.start()
+        backend = backend_from_url(f"redis://127.0.0.1:{port}/2")
+        try:
+            await backend.set("abc", b"\x01binary\r\nstate", ttl=60)
+            found = await backend.get("abc")
+            await backend.delete("abc")
+            return found, await backend.get("abc"), server.commands
+        finally:
+            await backend.close()
+            await server.stop()
+
+    found, gone, commands = asyncio.run(run())
+    assert isinstance(backend_from_url("redis://localhost"), RedisStateBackend)
+    assert found == b"\x01binary\r\nstate"
+    assert gone is None
+    assert commands == ["SELECT", "SET", "GET", "DEL", "GET"]
+
+def test_redis_backend_authenticates_from_the_url():
+    async def run():
+        server = MiniRedis(password="s3cret/pw")
+        port = await server.start()
+        backend = backend_from_url(f"redis://:s3cret%2Fpw@127.0.0.1:{port}/1")
+        try:
+            await backend.set("abc", b"state", ttl=60)
+            return await backend.get("abc"), server.commands
+        finally:
+            await backend.close()
+            await server.stop()
+
+    found, commands = asyncio.run(run())
+    assert found == b"state"
+    assert commands[:2] == ["AUTH", "SELECT"]
+
+def test_redis_backend_drops_a_connection_whose_select_failed():
+    async def run():
+        server = MiniRedis(max_db=0)
+        port = await server.start()
+        backend = backend_from_url(f"redis://127.0.0.1:{port}/3")
+        errors = []
+        try:
+            for _ in range(2):
+                try:
+                    await backend.set("abc", b"state", ttl=60)
+                except RedisError as e:
+                    errors.append(str(e))
+            return errors, server.data, server.commands
+        finally:
+            await backend.close()
+            await server.stop()
+
+    errors, data, commands = asyncio.run(run())
+    # Each attempt reconnects and fails again instead of writing to db 0
+    assert len(errors) == 2
+    assert data == {}
+    assert commands == ["SELECT", "SELECT"]
+
+def test_session_moves_between_workers():
+    jira = AsyncMock()
+    jira.get_todo_tasks.return_value = []
+    backend = MemoryStateBackend()
+    # Two stores stand in for two gunicorn workers sharing one backend
+    first_worker = SessionStore(lambda: ScrumBot(jira), backend=backend)
+    second_worker = SessionStore(lambda: ScrumBot(jira), backend=backend)
+
+    async def turn(store, message):
+        async with store.session("abc") as bot:
+            return await bot.process_response_async(message)
+
+    async def run():
+        await turn(first_worker, "worked on the docs")
+        return await turn(second_worker, "the login page"), await turn(first_worker, "no")
+
+    assert asyncio.run(run()) == ("Do you have any blockers? (yes/no)",
+                                  "Would you like to create any new issues/tickets? (yes/no)")
+
+def test_sqlite_backend_keeps_queries_off_the_event_loop(tmp_path):
+    backend = SQLiteStateBackend(str(tmp_path / "sessions.db"))
+    threads = []
+    query = backend._get
+
+    def get(session_id):
+        threads.append(threading.get_ident())
+        return query(session_id)
+
+    backend._get = get
+
+    async def run():
+        await backend.set("abc", b"state", ttl=60)
+        found = await asyncio.gather(*(backend.get("abc") for _ in range(5)))
+        await backend.close()
+        return found
+
+    assert asyncio.run(run()) == [b"state"] * 5
+    assert len(set(threads)) == 1 and threads[0] != threading.get_ident()
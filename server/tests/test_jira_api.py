@@ -1,7 +1,8 @@
+import json
 import pytest
 import responses
 from unittest.mock import patch, MagicMock
-from talking_bot import JiraAPI
+from talking_bot import JiraAPI, SPRINT_CACHE_FALLBACK_TTL
 
 @pytest.fixture
 def mock_response():
@@ -57,3 +58,332 @@ def test_get_issue_details_error(jira_api):
     )
     result = jira_api.get_issue_details('SCRUM-1')
     assert result is None
+
+@responses.activate
+def test_issue_lookups_share_cache():
+    jira_api = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    responses.add(
+        responses.GET,
+        f"{jira_api.server_url}/rest/api/3/issue/SCRUM-7",
+        json={
+            "key": "SCRUM-7",
+            "fields": {
+                "status": {"name": "To Do"},
+                "assignee": {"accountId": "abc", "displayName": "Test User"}
+            }
+        },
+        status=200
+    )
+
+    assert jira_api.issue_exists('SCRUM-7')
+    assert jira_api.get_issue_details('SCRUM-7')["key"] == "SCRUM-7"
+    assert jira_api.get_issue_assignee('SCRUM-7') == {"accountId": "abc", "displayName": "Test User"}
+
+    assert len(responses.calls) == 1
+    assert jira_api.cache_stats()["issues"]["hits"] == 2
+
+@responses.activate
+def test_status_update_invalidates_cached_issue(mock_transitions):
+    jira_api = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    issue_url = f"{jira_api.server_url}/rest/api/3/issue/SCRUM-7"
+    responses.add(responses.GET, issue_url, json={"key": "SCRUM-7", "fields": {"status": {"name": "To Do"}}})
+    responses.add(responses.GET, f"{issue_url}/transitions", json=mock_transitions)
+    responses.add(responses.POST, f"{issue_url}/transitions", status=204)
+
+    success, _ = jira_api.update_issue_status('SCRUM-7', 'Done')
+
+    assert success
+    assert 'SCRUM-7' not in jira_api.issue_cache
+
+@responses.activate
+def test_in_flight_issue_read_does_not_overwrite_an_invalidation():
+    jira_api = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+
+    def stale_read(request):
+        # A status update lands while this GET is still in flight
+        jira_api.issue_cache.invalidate('SCRUM-7')
+        return (200, {}, json.dumps({"key": "SCRUM-7", "fields": {"status": {"name": "To Do"}}}))
+
+    responses.add_callback(responses.GET, f"{jira_api.server_url}/rest/api/3/issue/SCRUM-7", callback=stale_read)
+
+    assert jira_api.get_issue_details('SCRUM-7')["key"] == "SCRUM-7"
+    assert 'SCRUM-7' not in jira_api.issue_cache
+
+def _add_issue(server_url, key, status="To Do"):
+    responses.add(
+        responses.GET,
+        f"{server_url}/rest/api/3/issue/{key}",
+        json={
+            "key": key,
+            "fields": {
+                "status": {"name": status},
+                "issuetype": {"name": "Task"},
+                "project": {"key": "SCRUM"}
+            }
+        }
+    )
+
+@responses.activate
+def test_transition_ids_are_cached_per_workflow_state(mock_transitions):
+    jira_api = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    for key in ("SCRUM-7", "SCRUM-8"):
+        _add_issue(jira_api.server_url, key)
+        responses.add(responses.POST, f"{jira_api.server_url}/rest/api/3/issue/{key}/transitions", status=204)
+    transitions_get = responses.add(
+        responses.GET,
+        f"{jira_api.server_url}/rest/api/3/issue/SCRUM-7/transitions",
+        json=mock_transitions
+    )
+
+    assert jira_api.update_issue_status('SCRUM-7', 'Done')[0]
+    assert jira_api.update_issue_status('SCRUM-8', 'In Progress')[0]
+
+    assert transitions_get.call_count == 1
+    assert responses.calls[-1].request.body == b'{"transition": {"id": "2"}}'
+
+@responses.activate
+def test_rejected_cached_transition_is_refreshed():
+    jira_api = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    _add_issue(jira_api.server_url, "SCRUM-7")
+    jira_api.transition_cache.set(("SCRUM", "Task", "To Do"), {"Done": "3"})
+    responses.add(
+        responses.GET,
+        f"{jira_api.server_url}/rest/api/3/issue/SCRUM-7/transitions",
+        json={"transitions": [{"id": "41", "name": "Done"}]}
+    )
+    transition_url = f"{jira_api.server_url}/rest/api/3/issue/SCRUM-7/transitions"
+    responses.add(responses.POST, transition_url, status=400)
+    responses.add(responses.POST, transition_url, status=204)
+
+    success, message = jira_api.update_issue_status('SCRUM-7', 'Done')
+
+    assert success, message
+    assert responses.calls[-1].request.body == b'{"transition": {"id": "41"}}'
+    assert jira_api.transition_cache.get(("SCRUM", "Task", "To Do")) == {"Done": "41"}
+
+@responses.activate
+def test_refreshed_transitions_are_keyed_by_the_current_issue_status():
+    jira_api = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    # The cached copy still says To Do, but the issue has since moved to In Progress
+    jira_api.issue_cache.set("SCRUM-7", {
+        "key": "SCRUM-7",
+        "fields": {"status": {"name": "To Do"}, "issuetype": {"name": "Task"}, "project": {"key": "SCRUM"}}
+    })
+    _add_issue(jira_api.server_url, "SCRUM-7", status="In Progress")
+    jira_api.transition_cache.set(("SCRUM", "Task", "To Do"), {"Done": "3"})
+    transition_url = f"{jira_api.server_url}/rest/api/3/issue/SCRUM-7/transitions"
+    responses.add(responses.GET, transition_url, json={"transitions": [{"id": "41", "name": "Done"}]})
+    responses.add(responses.POST, transition_url, status=400)
+    responses.add(responses.POST, transition_url, status=204)
+
+    success, message = jira_api.update_issue_status('SCRUM-7', 'Done')
+
+    assert success, message
+    assert jira_api.transition_cache.get(("SCRUM", "Task", "In Progress")) == {"Done": "41"}
+    assert jira_api.transition_cache.get(("SCRUM", "Task", "To Do")) == {"Done": "3"}
+
+@responses.activate
+def test_missing_issue_is_dropped_from_the_key_index():
+    jira_api = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    jira_api.key_index.add("SCRUM-7")
+    responses.add(responses.GET, f"{jira_api.server_url}/rest/api/3/issue/SCRUM-7", status=404)
+
+    assert jira_api.get_issue_details("SCRUM-7") is None
+    assert "SCRUM-7" not in jira_api.key_index
+
+@responses.activate
+def test_issue_type_registry_is_loaded_once_per_project():
+    jira_api = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    project_get = responses.add(
+        responses.GET,
+        f"{jira_api.server_url}/rest/api/3/project/SCRUM",
+        json={"key": "SCRUM", "issueTypes": [{"id": "10001", "name": "Task"}, {"id": "10002", "name": "Bug"}]}
+    )
+    responses.add(responses.POST, f"{jira_api.server_url}/rest/api/3/issue", json={"key": "SCRUM-50"}, status=201)
+
+    assert jira_api.create_issue("SCRUM", "First", "Description", "task") == (True, "SCRUM-50")
+    assert jira_api.create_issue("SCRUM", "Second", "Description", "Bug") == (True, "SCRUM-50")
+
+    assert project_get.call_count == 1
+    assert b'"issuetype": {"id": "10002"}' in responses.calls[-1].request.body
+
+@responses.activate
+def test_rejected_issue_type_id_reloads_registry():
+    jira_api = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    jira_api.issue_type_cache.set("SCRUM", {"task": "999"})
+    responses.add(
+        responses.GET,
+        f"{jira_api.server_url}/rest/api/3/project/SCRUM",
+        json={"key": "SCRUM", "issueTypes": [{"id": "10001", "name": "Task"}]}
+    )
+    create_url = f"{jira_api.server_url}/rest/api/3/issue"
+    responses.add(responses.POST, create_url, json={"errors": {"issuetype": "valid issue type is required"}}, status=400)
+    responses.add(responses.POST, create_url, json={"key": "SCRUM-51"}, status=201)
+
+    assert jira_api.create_issue("SCRUM", "Summary", "Description", "Task") == (True, "SCRUM-51")
+    assert b'"issuetype": {"id": "10001"}' in responses.calls[-1].request.body
+
+@responses.activate
+def test_board_and_sprint_are_resolved_once():
+    jira = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    responses.add(responses.GET, 'https://test-jira.com/rest/agile/1.0/board', json={"values": [{"id": 3}]})
+    responses.add(
+        responses.GET,
+        'https://test-jira.com/rest/agile/1.0/board/3/sprint',
+        json={"values": [{"id": 12, "endDate": "2999-01-01T00:00:00.000Z"}]}
+    )
+
+    assert jira.get_current_sprint_id("SCRUM") == 12
+    assert jira.get_current_sprint_id("SCRUM") == 12
+
+    assert len(responses.calls) == 2
+    assert "projectKeyOrId=SCRUM" in responses.calls[0].request.url
+    assert jira.cache_stats()["sprints"]["hits"] == 1
+
+def test_sprint_cache_expires_at_sprint_end():
+    end = {"endDate": "2024-03-19T10:00:00.000Z"}
+    ends_at = 1710842400
+
+    assert JiraAPI._sprint_ttl(end, now=ends_at - 90) == 90
+    assert JiraAPI._sprint_ttl(end, now=ends_at + 90) == SPRINT_CACHE_FALLBACK_TTL
+    assert JiraAPI._sprint_ttl({}, now=ends_at) == SPRINT_CACHE_FALLBACK_TTL
+
+@responses.activate
+def test_account_ids_come_from_the_warmed_user_directory():
+    jira = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    responses.add(
+        responses.GET,
+        'https://test-jira.com/rest/api/3/user/assignable/search',
+        json=[{"accountId": "acc-1", "emailAddress": "meghanathink41@example.com", "displayName": "Meghana"}]
+    )
+
+    assert jira.load_assignable_users("SCRUM") == 1
+    assert jira.get_account_id("meghanathink41") == "acc-1"
+    assert jira.get_account_id("Meghana") == "acc-1"
+    assert jira.get_account_id("MeghanaThink41@example.com") == "acc-1"
+    assert len(responses.calls) == 1
+
+@responses.activate
+def test_unknown_users_are_negatively_cached():
+    jira = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    search = responses.add(responses.GET, 'https://test-jira.com/rest/api/3/user/search', json=[])
+
+    assert jira.get_account_id("nobody") is None
+    assert jira.get_account_id("nobody") is None
+    assert search.call_count == 1
+
+@responses.activate
+def test_project_summary_batches_story_searches(monkeypatch):
+    monkeypatch.setattr("talking_bot.SUMMARY_EPIC_BATCH_SIZE", 2)
+    jira = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    epics = [{"key": f"SCRUM-{n}", "fields": {"summary": f"Epic {n}", "status": {"name": "To Do"}}} for n in (1, 2, 3)]
+    stories = [
+        {"key": "SCRUM-10", "fields": {"summary": "A", "status": {"name": "Done"}, "parent": {"key": "SCRUM-1"}}},
+        {"key": "SCRUM-11", "fields": {"summary": "B", "status": {"name": "To Do"}, "customfield_10014": "SCRUM-3"}}
+    ]
+    searches = []
+
+    def search(request):
+        params = json.loads(request.body)
+        searches.append(params["jql"])
+        is_epic_search = "issuetype = Epic" in params["jql"]
+        if is_epic_search:
+            # Two pages of epics
+            start = int(params["startAt"])
+            page = epics[start:start + 2]
+        else:
+            page = [stories[0]] if "SCRUM-1" in params["jql"] else [stories[1]]
+        return 200, {}, json.dumps({"total": 3 if is_epic_search else 1, "issues": page})
+
+    responses.add(responses.GET, 'https://test-jira.com/rest/api/2/project/SCRUM', json={"name": "Scrum"})
+    responses.add_callback(responses.POST, 'https://test-jira.com/rest/api/3/search', callback=search)
+
+    summary = jira.get_project_summary("SCRUM")
+
+    assert len(searches) == 4  # two epic pages + two story batches
+    assert '(parent in (SCRUM-1, SCRUM-2) OR "Epic Link" in (SCRUM-1, SCRUM-2))' in searches[2]
+    by_key = {epic["key"]: epic for epic in summary["epics"]}
+    assert [s["key"] for s in by_key["SCRUM-1"]["stories"]] == ["SCRUM-10"]
+    assert by_key["SCRUM-1"]["progress"] == {"total": 1, "completed": 1}
+    assert by_key["SCRUM-2"]["stories"] == []
+    assert [s["key"] for s in by_key["SCRUM-3"]["stories"]] == ["SCRUM-11"]
+
+@responses.activate
+def test_create_blocker_reports_each_followup_step():
+    jira = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    jira.board_cache.set("SCRUM", 3)
+    jira.sprint_cache.set(3, 12)
+    jira.issue_type_cache.set("SCRUM", {"task": "10001"})
+    _add_issue(jira.server_url, "SCRUM-7")
+    responses.add(responses.POST, f"{jira.server_url}/rest/api/3/issue", json={"key": "SCRUM-90"}, status=201)
+    responses.add(responses.POST, f"{jira.server_url}/rest/api/3/issueLink", status=201)
+    responses.add(responses.POST, f"{jira.server_url}/rest/api/3/issue/SCRUM-7/comment", json={}, status=500)
+    responses.add(responses.PUT, f"{jira.server_url}/rest/api/3/issue/SCRUM-7", status=204)
+
+    report = jira.create_blocker_report("SCRUM-7", "waiting on the API")
+
+    assert report["blocker_key"] == "SCRUM-90"
+    assert {name: step["ok"] for name, step in report["steps"].items()} == {
+        "link": True, "comment": False, "label": True
+    }
+    assert jira._blocker_result("SCRUM-7", report) == (
+        True, "Created blocker SCRUM-90 for SCRUM-7, but could not complete: comment"
+    )
+    assert "SCRUM-7" not in jira.issue_cache
+
+@responses.activate
+def test_create_blockers_uses_bulk_create_and_one_edit_per_issue():
+    jira = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    jira.board_cache.set("SCRUM", 3)
+    jira.sprint_cache.set(3, 12)
+    jira.issue_type_cache.set("SCRUM", {"task": "10001"})
+    responses.add(
+        responses.POST,
+        f"{jira.server_url}/rest/api/3/search",
+        json={"total": 2, "issues": [{"key": "SCRUM-7", "fields": {}}, {"key": "SCRUM-8", "fields": {}}]}
+    )
+    responses.add(
+        responses.POST,
+        f"{jira.server_url}/rest/api/3/issue/bulk",
+        json={
+            "issues": [{"key": "SCRUM-90"}, {"key": "SCRUM-91"}],
+            "errors": [{"failedElementNumber": 2, "elementErrors": {"errors": {"summary": "too long"}}}]
+        },
+        status=201
+    )
+    responses.add(responses.PUT, f"{jira.server_url}/rest/api/3/issue/SCRUM-7", status=204)
+
+    results = jira.create_blockers([
+        ("SCRUM-7", "waiting on the API"),
+        ("SCRUM-7", "no test data"),
+        ("SCRUM-8", "design review")
+    ])
+
+    assert results == [
+        (True, "Created blocker SCRUM-90 and linked it to SCRUM-7"),
+        (True, "Created blocker SCRUM-91 and linked it to SCRUM-7"),
+        (False, "Failed to create blocker issue")
+    ]
+    assert len(responses.calls) == 3
+    entries = json.loads(responses.calls[1].request.body)["issueUpdates"]
+    assert entries[0]["update"]["issuelinks"][0]["add"]["inwardIssue"] == {"key": "SCRUM-7"}
+    edit = json.loads(responses.calls[2].request.body)["update"]
+    assert edit["labels"] == [{"add": "blocked"}]
+    assert len(edit["comment"]) == 2
+
+@responses.activate
+def test_issue_exists_checks_the_key_index_first():
+    jira = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key')
+    responses.add(
+        responses.POST,
+        'https://test-jira.com/rest/api/3/search',
+        json={"total": 2, "issues": [{"key": "SCRUM-1"}, {"key": "SCRUM-7"}]}
+    )
+    _add_issue(jira.server_url, "SCRUM-9")
+
+    assert jira.load_issue_keys("SCRUM") == 2
+    assert jira.issue_exists("SCRUM-7")
+    assert jira.issue_exists("SCRUM-9")
+    assert "SCRUM-9" in jira.key_index
+    assert json.loads(responses.calls[0].request.body)["fields"] == ["key"]
+    assert len(responses.calls) == 2
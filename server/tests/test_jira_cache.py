@@ -0,0 +1,65 @@
+import pytest
+from jira_cache import TTLCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+    cache.set("SCRUM-1", {"key": "SCRUM-1"})
+
+    clock.now = 9.9
+    assert cache.get("SCRUM-1") == {"key": "SCRUM-1"}
+
+    clock.now = 10
+    assert cache.get("SCRUM-1") is None
+    assert "SCRUM-1" not in cache
+    assert cache.stats()["expirations"] == 1
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+def test_invalidate_and_stats(clock):
+    cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    cache.invalidate("a")
+    assert cache.get("a", "missing") == "missing"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["size"] == 0
+
+def test_set_if_generation_drops_values_fetched_before_an_invalidation(clock):
+    cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+    generation = cache.generation("SCRUM-7")
+    # An update invalidates the issue while the GET for it is still in flight
+    cache.invalidate("SCRUM-7")
+
+    assert cache.set_if_generation("SCRUM-7", {"status": "To Do"}, generation) is False
+    assert "SCRUM-7" not in cache
+    assert cache.set_if_generation("SCRUM-7", {"status": "Done"}, cache.generation("SCRUM-7")) is True
+    assert cache.get("SCRUM-7") == {"status": "Done"}
+
+    generation = cache.generation("SCRUM-7")
+    cache.clear()
+    assert cache.set_if_generation("SCRUM-7", {"status": "Done"}, generation) is False
@@ -0,0 +1,36 @@
+from jira_keys import spoken_tokens, key_number_candidates, key_mentions, IssueKeyIndex
+
+def test_spoken_numbers_are_folded():
+    assert spoken_tokens("Scrum twenty three, then ticket four") == ["scrum", "23", "then", "ticket", "4"]
+    assert spoken_tokens("thirty ten") == ["30", "10"]
+    assert spoken_tokens("someone finished scrum7") == ["someone", "finished", "scrum", "7"]
+
+def test_candidates_follow_cue_order():
+    assert key_number_candidates("I closed issue 9 and scrum-7") == ["7", "9"]
+    assert key_number_candidates("scrum issue twelve") == ["12"]
+    assert key_number_candidates("working on scrum thirty five") == ["35"]
+    assert key_number_candidates("ticket 3 replaces ticket 4") == ["3"]
+    assert key_number_candidates("No issue key here") == []
+
+def test_issue_key_index_membership():
+    index = IssueKeyIndex()
+    assert index.load("scrum", ["SCRUM-1", "SCRUM-7", "SCRUM-1200"]) == 3
+
+    assert "SCRUM-7" in index
+    assert "SCRUM-8" not in index
+    assert "SCRUM-5000" not in index
+    assert "OTHER-7" not in index
+    assert "not a key" not in index
+    assert index.is_loaded("SCRUM")
+
+    index.add("SCRUM-8")
+    index.discard("SCRUM-7")
+    assert "SCRUM-8" in index and "SCRUM-7" not in index
+    assert len(index) == 3
+
+def test_key_mentions_pair_each_key_with_its_clause():
+    assert key_mentions("I finished SCRUM-7 and started scrum nine, ticket 7 again") == [
+        ("7", "i finished scrum-7"),
+        ("9", "started scrum nine")
+    ]
+    assert key_mentions("nothing to report") == []
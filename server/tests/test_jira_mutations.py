@@ -0,0 +1,240 @@
+import asyncio
+import glob
+import json
+import os
+from unittest.mock import AsyncMock
+from jira_mutations import MutationQueue
+from talking_bot import ScrumBot, ScrumStatus
+
+def make_queue(jira, **options):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    return MutationQueue(jira, sleep=sleep, **options), delays
+
+def test_reply_does_not_wait_for_jira(monkeypatch):
+    monkeypatch.setenv("JIRA_PROJECT_KEY", "SCRUM")
+    release = None
+    order = []
+
+    async def update_issue_status(issue_key, status):
+        await release.wait()
+        order.append(("status", issue_key, status))
+        return True, f"Updated {issue_key} to {status}"
+
+    async def create_blockers(blockers):
+        order.append(("blockers", [tuple(blocker) for blocker in blockers]))
+        return [(True, "Created blocker SCRUM-50")]
+
+    jira = AsyncMock()
+    jira.update_issue_status.side_effect = update_issue_status
+    jira.create_blockers.side_effect = create_blockers
+    jira.issue_exists.return_value = True
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        queue, _ = make_queue(jira)
+        bot = ScrumBot(jira, queue)
+        bot.current_state = "blocker_details"
+        reply = await bot.process_response_async("scrum 7 is blocked by the API")
+        queued_before_jira = list(order)
+        final = await bot.process_response_async("no")
+        release.set()
+        await queue.drain()
+        return reply, final, queued_before_jira, [queue.outcome(mutation_id) for mutation_id in bot.mutation_ids]
+
+    reply, final, queued_before_jira, outcomes = asyncio.run(run())
+
+    assert reply == "Do you have any other blockers? (yes/no)"
+    assert final == "Would you like to create any new issues/tickets? (yes/no)"
+    assert queued_before_jira == []
+    # The blocker for SCRUM-7 is created only after SCRUM-7 moved to Blocked
+    assert order == [("status", "SCRUM-7", ScrumStatus.BLOCKED),
+                     ("blockers", [("SCRUM-7", "scrum 7 is blocked by the api")])]
+    assert [(outcome["method"], outcome["status"]) for outcome in outcomes] == [
+        ("update_issue_status", "succeeded"), ("create_blockers", "succeeded")
+    ]
+
+def test_standup_reply_says_queued_for_updates_not_yet_applied(monkeypatch):
+    monkeypatch.setenv("JIRA_PROJECT_KEY", "SCRUM")
+    jira = AsyncMock()
+    jira.existing_issue_keys.side_effect = lambda keys: set(keys)
+    jira.update_issue_statuses.side_effect = lambda updates: [(True, "Updated")] * len(updates)
+
+    async def run():
+        queue, _ = make_queue(jira)
+        bot = ScrumBot(jira, queue)
+        reply = await bot.process_standup_async("Yesterday I finished scrum seven, today scrum nine, no blockers")
+        await queue.drain()
+        return reply
+
+    reply = asyncio.run(run())
+
+    assert reply.startswith("Got it. Queued Jira updates: SCRUM-7 to Done, SCRUM-9 to In Progress.")
+    assert "Updated" not in reply
+
+def test_other_issues_are_not_held_up():
+    started = []
+    gate = None
+
+    async def update_issue_status(issue_key, status):
+        started.append(issue_key)
+        if issue_key == "SCRUM-7":
+            await gate.wait()
+        return True, "Updated"
+
+    jira = AsyncMock()
+    jira.update_issue_status.side_effect = update_issue_status
+
+    async def run():
+        nonlocal gate
+        gate = asyncio.Event()
+        queue, _ = make_queue(jira)
+        queue.submit("update_issue_status", ("SCRUM-7", ScrumStatus.IN_PROGRESS))
+        queue.submit("update_issue_status", ("SCRUM-7", ScrumStatus.DONE))
+        queue.submit("update_issue_status", ("SCRUM-9", ScrumStatus.DONE))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        snapshot = list(started)
+        gate.set()
+        await queue.drain()
+        return snapshot
+
+    assert asyncio.run(run()) == ["SCRUM-7", "SCRUM-9"]
+    assert [call.args for call in jira.update_issue_status.await_args_list] == [
+        ("SCRUM-7", ScrumStatus.IN_PROGRESS), ("SCRUM-9", ScrumStatus.DONE), ("SCRUM-7", ScrumStatus.DONE)
+    ]
+
+def test_failures_are_retried_with_backoff():
+    jira = AsyncMock()
+    jira.update_issue_statuses.side_effect = [
+        ConnectionError("reset by peer"),
+        [(False, "Could not get issue details")],
+        [(True, "Updated SCRUM-7 to Done")]
+    ]
+    jira.create_blockers.return_value = [(False, "Jira rejected the bulk create")]
+
+    async def run():
+        queue, delays = make_queue(jira, base_delay=1, max_delay=30)
+        status_id = queue.submit("update_issue_statuses", ([("SCRUM-7", ScrumStatus.DONE)],))
+        blocker_id = queue.submit("create_blockers", ([("SCRUM-9", "waiting on design")],))
+        await queue.drain()
+        return queue.outcome(status_id), queue.outcome(blocker_id), delays
+
+    status, blocker, delays = asyncio.run(run())
+
+    assert (status["status"], status["attempts"]) == ("succeeded", 3)
+    assert 0.5 <= delays[0] <= 1 and 1 <= delays[1] <= 2
+    # A reported bulk-create failure may be partial, so it is not retried
+    assert (blocker["status"], blocker["attempts"]) == ("failed", 1)
+    assert jira.create_blockers.await_count == 1
+
+def test_journal_replays_mutations_of_a_dead_process(tmp_path):
+    orphan = tmp_path / "mutations-1-dead.jsonl"
+    orphan.write_text("\n".join([
+        json.dumps({"op": "submit", "id": "a1", "method": "update_issue_status", "args": ["SCRUM-7", "Done"]}),
+        json.dumps({"op": "submit", "id": "b2", "method": "update_issue_status", "args": ["SCRUM-8", "Done"]}),
+        json.dumps({"op": "done", "id": "b2", "status": "succeeded"}),
+        '{"op": "submit", "id": "c3", "meth'
+    ]) + "\n")
+    jira = AsyncMock()
+    jira.update_issue_status.return_value = (True, "Updated")
+
+    async def run():
+        queue, _ = make_queue(jira, journal_dir=str(tmp_path))
+        recovered = await queue.start()
+        await queue.drain()
+        journal = open(queue.journal_path).read().splitlines()
+        await queue.close()
+        return recovered, queue.outcome("a1"), journal
+
+    recovered, outcome, journal = asyncio.run(run())
+
+    assert recovered == 1
+    assert outcome["status"] == "succeeded"
+    jira.update_issue_status.assert_awaited_once_with("SCRUM-7", "Done")
+    # Emptied once nothing was pending any more
+    assert journal == []
+    assert os.listdir(tmp_path) == []
+
+def test_blocker_is_dropped_when_its_blocked_transition_fails():
+    jira = AsyncMock()
+    jira.update_issue_status.return_value = (False, "Failed to update status: 400")
+    jira.create_blockers.side_effect = lambda blockers: [(True, "Created blocker")] * len(blockers)
+
+    async def run():
+        queue, _ = make_queue(jira, max_attempts=1)
+        queue.submit("update_issue_status", ("SCRUM-7", ScrumStatus.BLOCKED))
+        queue.submit("update_issue_status", ("SCRUM-9", ScrumStatus.BLOCKED))
+        jira.update_issue_status.side_effect = lambda key, status: (
+            (True, "Updated") if key == "SCRUM-9" else (False, "Failed to update status: 400")
+        )
+        both = queue.submit("create_blockers", ([("SCRUM-7", "waiting on design"), ("SCRUM-9", "api down")],))
+        only_failed = queue.submit("create_blockers", ([("SCRUM-7", "still waiting")],))
+        await queue.drain()
+        return queue.outcome(both), queue.outcome(only_failed)
+
+    both, only_failed = asyncio.run(run())
+
+    jira.create_blockers.assert_awaited_once_with([("SCRUM-9", "api down")])
+    assert (both["status"], both["skipped_issue_keys"]) == ("succeeded", ["SCRUM-7"])
+    assert only_failed["status"] == "skipped"
+
+def test_journal_is_compacted_while_mutations_are_pending(tmp_path):
+    gate = None
+
+    async def update_issue_status(issue_key, status):
+        if issue_key == "SCRUM-1":
+            await gate.wait()
+        return True, "Updated"
+
+    jira = AsyncMock()
+    jira.update_issue_status.side_effect = update_issue_status
+
+    async def run():
+        nonlocal gate
+        gate = asyncio.Event()
+        queue, _ = make_queue(jira, journal_dir=str(tmp_path), compact_after=3)
+        await queue.start()
+        queue.submit("update_issue_status", ("SCRUM-1", ScrumStatus.DONE), mutation_id="slow")
+        for number in range(2, 5):
+            queue.submit("update_issue_status", (f"SCRUM-{number}", ScrumStatus.DONE))
+        while queue.pending() > 1:
+            await asyncio.sleep(0)
+        compacted = open(queue.journal_path).read().splitlines()
+        gate.set()
+        await queue.drain()
+        idle = open(queue.journal_path).read().splitlines()
+        await queue.close()
+        return compacted, idle
+
+    compacted, idle = asyncio.run(run())
+
+    assert [(json.loads(line)["op"], json.loads(line)["id"]) for line in compacted] == [("submit", "slow")]
+    assert idle == []
+    assert os.listdir(tmp_path) == []
+
+def test_journal_is_locked_before_other_workers_can_see_it(tmp_path, monkeypatch):
+    seen = []
+
+    def flock(journal, operation):
+        # Another worker scanning for orphans while this one takes its lock
+        seen.extend(glob.glob(os.path.join(str(tmp_path), "mutations-*.jsonl")))
+
+    monkeypatch.setattr("jira_mutations.fcntl.flock", flock)
+
+    async def run():
+        queue, _ = make_queue(AsyncMock(), journal_dir=str(tmp_path))
+        await queue.start()
+        path = queue.journal_path
+        listing = os.listdir(tmp_path)
+        await queue.close()
+        return path, listing
+
+    path, listing = asyncio.run(run())
+
+    assert seen == []
+    assert listing == [os.path.basename(path)]
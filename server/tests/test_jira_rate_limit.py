@@ -0,0 +1,147 @@
+import asyncio
+import pytest
+import responses
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from jira_rate_limit import RateLimiter, RateLimited, limiter_for, retry_after
+from jira_transport import JiraTransport, AsyncJiraTransport
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_retry_after_accepts_seconds_dates_and_reset_timestamps():
+    now = 1_700_000_000.0  # 2023-11-14T22:13:20Z
+
+    assert retry_after({"retry-after": "7"}, now) == 7
+    assert retry_after({"retry-after": "Tue, 14 Nov 2023 22:13:30 GMT"}, now) == 10
+    assert retry_after({"x-ratelimit-reset": "2023-11-14T22:13:25Z"}, now) == 5
+    assert retry_after({}, now) is None
+
+def test_token_bucket_paces_requests():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, burst=2, max_concurrency=10, clock=clock)
+
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == 0.5
+    clock.now = 0.5
+    assert limiter.try_acquire() == 0
+
+def test_blocking_acquire_never_sleeps_past_its_cap_or_on_an_event_loop(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("jira_rate_limit.time.sleep", sleeps.append)
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1, burst=1, clock=clock)
+    limiter.try_acquire()
+    limiter.release(429, {"Retry-After": "30"})
+
+    with pytest.raises(RateLimited):
+        limiter.acquire(max_wait=10)
+
+    async def on_loop():
+        clock.now = 29.5
+        with pytest.raises(RateLimited):
+            limiter.acquire(max_wait=10)
+
+    asyncio.run(on_loop())
+    assert sleeps == []
+
+def test_larger_pool_raises_the_shared_concurrency_limit():
+    url = "https://pool-size-test.example.com"
+    small = limiter_for(url, max_concurrency=2)
+    large = limiter_for(url, max_concurrency=8)
+
+    assert large is small
+    assert small.stats()["concurrency_limit"] == 8
+    assert limiter_for(url, max_concurrency=4).max_concurrency == 8
+
+def test_throttling_halves_limits_and_success_recovers_them():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=10, burst=10, max_concurrency=8, clock=clock)
+
+    limiter.try_acquire()
+    assert limiter.release(429, {"Retry-After": "3"}) == 3
+    stats = limiter.stats()
+    assert (stats["rate"], stats["concurrency_limit"], stats["blocked_for"]) == (5, 4, 3)
+    assert limiter.try_acquire() == 3
+
+    limiter.try_acquire()
+    limiter.release(502, {})
+    assert limiter.stats()["concurrency_limit"] == 2
+
+    for second in range(20):
+        clock.now = 10 + second
+        assert limiter.try_acquire() == 0
+        limiter.release(200, {})
+    stats = limiter.stats()
+    assert stats["rate"] == 10
+    assert stats["concurrency_limit"] >= 6
+    assert (stats["throttled"], stats["server_errors"]) == (1, 1)
+
+def test_atlassian_fill_rate_caps_the_rate():
+    limiter = RateLimiter(rate=20, burst=20)
+
+    limiter.try_acquire()
+    limiter.release(200, {"X-RateLimit-FillRate": "10", "X-RateLimit-Interval-Seconds": "2",
+                          "X-RateLimit-Remaining": "42"})
+
+    stats = limiter.stats()
+    assert (stats["rate"], stats["rate_ceiling"], stats["remaining"]) == (5, 5, 42)
+
+@responses.activate
+def test_transport_retries_throttled_requests():
+    limiter = RateLimiter()
+    transport = JiraTransport('https://test-jira.com', ('a', 'b'), {}, limiter=limiter)
+    responses.add(responses.GET, 'https://test-jira.com/rest/api/3/issue/SCRUM-7',
+                  status=429, headers={"Retry-After": "0"})
+    responses.add(responses.GET, 'https://test-jira.com/rest/api/3/issue/SCRUM-7', json={"key": "SCRUM-7"})
+
+    response = transport.get('/rest/api/3/issue/SCRUM-7')
+
+    assert response.status_code == 200
+    assert len(responses.calls) == 2
+    stats = limiter.stats()
+    assert (stats["throttled"], stats["retries"], stats["in_flight"]) == (1, 1, 0)
+
+def test_async_throttle_wait_does_not_block_the_loop():
+    attempts = []
+
+    async def issue(request):
+        attempts.append(request.path)
+        if len(attempts) == 1:
+            return web.json_response({}, status=429, headers={"Retry-After": "0.2"})
+        return web.json_response({"key": "SCRUM-7"})
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/rest/api/3/issue/{key}", issue)
+        server = TestServer(app)
+        await server.start_server()
+        limiter = RateLimiter()
+        transport = AsyncJiraTransport(str(server.make_url("")), ("a", "b"), {}, limiter=limiter)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.ensure_future(ticker())
+        try:
+            response = await transport.get("/rest/api/3/issue/SCRUM-7")
+            return response.status_code, ticks, limiter.stats()
+        finally:
+            ticking.cancel()
+            await transport.close()
+            await server.close()
+
+    status, ticks, stats = asyncio.run(run())
+    assert status == 200
+    assert len(attempts) == 2
+    assert ticks >= 10
+    assert stats["retries"] == 1
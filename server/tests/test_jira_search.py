@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+import pytest
+from jira_search import iter_search, aiter_search, next_page_body, JiraSearchError
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self.data = data
+        self.status_code = status_code
+        self.text = str(data)
+
+    def json(self):
+        return self.data
+
+class PagedTransport:
+    """Serves total issues in startAt/maxResults pages and records each request body"""
+
+    def __init__(self, total, fail_at=None):
+        self.total = total
+        self.fail_at = fail_at
+        self.bodies = []
+
+    def page(self, body):
+        self.bodies.append(body)
+        start = body["startAt"]
+        if start == self.fail_at:
+            return FakeResponse({"errorMessages": ["boom"]}, status_code=400)
+        issues = [{"key": f"SCRUM-{n}"} for n in range(start, min(start + body["maxResults"], self.total))]
+        return FakeResponse({"startAt": start, "total": self.total, "issues": issues})
+
+    def post(self, path, json=None):
+        return self.page(json)
+
+class AsyncPagedTransport(PagedTransport):
+    async def post(self, path, json=None):
+        return self.page(json)
+
+@pytest.mark.parametrize("read_ahead", [False, True])
+def test_iter_search_follows_every_page(read_ahead):
+    transport = PagedTransport(total=25)
+
+    keys = [issue["key"] for issue in iter_search(transport, "project = SCRUM", ["summary"], 10, read_ahead)]
+
+    assert keys == [f"SCRUM-{n}" for n in range(25)]
+    assert [body["startAt"] for body in transport.bodies] == [0, 10, 20]
+    assert all(body["fields"] == ["summary"] for body in transport.bodies)
+
+def test_iter_search_is_lazy():
+    transport = PagedTransport(total=25)
+
+    first = next(iter_search(transport, "project = SCRUM", page_size=10))
+
+    assert first["key"] == "SCRUM-0"
+    assert len(transport.bodies) == 1
+
+def test_iter_search_does_not_wait_for_an_unread_prefetch():
+    release = threading.Event()
+
+    class SlowTransport(PagedTransport):
+        def post(self, path, json=None):
+            if json["startAt"]:
+                release.wait(5)
+            return self.page(json)
+
+    transport = SlowTransport(total=25)
+    started = time.monotonic()
+    for issue in iter_search(transport, "project = SCRUM", page_size=10, read_ahead=True):
+        break
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert issue["key"] == "SCRUM-0"
+    assert elapsed < 1
+
+def test_iter_search_raises_on_rejected_page():
+    transport = PagedTransport(total=25, fail_at=10)
+
+    with pytest.raises(JiraSearchError):
+        list(iter_search(transport, "project = SCRUM", page_size=10))
+
+def test_next_page_body_prefers_page_token():
+    body = {"jql": "project = SCRUM", "startAt": 0, "maxResults": 10}
+
+    assert next_page_body(body, {"issues": [{}], "nextPageToken": "abc"}, 1) == {
+        "jql": "project = SCRUM", "maxResults": 10, "nextPageToken": "abc"
+    }
+    assert next_page_body(body, {"issues": [{}], "isLast": True}, 1) is None
+    assert next_page_body(body, {"issues": [], "total": 5}, 0) is None
+
+def test_aiter_search_with_read_ahead():
+    transport = AsyncPagedTransport(total=15)
+
+    async def collect():
+        return [issue["key"] async for issue in aiter_search(transport, "project = SCRUM", page_size=10, read_ahead=True)]
+
+    assert asyncio.run(collect()) == [f"SCRUM-{n}" for n in range(15)]
+    assert [body["startAt"] for body in transport.bodies] == [0, 10]
@@ -0,0 +1,84 @@
+import pytest
+import responses
+from jira_transport import JiraTransport
+from talking_bot import JiraAPI
+
+@pytest.fixture
+def transport():
+    return JiraTransport(
+        'https://test-jira.com/',
+        ('test@email.com', 'test-api-key'),
+        {"Accept": "application/json"},
+        pool_size=4,
+        connect_timeout=1.5,
+        read_timeout=7
+    )
+
+def test_transport_pool_configuration(transport):
+    adapter = transport.session.get_adapter('https://test-jira.com/rest/api/3/myself')
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_block is True
+    assert transport.session.auth == ('test@email.com', 'test-api-key')
+    assert transport.session.headers["Accept"] == "application/json"
+
+@responses.activate
+def test_transport_resolves_paths_and_applies_timeouts(transport):
+    responses.add(responses.GET, 'https://test-jira.com/rest/api/3/myself', json={}, status=200)
+
+    response = transport.get('/rest/api/3/myself')
+
+    assert response.status_code == 200
+    assert responses.calls[0].request.url == 'https://test-jira.com/rest/api/3/myself'
+    assert responses.calls[0].request.req_kwargs["timeout"] == (1.5, 7)
+
+@responses.activate
+def test_jira_api_reuses_one_session():
+    jira = JiraAPI('https://test-jira.com', 'test@email.com', 'test-api-key', pool_size=2)
+    responses.add(
+        responses.GET,
+        'https://test-jira.com/rest/api/3/issue/SCRUM-1',
+        json={"key": "SCRUM-1", "fields": {"status": {"name": "To Do"}}},
+        status=200
+    )
+    session = jira.transport.session
+
+    responses.add(responses.GET, 'https://test-jira.com/rest/api/3/myself', json={}, status=200)
+
+    assert jira.test_connection()
+    assert jira.get_issue_details('SCRUM-1')["key"] == "SCRUM-1"
+
+    assert jira.transport.session is session
+    assert len(responses.calls) == 2
+    assert all(call.request.headers["Authorization"].startswith("Basic") for call in responses.calls)
+
+def test_concurrent_identical_searches_share_one_request(transport):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    release = threading.Event()
+    sent = []
+
+    def search(request):
+        sent.append(request.body)
+        release.wait(5)
+        return (200, {}, '{"issues": []}')
+
+    with responses.RequestsMock() as mock:
+        mock.add_callback(responses.POST, 'https://test-jira.com/rest/api/3/search', callback=search)
+        mock.add_callback(responses.PUT, 'https://test-jira.com/rest/api/3/issue/SCRUM-1', callback=lambda r: (204, {}, ''))
+        body = {"jql": "assignee = abc", "maxResults": 100}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(transport.post, '/rest/api/3/search', json=dict(body)) for _ in range(4)]
+            for _ in range(500):
+                if transport.coalesced == 3:
+                    break
+                threading.Event().wait(0.01)
+            release.set()
+            statuses = [future.result().status_code for future in futures]
+        # Writes are never shared
+        transport.put('/rest/api/3/issue/SCRUM-1', json={})
+        transport.put('/rest/api/3/issue/SCRUM-1', json={})
+
+        assert statuses == [200] * 4
+        assert len(sent) == 1
+        assert len(mock.calls) == 3
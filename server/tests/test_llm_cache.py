@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+import talking_bot
+from llm_cache import LLMResponseCache, normalize_prompt, response_key
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_equivalent_phrasings_share_a_key():
+    assert normalize_prompt("No blockers!") == normalize_prompt("  no   BLOCKERS ")
+    assert normalize_prompt("Working on SCRUM-7.") == normalize_prompt("working on scrum seven")
+    assert response_key("m", "sys", "Same as yesterday.", 0.7) == response_key("m", "sys", "same as yesterday", 0.7)
+    assert response_key("m", "sys", "no blockers", 0.7) != response_key("other", "sys", "no blockers", 0.7)
+    assert response_key("m", "sys", "no blockers", 0.7) != response_key("m", "other", "no blockers", 0.7)
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    path = str(tmp_path / "llm.sqlite")
+    clock = FakeClock()
+    cache = LLMResponseCache(maxsize=4, ttl=60, path=path, clock=clock)
+    cache.set("k", "Noted, no blockers.")
+    cache.close()
+
+    reopened = LLMResponseCache(maxsize=4, ttl=60, path=path, clock=clock)
+    assert reopened.get("k") == "Noted, no blockers."
+    assert reopened.get("k") == "Noted, no blockers."
+    stats = reopened.stats()
+    assert (stats["disk_hits"], stats["hits"], stats["misses"]) == (1, 2, 0)
+
+    clock.now = 61
+    fresh = LLMResponseCache(maxsize=4, ttl=60, path=path, clock=clock)
+    assert fresh.get("k") is None
+    assert fresh.stats()["hit_rate"] == 0.0
+
+def test_disk_tier_is_size_bounded(tmp_path):
+    clock = FakeClock()
+    cache = LLMResponseCache(maxsize=1, ttl=60, path=str(tmp_path / "llm.sqlite"), disk_maxsize=2, clock=clock)
+    for index in range(3):
+        clock.now = index
+        cache.set(f"k{index}", f"reply {index}")
+    cache.memory.clear()
+
+    assert cache.get("k0") is None
+    assert cache.get("k2") == "reply 2"
+
+def test_disk_tier_is_trimmed_every_few_writes(tmp_path):
+    clock = FakeClock()
+    cache = LLMResponseCache(maxsize=1, ttl=60, path=str(tmp_path / "llm.sqlite"), disk_maxsize=2,
+                             trim_every=3, clock=clock)
+    for index in range(3):
+        clock.now = index
+        cache.set(f"k{index}", f"reply {index}")
+    cache.set("k3", "reply 3")
+    cache.memory.clear()
+
+    # The third write trimmed to two rows; the fourth has not triggered another trim
+    assert [cache.get(f"k{index}") for index in range(4)] == [None, "reply 1", "reply 2", "reply 3"]
+
+def test_async_disk_access_stays_off_the_event_loop(tmp_path):
+    cache = LLMResponseCache(maxsize=1, ttl=60, path=str(tmp_path / "llm.sqlite"))
+    threads = []
+    disk_get = cache._disk_get
+
+    def record(key):
+        threads.append(threading.get_ident())
+        return disk_get(key)
+
+    cache._disk_get = record
+
+    async def run():
+        await cache.set_async("k", "Noted.")
+        cache.memory.clear()
+        return await cache.get_async("k"), threading.get_ident()
+
+    reply, loop_thread = asyncio.run(run())
+    cache.close()
+
+    assert reply == "Noted."
+    assert threads and loop_thread not in threads
+
+def test_ask_groq_skips_the_llm_on_a_hit(monkeypatch):
+    create = AsyncMock(return_value=SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Got it, no blockers."))]
+    ))
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(talking_bot, "groq_client", client)
+    monkeypatch.setattr(talking_bot, "groq_cache", LLMResponseCache(maxsize=8, ttl=60))
+
+    first = asyncio.run(talking_bot.ask_groq("No blockers."))
+    second = asyncio.run(talking_bot.ask_groq("no blockers"))
+
+    assert first == second == "Got it, no blockers."
+    assert create.await_count == 1
+    assert talking_bot.groq_cache.stats()["hit_rate"] == 0.5
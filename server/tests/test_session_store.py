@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import AsyncMock
+import pytest
+from session_store import SessionStore
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class State:
+    def __init__(self):
+        self.size = 10
+
+def make_store(clock, **limits):
+    return SessionStore(State, size_of=lambda state: state.size, clock=clock, **limits)
+
+def use(store, session_id, size=None):
+    async def run():
+        async with store.session(session_id) as state:
+            if size is not None:
+                state.size = size
+            return state
+    return asyncio.run(run())
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_sessions_are_independent_and_reused(clock):
+    store = make_store(clock)
+
+    first = use(store, "a")
+    assert use(store, "a") is first
+    assert use(store, "b") is not first
+    assert store.stats()["created"] == 2
+
+def test_idle_sessions_expire(clock):
+    store = make_store(clock, idle_timeout=60)
+    use(store, "a")
+    clock.now = 30
+    use(store, "b")
+
+    clock.now = 61
+    assert store.get("a") is None
+    assert store.get("b") is not None
+    assert store.stats()["expirations"] == 1
+
+def test_least_recently_used_session_is_evicted(clock):
+    store = make_store(clock, max_sessions=2)
+    use(store, "a")
+    use(store, "b")
+    use(store, "a")
+    use(store, "c")
+
+    assert "a" in store and "c" in store
+    assert "b" not in store
+    assert store.stats()["evictions"] == 1
+
+def test_memory_cap_evicts_until_state_fits(clock):
+    store = make_store(clock, max_bytes=100)
+    use(store, "a")
+    use(store, "b")
+    use(store, "c", size=95)
+
+    assert list(store._sessions) == ["c"]
+    assert store.total_bytes == 95
+
+def test_concurrent_requests_to_one_session_are_serialized(clock):
+    store = make_store(clock, max_sessions=1)
+    order = []
+
+    async def request(name):
+        async with store.session("a"):
+            order.append(f"{name} start")
+            await asyncio.sleep(0)
+            order.append(f"{name} end")
+
+    async def run():
+        await asyncio.gather(request("first"), request("second"))
+
+    asyncio.run(run())
+    assert order == ["first start", "first end", "second start", "second end"]
+
+def test_app_keeps_one_conversation_per_session(monkeypatch):
+    import app as app_module
+    jira = AsyncMock()
+    jira.get_todo_tasks.return_value = []
+    jira.existing_issue_keys.side_effect = lambda keys: set(keys)
+    jira.update_issue_statuses.side_effect = lambda updates: [(True, "Updated")] * len(updates)
+    monkeypatch.setattr(app_module, "jira", jira)
+    monkeypatch.setattr(app_module, "sessions", SessionStore(lambda: app_module.ScrumBot(app_module.jira)))
+
+    async def run():
+        alice, bob = app_module.app.test_client(), app_module.app.test_client()
+        started = await alice.get("/api/start")
+        await bob.get("/api/start")
+        await alice.post("/api/chat", json={"message": "I finished the docs"})
+        alice_reply = await alice.post("/api/chat", json={"message": "the login page"})
+        bob_reply = await bob.post("/api/chat", json={"message": "the login page"})
+        return (await started.get_json())["session_id"], await alice_reply.get_json(), await bob_reply.get_json()
+
+    session_id, alice_reply, bob_reply = asyncio.run(run())
+
+    assert alice_reply["message"] == "Do you have any blockers? (yes/no)"
+    assert bob_reply["message"] == "What will you be working on today?"
+    assert alice_reply["session_id"] == session_id != bob_reply["session_id"]
+    assert len(app_module.sessions) == 2
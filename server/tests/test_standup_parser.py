@@ -0,0 +1,37 @@
+from standup_parser import parse_standup, parse_llm_reply, merge_reports, missing_fields, empty_report
+
+def test_parse_standup_splits_sections_by_cue():
+    report = parse_standup("Yesterday I finished scrum 7 and scrum 8. Today I will start scrum nine. No blockers.")
+
+    assert report == {
+        "yesterday": "yesterday i finished scrum 7, scrum 8",
+        "today": "today i will start scrum nine",
+        "blockers": [],
+        "no_blockers": True
+    }
+    assert missing_fields(report) == []
+
+def test_parse_standup_uses_the_asked_question_for_uncued_text():
+    assert parse_standup("worked on the login page")["yesterday"] == "worked on the login page"
+    assert parse_standup("the login page", "today")["today"] == "the login page"
+    assert parse_standup("nope", "blockers")["no_blockers"] is True
+    assert parse_standup("the deploy pipeline is down", "blockers")["blockers"] == ["the deploy pipeline is down"]
+
+def test_parse_llm_reply_tolerates_surrounding_text():
+    report = parse_llm_reply('Here you go: {"yesterday": "SCRUM-7 done", "today": null, '
+                             '"blockers": [{"description": "SCRUM-9 waiting on API"}], "no_blockers": true}')
+
+    assert report == {"yesterday": "SCRUM-7 done", "today": None,
+                      "blockers": ["SCRUM-9 waiting on API"], "no_blockers": False}
+    assert parse_llm_reply("I could not parse that") is None
+    assert parse_llm_reply('["not", "an", "object"]') is None
+
+def test_merge_reports_fills_missing_fields():
+    first = parse_standup("yesterday I fixed the build")
+    assert missing_fields(first) == ["today", "blockers"]
+
+    merged = merge_reports(first, parse_standup("scrum 9", "today"))
+    assert merged["yesterday"] == "yesterday i fixed the build"
+    assert merged["today"] == "scrum 9"
+    assert missing_fields(merged) == ["blockers"]
+    assert missing_fields(merge_reports(merged, {**empty_report(), "no_blockers": True})) == []
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Records outbound network audit events (DNS lookups, connects, sends) raised while
+# the app module is imported; local socketpairs created by asyncio are not counted
+NETWORK_PROBE = """
+import sys
+calls = []
+OUTBOUND = {"socket.connect", "socket.sendto", "socket.sendmsg", "socket.getaddrinfo",
+            "socket.gethostbyname", "socket.gethostbyaddr", "urllib.Request"}
+def audit(event, args):
+    if event in OUTBOUND:
+        calls.append((event, repr(args)[:80]))
+sys.addaudithook(audit)
+import app
+print("NETWORK_CALLS", calls)
+"""
+
+def test_startup_makes_no_network_calls():
+    env = {**os.environ, "GROQ_API_KEY": os.environ.get("GROQ_API_KEY") or "test-key"}
+    result = subprocess.run(
+        [sys.executable, "-c", NETWORK_PROBE],
+        cwd=SERVER_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "NETWORK_CALLS []" in result.stdout
+
+def test_offline_tokenizers():
+    from text_tokenizer import word_tokenize, sent_tokenize
+
+    assert word_tokenize("Don't stop, SCRUM-7 is done.") == ["Do", "n't", "stop", ",", "SCRUM-7", "is", "done", "."]
+    assert sent_tokenize("I finished SCRUM-7. Blocked on e.g. the API! Next?") == [
+        "I finished SCRUM-7.", "Blocked on e.g. the API!", "Next?"
+    ]
+
+# Heavy dependencies that only the microphone, LLM and playback paths need
+LAZY_MODULES = ("numpy", "sounddevice", "groq", "jira", "playsound", "nltk")
+# Generous ceiling on cumulative import time for app; it measures ~0.6s on a laptop
+IMPORT_TIME_BUDGET_US = 3_000_000
+
+IMPORT_PROBE = """
+import sys
+import app
+print("LOADED", sorted(name for name in %r if name in sys.modules))
+""" % (LAZY_MODULES,)
+
+def test_startup_defers_heavy_imports():
+    env = {**os.environ, "GROQ_API_KEY": os.environ.get("GROQ_API_KEY") or "test-key"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_PROBE],
+        cwd=SERVER_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "LOADED []" in result.stdout
+    # -X importtime lines: "import time: self [us] | cumulative | module"
+    app_line = [line for line in result.stderr.splitlines() if line.rstrip().endswith("| app")][-1]
+    cumulative_us = int(app_line.split("|")[1])
+    assert cumulative_us < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,28 @@
+import json
+from status_classifier import StatusClassifier, DEFAULT_STATUS_VOCABULARY, merge_vocabularies, load_project_vocabularies
+
+def test_classifier_uses_word_boundaries_and_priority():
+    classifier = StatusClassifier(DEFAULT_STATUS_VOCABULARY)
+
+    assert classifier.classify("completed the task") == ("Done", 1.0)
+    assert classifier.classify("finished working") == ("Done", 0.5)
+    assert classifier.classify("the migration is undone") == ("To Do", 0.0)
+    assert classifier.classify("still blocked by the API") == ("Blocked", 1.0)
+    assert classifier.classify("will do") == ("To Do", 0.0)
+
+def test_multi_word_phrases_tolerate_spacing():
+    classifier = StatusClassifier({"In Review": ["code review"], "In Progress": ["progress"]})
+
+    assert classifier.classify("it's in   code\nreview now") == ("In Review", 1.0)
+
+def test_project_vocabulary_extends_defaults(tmp_path):
+    path = tmp_path / "statuses.json"
+    path.write_text(json.dumps({"SCRUM": {"In Review": ["in review"], "Done": ["shipped"]}}))
+
+    vocabulary = merge_vocabularies(DEFAULT_STATUS_VOCABULARY, load_project_vocabularies(str(path))["SCRUM"])
+    classifier = StatusClassifier(vocabulary)
+
+    assert list(vocabulary)[-1] == "In Review"
+    assert classifier.classify("shipped it yesterday") == ("Done", 1.0)
+    assert classifier.classify("scrum 7 is in review") == ("In Review", 1.0)
+    assert load_project_vocabularies(str(tmp_path / "missing.json")) == {}
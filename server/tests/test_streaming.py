@@ -0,0 +1,97 @@
+import asyncio
+from types import SimpleNamespace
+import talking_bot
+from llm_cache import LLMResponseCache
+from text_tokenizer import SentenceSplitter
+
+def chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+class FakeStream:
+    def __init__(self, pieces):
+        self.pieces = pieces
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for piece in self.pieces:
+            await asyncio.sleep(0)
+            yield chunk(piece)
+
+def fake_groq(monkeypatch, pieces):
+    requests = []
+
+    async def create(**kwargs):
+        requests.append(kwargs)
+        return FakeStream(pieces)
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(talking_bot, "groq_client", client)
+    monkeypatch.setattr(talking_bot, "groq_cache", LLMResponseCache(maxsize=8, ttl=60))
+    return requests
+
+def collect(generator):
+    async def run():
+        return [event async for event in generator]
+    return asyncio.run(run())
+
+def test_sentence_splitter_holds_back_the_last_sentence():
+    splitter = SentenceSplitter()
+    emitted = [splitter.feed(piece) for piece in ["Sure", ". I updated", " SCRUM-7. Ask Dr", ". Smith", " today!", " Bye."]]
+
+    assert emitted == [[], ["Sure."], ["I updated SCRUM-7."], [], [], ["Ask Dr. Smith today!"]]
+    assert splitter.flush() == ["Bye."]
+
+def test_stream_reply_emits_tokens_then_sentences(monkeypatch):
+    requests = fake_groq(monkeypatch, ["Noted", ". SCRUM-7 is", " done", ". Anything else?"])
+
+    events = collect(talking_bot.stream_reply("I finished scrum seven"))
+
+    assert requests[0]["stream"] is True
+    assert [event["event"] for event in events] == [
+        "token", "token", "sentence", "token", "token", "sentence", "sentence", "done"
+    ]
+    assert [event["text"] for event in events if event["event"] == "sentence"] == [
+        "Noted.", "SCRUM-7 is done.", "Anything else?"
+    ]
+    assert events[-1]["reply"] == "Noted. SCRUM-7 is done. Anything else?"
+    # The completed reply is cached, so asking again streams it from memory
+    assert collect(talking_bot.ask_groq_stream("i finished scrum 7")) == [events[-1]["reply"]]
+    assert len(requests) == 1
+
+def test_stream_reply_speaks_sentences_in_order(monkeypatch):
+    fake_groq(monkeypatch, ["First one. ", "Second, slower one. ", "Third."])
+    started = []
+
+    async def fake_speak(text):
+        started.append(text)
+        # Earlier sentences take longer, so audio finishes out of order
+        await asyncio.sleep(0.02 if text.startswith("First") else 0)
+        return text.encode()
+
+    monkeypatch.setattr(talking_bot, "speak_text", fake_speak)
+
+    events = collect(talking_bot.stream_reply("hi", speak=True))
+
+    audio = [(event["index"], event["audio"]) for event in events if event["event"] == "audio"]
+    assert audio == [(0, b"First one."), (1, b"Second, slower one."), (2, b"Third.")]
+    # Speech for the first sentence started before the last token arrived
+    assert started[0] == "First one."
+    assert events.index({"event": "sentence", "index": 0, "text": "First one."}) < events.index(
+        {"event": "token", "text": "Third."})
+
+def test_ask_stream_endpoint_sends_server_sent_events(monkeypatch):
+    import app as app_module
+    fake_groq(monkeypatch, ["Hello there. ", "Bye."])
+
+    async def run():
+        client = app_module.app.test_client()
+        response = await client.post("/api/ask_stream", json={"message": "hi"})
+        return response.headers["Content-Type"], (await response.get_data()).decode()
+
+    content_type, body = asyncio.run(run())
+
+    assert content_type == "text/event-stream"
+    assert 'event: sentence\ndata: {"index": 0, "text": "Hello there."}\n\n' in body
+    assert body.endswith('event: done\ndata: {"reply": "Hello there. Bye."}\n\n')
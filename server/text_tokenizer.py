@@ -0,0 +1,60 @@
+import re
+from typing import List
+
+# Offline stand-ins for nltk.word_tokenize / nltk.sent_tokenize. They need no
+# downloaded model, so importing them never touches the network.
+
+# Contraction suffixes split off the way the Penn Treebank tokenizer does: "don't" -> do, n't
+_CONTRACTION = re.compile(r"(?i)\b(\w+)(n't|'s|'re|'ve|'ll|'d|'m)\b")
+_WORD = re.compile(r"n't|'(?:s|re|ve|ll|d|m)\b|\w+(?:[-.]\w+)*|\.\.\.|[^\w\s]", re.IGNORECASE)
+# Sentence ends: terminal punctuation (and closing quotes/brackets) followed by whitespace
+_SENTENCE_END = re.compile(r"(?<=[.!?])[\"')\]]*\s+")
+# Abbreviations whose period does not end a sentence
+_ABBREVIATIONS = {"e.g.", "i.e.", "etc.", "vs.", "mr.", "mrs.", "ms.", "dr.", "approx."}
+
+
+def word_tokenize(text: str) -> List[str]:
+    """Split text into words and punctuation, e.g. "Don't stop." -> ["Do", "n't", "stop", "."]"""
+    return _WORD.findall(_CONTRACTION.sub(r"\1 \2", text))
+
+
+def sent_tokenize(text: str) -> List[str]:
+    """Split text into sentences at ., ! and ? followed by whitespace, keeping common abbreviations intact"""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        candidate = text[start:match.start()].strip()
+        last_word = candidate.rsplit(None, 1)[-1].lower() if candidate else ""
+        if last_word in _ABBREVIATIONS:
+            continue
+        sentences.append(text[start:match.end()].strip())
+        start = match.end()
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+
+class SentenceSplitter:
+    """Incremental sent_tokenize for text that arrives in pieces, e.g. streamed LLM tokens.
+
+    feed() returns the sentences completed so far. The last sentence is held
+    back until more text follows it, since "Dr." or "3." may not be its end.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, text: str) -> List[str]:
+        self.buffer += text
+        sentences = sent_tokenize(self.buffer)
+        if len(sentences) < 2:
+            return []
+        # Keep the (possibly unfinished) last sentence and its leading whitespace
+        self.buffer = self.buffer[self.buffer.rindex(sentences[-1]):]
+        return sentences[:-1]
+
+    def flush(self) -> List[str]:
+        """Return whatever is left once the text is complete"""
+        sentences, self.buffer = sent_tokenize(self.buffer), ""
+        return sentences